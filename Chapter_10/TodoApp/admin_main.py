@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+"""
+Entry point for the Todo application's administrative commands.
+"""
+
+from todo_app.infrastructure.cli.admin_cli import admin
+from todo_app.infrastructure.logging.config import configure_logging
+
+
+def main() -> None:
+    """Run the admin command group."""
+    configure_logging(app_context="CLI")
+    admin()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Benchmark cold and warm task lookups for the file repository read paths.
+
+Each measurement runs in a fresh process, so "cold get" includes opening the
+store, and the peak RSS reflects only what the read path keeps in memory.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.cold_reads --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+from uuid import UUID
+
+from benchmarks.storage_formats import generate_task_records
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.locking import atomic_write
+from todo_app.infrastructure.persistence.mapped import MappedBinaryTaskRepository
+from todo_app.infrastructure.persistence.serializers import BinarySerializer, JsonSerializer
+
+READ_PATHS = {
+    "json": lambda data_dir: FileTaskRepository(data_dir, JsonSerializer()),
+    "binary-mmap": MappedBinaryTaskRepository,
+}
+
+
+def _peak_rss_kb() -> int:
+    """Peak RSS of this process; ru_maxrss survives exec, so prefer VmHWM where available."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(read_path: str, data_dir: Path, ids: List[str], queue) -> None:
+    task_ids = [UUID(task_id) for task_id in ids]
+    start = time.perf_counter()
+    repository = READ_PATHS[read_path](data_dir)
+    repository.get(task_ids[0])
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task_id in task_ids[1:]:
+        repository.get(task_id)
+    warm = (time.perf_counter() - start) / max(len(task_ids) - 1, 1)
+
+    queue.put((cold, warm, _peak_rss_kb()))
+
+
+def run(sizes: List[int], lookups: int) -> List[Dict]:
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        for size in sizes:
+            records = generate_task_records(size)
+            atomic_write(data_dir / "tasks.json", JsonSerializer().dumps(records))
+            atomic_write(data_dir / "tasks.bin", BinarySerializer().dumps(records))
+            ids = [str(r["id"]) for r in random.Random(2).sample(records, min(lookups, size))]
+            del records
+
+            for read_path in READ_PATHS:
+                queue = context.Queue()
+                process = context.Process(target=_measure, args=(read_path, data_dir, ids, queue))
+                process.start()
+                cold, warm, max_rss_kb = queue.get()
+                process.join()
+                results.append(
+                    {
+                        "tasks": size,
+                        "read_path": read_path,
+                        "cold_get_seconds": round(cold, 4),
+                        "warm_get_seconds": warm,
+                        "peak_rss_mb": round(max_rss_kb / 1024, 1),
+                    }
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=100, help="Random gets per run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.lookups)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'tasks':>9} {'read path':<12} {'cold get (s)':>13} {'warm get (ms)':>14} {'RSS (MB)':>9}"
+    )
+    for row in results:
+        print(
+            f"{row['tasks']:>9} {row['read_path']:<12} {row['cold_get_seconds']:>13.3f} "
+            f"{row['warm_get_seconds'] * 1000:>14.3f} {row['peak_rss_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
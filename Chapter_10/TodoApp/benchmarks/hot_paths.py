@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+"""
+Benchmark the TodoApp's hot paths at increasing data sizes.
+
+For each size and repository backend this seeds a store with a synthetic
+dataset (N projects x M tasks) and measures repository CRUD, listing and
+completing projects, the presenters and the Flask index page. Repositories
+are built by the same factory the app uses, configured through the usual
+TODO_* environment variables. Results are printed, or emitted as JSON for
+comparing releases.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.hot_paths --sizes 1000 10000 100000 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from benchmarks.storage_formats import generate_task_records
+from benchmarks.timing import timed
+from todo_app.application.dtos.project_dtos import CompleteProjectRequest
+from todo_app.application.service_ports.notifications import NotificationPort
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.infrastructure.configuration.container import Application
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.locking import atomic_write
+from todo_app.infrastructure.persistence.sharded import migrate_to_sharded
+from todo_app.infrastructure.repository_factory import create_repositories, create_serializer
+from todo_app.infrastructure.web.app import create_web_app
+from todo_app.interfaces.presenters.api import ApiProjectPresenter
+from todo_app.interfaces.presenters.cli import CliProjectPresenter
+from todo_app.interfaces.presenters.web import WebProjectPresenter, WebTaskPresenter
+
+# Environment for each backend, as a deployment would configure it
+BACKENDS: Dict[str, Dict[str, str]] = {
+    "memory": {"TODO_REPOSITORY_TYPE": "memory"},
+    "file-json": {"TODO_REPOSITORY_TYPE": "file", "TODO_STORAGE_FORMAT": "json"},
+    "file-compact-json": {"TODO_REPOSITORY_TYPE": "file", "TODO_STORAGE_FORMAT": "compact_json"},
+    "file-binary": {"TODO_REPOSITORY_TYPE": "file", "TODO_STORAGE_FORMAT": "binary"},
+    "file-sharded": {
+        "TODO_REPOSITORY_TYPE": "file",
+        "TODO_STORAGE_FORMAT": "compact_json",
+        "TODO_FILE_LAYOUT": "sharded",
+    },
+}
+
+PRESENTERS = {
+    "web": WebProjectPresenter,
+    "cli": CliProjectPresenter,
+    "api": ApiProjectPresenter,
+}
+
+
+class _NullNotifications(NotificationPort):
+    """Keeps notification delivery (and the recorder's printing) out of the timings."""
+
+    def notify_task_completed(self, task: Task) -> None:
+        pass
+
+    def notify_task_high_priority(self, task: Task) -> None:
+        pass
+
+    def notify_task_deadline_approaching(self, task: Task, days_remaining: int) -> None:
+        pass
+
+
+@dataclass
+class Dataset:
+    """Project and task records in the file repositories' record format."""
+
+    projects: List[Dict]
+    tasks: List[Dict]
+
+    @property
+    def project_ids(self) -> List[UUID]:
+        return [UUID(str(record["id"])) for record in self.projects]
+
+
+def generate_dataset(projects: int, tasks_per_project: int, seed: int = 1) -> Dataset:
+    """N projects with M tasks each, with a realistic mix of statuses and deadlines."""
+    to_record = FileProjectRepository._project_to_dict
+    project_records = [
+        to_record(Project(name=f"Project {n}", description=f"Synthetic project {n}"))
+        for n in range(projects)
+    ]
+    project_ids = [record["id"] for record in project_records]
+    task_records = generate_task_records(
+        projects * tasks_per_project, seed=seed, project_ids=project_ids
+    )
+    return Dataset(project_records, task_records)
+
+
+@contextmanager
+def _environment(overrides: Dict[str, str]) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _seed_memory(app: Application, dataset: Dataset) -> None:
+    to_project, to_task = FileProjectRepository._dict_to_project, FileTaskRepository._dict_to_task
+    for record in dataset.projects:
+        # Records hold UUID and datetime objects; the readers expect their stored form
+        project = to_project(json.loads(json.dumps(record, default=str)))
+        project.version = 0
+        app.project_repository.save(project)
+    for record in dataset.tasks:
+        task = to_task(json.loads(json.dumps(record, default=str)))
+        task.version = 0
+        app.task_repository.save(task)
+
+
+def _seed_files(dataset: Dataset, data_dir: Path) -> None:
+    """Write the dataset directly, as a restored backup would be."""
+    serializer = create_serializer()
+    atomic_write(data_dir / f"projects{serializer.suffix}", serializer.dumps(dataset.projects))
+    atomic_write(data_dir / f"tasks{serializer.suffix}", serializer.dumps(dataset.tasks))
+    if os.environ.get("TODO_FILE_LAYOUT") == "sharded":
+        migrate_to_sharded(data_dir, serializer)
+
+
+def _build_application() -> Application:
+    task_repository, project_repository = create_repositories()
+    return Application(
+        task_repository=task_repository,
+        project_repository=project_repository,
+        notification_service=_NullNotifications(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+    )
+
+
+def _per_op(operation: Callable[[], object], ops: int, repeat: int) -> float:
+    """Best time per call over `repeat` batches of `ops` calls, in seconds."""
+    return timed(lambda: [operation() for _ in range(ops)], repeat) / ops
+
+
+def _operations(
+    app: Application, dataset: Dataset, ops: int, repeat: int
+) -> Dict[str, Callable[[], Optional[float]]]:
+    """Each benchmarked operation, as a callable returning its best time in seconds."""
+    rng = random.Random(3)
+    sample = rng.sample(dataset.tasks, min(ops, len(dataset.tasks)))
+    next_task = cycle([UUID(str(record["id"])) for record in sample]).__next__
+    next_project = cycle(dataset.project_ids).__next__
+    tasks, projects = app.task_repository, app.project_repository
+
+    def update_task():
+        task = tasks.get(next_task())
+        task.title = f"{task.title}!"
+        tasks.save(task)
+
+    def create_task() -> Task:
+        task = Task(title="Benchmark", description="", project_id=next_project())
+        tasks.save(task)
+        return task
+
+    def delete_task() -> float:
+        # Seeds the tasks it deletes, so it can run without task.create
+        doomed = [create_task().id for _ in range(ops * repeat)]
+        return _per_op(lambda: tasks.delete(doomed.pop()), ops, repeat)
+
+    def complete_project() -> Optional[float]:
+        # Every run needs a project that still has open tasks; one completion per run,
+        # since on single-file stores each completed task rewrites the whole file
+        open_projects = iter(
+            project_id
+            for project_id in dataset.project_ids
+            if any(task.status != TaskStatus.DONE for task in tasks.find_by_project(project_id))
+        )
+        requests = [
+            CompleteProjectRequest(project_id=str(project_id))
+            for project_id in islice(open_projects, repeat)
+        ]
+        if not requests:
+            return None  # every project is already complete
+        next_request = iter(requests).__next__
+        execute = app.complete_project_use_case.execute
+        return _per_op(lambda: execute(next_request()), 1, len(requests))
+
+    def index() -> float:
+        client = create_web_app(app).test_client()
+        return timed(lambda: client.get("/?show_completed=true"), repeat)
+
+    return {
+        "task.get": lambda: _per_op(lambda: tasks.get(next_task()), ops, repeat),
+        "task.update": lambda: _per_op(update_task, ops, repeat),
+        "task.create": lambda: _per_op(create_task, ops, repeat),
+        "task.delete": delete_task,
+        "task.find_by_project": lambda: _per_op(
+            lambda: tasks.find_by_project(next_project()), ops, repeat
+        ),
+        "project.get": lambda: _per_op(lambda: projects.get(next_project()), ops, repeat),
+        "ListProjectsUseCase": lambda: timed(app.list_projects_use_case.execute, repeat),
+        "CompleteProjectUseCase": complete_project,
+        "flask.index": index,
+    }
+
+
+def _present(app: Application, presenter_class, repeat: int) -> float:
+    """Time presenting every project of a listing."""
+    responses = app.list_projects_use_case.execute().value
+    presenter = presenter_class()
+    return timed(lambda: [presenter.present_project(response) for response in responses], repeat)
+
+
+def run(
+    sizes: List[int],
+    projects: int,
+    backends: List[str],
+    operations: Optional[List[str]],
+    ops: int,
+    repeat: int,
+) -> List[Dict]:
+    results = []
+    for size in sizes:
+        dataset = generate_dataset(projects, max(1, size // projects))
+        for backend in backends:
+            with tempfile.TemporaryDirectory() as tmp, _environment(
+                {**BACKENDS[backend], "TODO_DATA_DIR": tmp}
+            ):
+                if backend == "memory":
+                    app = _build_application()
+                    _seed_memory(app, dataset)
+                else:
+                    _seed_files(dataset, Path(tmp))
+                    app = _build_application()
+
+                available = _operations(app, dataset, ops, repeat)
+                if backend == "memory":
+                    # Presenters do not touch storage, so they are measured once per size
+                    for name, presenter_class in PRESENTERS.items():
+                        available[f"presenter.{name}"] = partial(
+                            _present, app, presenter_class, repeat
+                        )
+                for operation, measure in available.items():
+                    if operations and operation not in operations:
+                        continue
+                    seconds = measure()
+                    if seconds is None:
+                        continue
+                    results.append(
+                        {
+                            "tasks": len(dataset.tasks),
+                            "projects": projects,
+                            "backend": backend,
+                            "operation": operation,
+                            "seconds": seconds,
+                        }
+                    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--projects", type=int, default=100, help="Projects the tasks are spread over"
+    )
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--operations", nargs="+", default=None, help="Only these operations")
+    parser.add_argument("--ops", type=int, default=20, help="Calls per per-operation measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best kept)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", type=Path, default=None, help="Also write the JSON here")
+    args = parser.parse_args()
+
+    results = run(
+        args.sizes, args.projects, args.backends, args.operations, args.ops, args.repeat
+    )
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"projects": args.projects, "ops": args.ops, "repeat": args.repeat},
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'tasks':>7} {'backend':<18} {'operation':<24} {'time (ms)':>11}")
+    for row in results:
+        print(
+            f"{row['tasks']:>7} {row['backend']:<18} {row['operation']:<24} "
+            f"{row['seconds'] * 1000:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Benchmark the file repository's storage formats.
+
+For each store size and format this reports the file size, the time to load
+every record and the time to save the store (which is what a single task write
+costs in the single-file layout, since the whole file is rewritten).
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.storage_formats --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from benchmarks.timing import timed
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline, Priority
+from todo_app.infrastructure.config import StorageFormat
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.locking import atomic_write
+from todo_app.infrastructure.persistence.versioning import stamp_new_version
+from todo_app.infrastructure.repository_factory import create_serializer
+
+
+def generate_task_records(
+    count: int,
+    projects: int = 100,
+    seed: int = 1,
+    project_ids: Optional[Sequence[UUID]] = None,
+) -> List[Dict]:
+    """
+    Build realistic task records the way FileTaskRepository stores them.
+
+    A quarter of the tasks are done and a quarter in progress; two thirds have
+    a deadline, some of them due within the day. Tasks are spread over
+    `projects` random project ids unless existing project_ids are given.
+    """
+    rng = random.Random(seed)
+    project_ids = project_ids or [uuid4() for _ in range(projects)]
+    now = datetime.now(timezone.utc)
+    to_record = FileTaskRepository._task_to_dict
+    records = []
+    for n in range(count):
+        task = Task(
+            title=f"Task {n}",
+            description=rng.choice(["", "Follow up with the team", "Review the draft " * 3]),
+            project_id=rng.choice(project_ids),
+            priority=rng.choice(list(Priority)),
+            due_date=(
+                Deadline(now + timedelta(hours=rng.choice([6, 24 * rng.randint(1, 60)])))
+                if n % 3
+                else None
+            ),
+        )
+        if n % 4 == 0:
+            task.complete(notes="Done")
+        elif n % 4 == 1:
+            task.start()
+        stamp_new_version(task)
+        records.append(to_record(task))
+    return records
+
+
+def run(sizes: List[int], formats: List[StorageFormat], repeat: int) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            records = generate_task_records(size)
+            for storage_format in formats:
+                serializer = create_serializer(storage_format)
+                path = Path(tmp) / f"tasks{serializer.suffix}"
+                save = timed(lambda: atomic_write(path, serializer.dumps(records)), repeat)
+                load = timed(lambda: serializer.loads(path.read_bytes()), repeat)
+                results.append(
+                    {
+                        "tasks": size,
+                        "format": storage_format.value,
+                        "file_bytes": path.stat().st_size,
+                        "load_seconds": round(load, 4),
+                        "save_seconds": round(save, 4),
+                    }
+                )
+                path.unlink()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=[f.value for f in StorageFormat],
+        default=[f.value for f in StorageFormat],
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best kept)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.sizes, [StorageFormat(f) for f in args.formats], args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'tasks':>9} {'format':<13} {'size (MB)':>10} {'load (s)':>9} {'save (s)':>9}")
+    for row in results:
+        print(
+            f"{row['tasks']:>9} {row['format']:<13} {row['file_bytes'] / 1e6:>10.2f} "
+            f"{row['load_seconds']:>9.3f} {row['save_seconds']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+Timing helpers shared by the benchmarks.
+"""
+
+import time
+from typing import Callable
+
+
+def timed(operation: Callable[[], object], repeat: int) -> float:
+    """Best wall-clock time of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import pytest
@@ -7,9 +7,11 @@ from todo_app.application.dtos.task_dtos import CreateTaskRequest
 from todo_app.application.repositories.task_repository import TaskRepository
 from todo_app.infrastructure.persistence.file import FileProjectRepository
 from todo_app.domain.entities.task import Task
-from todo_app.domain.value_objects import Priority, ProjectType
+from todo_app.domain.exceptions import ConcurrentModificationError
+from todo_app.domain.value_objects import Deadline, Priority, ProjectType
 from unittest.mock import Mock
 
+from todo_app.application.use_cases.deadline_use_cases import CheckDeadlinesUseCase
 from todo_app.application.use_cases.task_use_cases import (
     CompleteTaskRequest,
     CompleteTaskUseCase,
@@ -69,6 +71,66 @@ def test_successful_task_completion():
     notification_service.notify_task_completed.assert_called_once_with(task)
 
 
+
+def _conflict(task: Task) -> ConcurrentModificationError:
+    return ConcurrentModificationError("Task", task.id, expected_version=0, actual_version=1)
+
+
+def _raise_conflict(task: Task) -> None:
+    raise _conflict(task)
+
+
+def test_task_completion_retries_after_concurrent_modification():
+    """Test that a stale save is retried against a freshly loaded task."""
+    # Arrange - each get() returns the latest stored state, first save loses the race
+    project_id = UUID("12345678-1234-5678-1234-567812345678")
+    stale = Task(title="Test task", description="Test description", project_id=project_id)
+    fresh = Task(title="Test task", description="Test description", project_id=project_id)
+    fresh.id = stale.id
+    task_repo = Mock()
+    task_repo.get.side_effect = [stale, fresh]
+    task_repo.save.side_effect = [_conflict(stale), None]
+    notification_service = Mock()
+
+    use_case = CompleteTaskUseCase(
+        task_repository=task_repo, notification_service=notification_service
+    )
+
+    # Act
+    result = use_case.execute(CompleteTaskRequest(task_id=str(stale.id)))
+
+    # Assert
+    assert result.is_success
+    assert task_repo.get.call_count == 2
+    notification_service.notify_task_completed.assert_called_once_with(fresh)
+
+
+def test_task_completion_reports_conflict_when_retries_exhausted():
+    """Test that persistent conflicts surface as a CONFLICT failure."""
+    # Arrange
+    project_id = UUID("12345678-1234-5678-1234-567812345678")
+    task_repo = Mock()
+    task_repo.get.side_effect = lambda task_id: Task(
+        title="Test task", description="Test description", project_id=project_id
+    )
+    task_repo.save.side_effect = _raise_conflict
+    notification_service = Mock()
+
+    use_case = CompleteTaskUseCase(
+        task_repository=task_repo, notification_service=notification_service, conflict_retries=2
+    )
+
+    # Act
+    result = use_case.execute(
+        CompleteTaskRequest(task_id="12345678-1234-5678-1234-567812345678")
+    )
+
+    # Assert
+    assert not result.is_success
+    assert result.error.code.value == "CONFLICT"
+    assert task_repo.save.call_count == 3
+    notification_service.notify_task_completed.assert_not_called()
+
 @pytest.mark.parametrize(
     "request_data,expected_behavior",
     [
@@ -101,3 +163,32 @@ def test_task_creation_scenarios(request_data, expected_behavior, tmp_path):
     created_task = result.value
     assert UUID(created_task.project_id) == project_repo.get_inbox().id
     assert created_task.priority == expected_behavior["priority"]
+
+
+def test_deadline_check_streams_active_tasks():
+    """Test that the deadline check consumes tasks lazily instead of loading a list."""
+    # Arrange
+    project_id = UUID("12345678-1234-5678-1234-567812345678")
+    due_soon = Task(
+        title="Due soon",
+        description="",
+        project_id=project_id,
+        due_date=Deadline(datetime.now(timezone.utc) + timedelta(hours=12)),
+    )
+    no_deadline = Task(title="Someday", description="", project_id=project_id)
+    task_repo = Mock()
+    task_repo.iter_active_tasks.return_value = iter([due_soon, no_deadline])
+    notification_service = Mock()
+
+    use_case = CheckDeadlinesUseCase(
+        task_repository=task_repo, notification_service=notification_service
+    )
+
+    # Act
+    result = use_case.execute()
+
+    # Assert
+    assert result.is_success
+    assert result.value == {"notifications_sent": 1}
+    task_repo.get_active_tasks.assert_not_called()
+    notification_service.notify_task_deadline_approaching.assert_called_once_with(due_soon, 0)
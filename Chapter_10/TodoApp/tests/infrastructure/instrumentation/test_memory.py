@@ -0,0 +1,63 @@
+import tracemalloc
+
+import pytest
+
+from todo_app.infrastructure.instrumentation.memory import MemoryDiagnostics, retained_counts
+from todo_app.infrastructure.notifications.recorder import NotificationRecorder
+from todo_app.infrastructure.persistence.caching import CachingTaskRepository, LruTtlCache
+from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository
+
+
+@pytest.fixture
+def memory():
+    diagnostics = MemoryDiagnostics()
+    yield diagnostics
+    if tracemalloc.is_tracing():
+        diagnostics.stop()
+
+
+def test_diff_reports_the_line_that_grew(memory):
+    """Test that growth between two snapshots is attributed to the allocating line."""
+    # Arrange
+    memory.start()
+    memory.take_snapshot()
+
+    # Act
+    retained = [bytearray(1024) for _ in range(200)]
+    memory.take_snapshot()
+    growth = memory.diff("line", limit=5)
+
+    # Assert
+    assert len(retained) == 200
+    assert "test_memory.py:" in growth[0]["location"]
+    assert growth[0]["size_diff_bytes"] >= 200 * 1024
+    assert memory.diff("module", limit=1)[0]["location"].endswith("test_memory.py")
+
+
+def test_snapshots_require_tracing_and_valid_grouping(memory):
+    """Test that misuse surfaces as errors rather than empty reports."""
+    with pytest.raises(RuntimeError):
+        memory.take_snapshot()
+
+    memory.start()
+    memory.take_snapshot()
+    with pytest.raises(RuntimeError):
+        memory.diff()
+    with pytest.raises(ValueError):
+        memory.top("function")
+
+
+def test_retained_counts_walk_the_decorator_chain():
+    """Test that stores, caches and recorders report what they hold."""
+    inner = InMemoryTaskRepository()
+    repository = CachingTaskRepository(inner, LruTtlCache(max_entries=10, ttl_seconds=30))
+    recorder = NotificationRecorder(max_records=2)
+    for _ in range(3):
+        recorder.completed_tasks.append("id")
+
+    assert retained_counts(repository) == {
+        "CachingTaskRepository": 0,
+        "InMemoryTaskRepository": 0,
+    }
+    assert retained_counts(recorder) == {"NotificationRecorder": 2}
+
@@ -0,0 +1,56 @@
+import threading
+
+from todo_app.infrastructure.instrumentation.metrics import RequestMetrics
+
+
+def test_counters_from_all_threads_are_merged_on_render():
+    """Test that per-thread shards add up, including those of finished threads."""
+    # Arrange
+    metrics = RequestMetrics()
+
+    def handle_requests():
+        for _ in range(100):
+            metrics.request_started()
+            metrics.request_finished("GET", "/api/v1/projects", 200, 0.02)
+
+    workers = [threading.Thread(target=handle_requests) for _ in range(4)]
+
+    # Act
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    body = metrics.render()
+
+    # Assert
+    labels = 'method="GET",route="/api/v1/projects"'
+    assert f"todo_http_requests_total{{{labels},status=\"200\"}} 400" in body
+    assert f'todo_http_request_duration_seconds_bucket{{{labels},le="0.01"}} 0' in body
+    assert f'todo_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 400' in body
+    assert f'todo_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 400' in body
+    assert "todo_http_requests_in_flight 0" in body
+
+
+def test_shards_of_exited_threads_are_folded_into_one():
+    """Test that short-lived threads leave no shard behind but keep their counts."""
+    # Arrange
+    metrics = RequestMetrics()
+
+    def handle_request():
+        metrics.request_started()
+        metrics.request_finished("POST", "/api/v1/tasks", 201, 0.002)
+
+    # Act
+    for _ in range(50):
+        worker = threading.Thread(target=handle_request)
+        worker.start()
+        worker.join()
+    handle_request()
+    body = metrics.render()
+
+    # Assert
+    assert len(metrics._shards) == 1  # this thread's; the workers' were retired
+    labels = 'method="POST",route="/api/v1/tasks"'
+    assert f"todo_http_requests_total{{{labels},status=\"201\"}} 51" in body
+    assert f"todo_http_request_duration_seconds_count{{{labels}}} 51" in body
+    assert "todo_http_requests_in_flight 0" in body
@@ -0,0 +1,67 @@
+import pstats
+import time
+
+from todo_app.infrastructure.config import ProfileMode
+from todo_app.infrastructure.instrumentation.profiling import Profiler
+
+
+def _busy_work():
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def test_cprofile_session_writes_pstats_named_after_the_trace_id(tmp_path):
+    """Test that a profiled unit of work produces a loadable .pstats file."""
+    # Arrange
+    profiler = Profiler(tmp_path)
+
+    # Act
+    with profiler.profile("../trace/1") as session:
+        _busy_work()
+
+    # Assert
+    (path,) = tmp_path.glob("*.pstats")
+    assert path.name.startswith("___trace_1.")
+    assert session.path_stem.parent == tmp_path
+    stats = pstats.Stats(str(path))
+    assert any(func[2] == "_busy_work" for func in stats.stats)
+
+
+def test_sampling_session_writes_collapsed_stacks(tmp_path):
+    """Test that the sampling mode records the profiled thread's stacks."""
+    profiler = Profiler(tmp_path, mode=ProfileMode.SAMPLING)
+
+    with profiler.profile("trace"):
+        _busy_work()
+
+    (path,) = tmp_path.glob("trace.*.collapsed")
+    lines = path.read_text().splitlines()
+    assert lines
+    assert any("_busy_work" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_only_one_profile_runs_at_a_time(tmp_path):
+    """Test that work arriving during a profile is not profiled."""
+    profiler = Profiler(tmp_path)
+
+    with profiler.profile("first") as first:
+        with profiler.profile("second") as second:
+            pass
+
+    assert first is not None
+    assert second is None
+    third = profiler.start("third")  # released again
+    assert third is not None
+    third.stop()
+
+
+def test_token_requests_a_profile_and_sampling_is_off_by_default(tmp_path):
+    """Test the opt-in rules for profiling a request."""
+    profiler = Profiler(tmp_path, token="s3cret")
+
+    assert profiler.wants("s3cret")
+    assert not profiler.wants("wrong")
+    assert not profiler.wants(None)
+    assert Profiler(tmp_path, sample_rate=1.0).wants(None)
@@ -0,0 +1,82 @@
+from uuid import uuid4
+
+import pytest
+
+from todo_app.infrastructure.instrumentation.timing import TimingRegistry, instrument
+from todo_app.infrastructure.logging.trace import set_trace_id
+from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+
+
+def test_instrumented_repository_records_calls_per_method():
+    """Test that each repository method gets its own count and histogram."""
+    # Arrange
+    registry = TimingRegistry()
+    repository = instrument(InMemoryTaskRepository(), "repository", registry)
+    task = Task(title="Timed", description="", project_id=uuid4())
+
+    # Act
+    repository.save(task)
+    repository.get(task.id)
+    repository.get(task.id)
+    with pytest.raises(TaskNotFoundError):
+        repository.get(uuid4())
+
+    # Assert
+    summary = registry.summary()
+    assert summary["InMemoryTaskRepository.get"]["count"] == 3
+    assert summary["InMemoryTaskRepository.get"]["errors"] == 1
+    assert summary["InMemoryTaskRepository.save"]["count"] == 1
+    assert sum(summary["InMemoryTaskRepository.get"]["buckets"].values()) == 3
+    assert registry.layer_totals()["repository"]["count"] == 4
+
+
+def test_samples_are_tagged_with_the_current_trace_id():
+    """Test that calls can be broken down by the request that made them."""
+    # Arrange
+    registry = TimingRegistry()
+    repository = instrument(InMemoryTaskRepository(), "repository", registry)
+    # Instrumenting twice must not double count
+    instrument(repository, "repository", registry)
+
+    # Act
+    set_trace_id("first")
+    repository.get_active_tasks()
+    set_trace_id("second")
+    repository.get_active_tasks()
+    repository.get_active_tasks()
+
+    # Assert
+    assert len(registry.samples_for_trace("first")) == 1
+    assert [s.name for s in registry.samples_for_trace("second")] == [
+        "InMemoryTaskRepository.get_active_tasks"
+    ] * 2
+
+
+def test_generator_methods_are_timed_until_consumed():
+    """Test that a generator is recorded once, when exhausted, with its error state."""
+    # Arrange
+    registry = TimingRegistry()
+
+    class Source:
+        def iter_items(self, fail: bool):
+            yield 1
+            if fail:
+                raise RuntimeError("storage failed")
+            yield 2
+
+    source = instrument(Source(), "repository", registry)
+
+    # Act
+    items = source.iter_items(fail=False)
+    recorded_before_consuming = registry.summary()
+    consumed = list(items)
+    with pytest.raises(RuntimeError):
+        list(source.iter_items(fail=True))
+
+    # Assert
+    assert recorded_before_consuming == {}
+    assert consumed == [1, 2]
+    assert registry.summary()["Source.iter_items"]["count"] == 2
+    assert registry.summary()["Source.iter_items"]["errors"] == 1
@@ -0,0 +1,41 @@
+import json
+import time
+
+from todo_app.infrastructure.instrumentation.tracing import (
+    JsonlSpanExporter,
+    Tracer,
+    parse_traceparent,
+)
+
+
+def test_parse_traceparent_rejects_malformed_and_all_zero_ids():
+    """Test that only well-formed W3C traceparent headers are accepted."""
+    valid = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    assert parse_traceparent(valid) == ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7")
+    assert parse_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7") is None
+    assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert parse_traceparent(None) is None
+
+
+def test_exporter_writes_full_batches_from_its_worker_thread(tmp_path):
+    """Test that nested spans are exported once a batch fills up."""
+    # Arrange
+    exporter = JsonlSpanExporter(tmp_path / "spans.jsonl", max_batch=2, flush_interval=60)
+    tracer = Tracer(exporter)
+
+    # Act
+    with tracer.span("outer", "use_case"):
+        with tracer.span("inner", "repository", {"arg.0": "abc"}):
+            pass
+    deadline = time.monotonic() + 5
+    while not exporter.path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    exporter.shutdown()
+
+    # Assert
+    assert exporter.path.exists()
+    inner, outer = [json.loads(line) for line in exporter.path.read_text().splitlines()]
+    assert inner["parent_id"] == outer["span_id"]
+    assert outer["parent_id"] is None
+    assert inner["attributes"] == {"arg.0": "abc"}
@@ -0,0 +1,126 @@
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ConcurrentModificationError
+from todo_app.infrastructure.persistence.caching import (
+    CachingProjectRepository,
+    CachingTaskRepository,
+    LruTtlCache,
+)
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.repository_factory import create_repositories
+
+
+@pytest.fixture
+def repositories(tmp_path):
+    """Caching repositories over file repositories, wired like create_repositories does."""
+    task_repo = CachingTaskRepository(FileTaskRepository(tmp_path), LruTtlCache(100, 60))
+    project_repo = CachingProjectRepository(FileProjectRepository(tmp_path), LruTtlCache(100, 60))
+    project_repo.set_task_repository(task_repo)
+    return task_repo, project_repo
+
+
+def test_repeated_gets_are_served_from_cache_as_copies():
+    """Test that a cached task is read from storage once and handed out as copies."""
+    # Arrange
+    task = Task(title="Cached", description="", project_id=UUID(int=1))
+    inner = Mock()
+    inner.get.return_value = task
+    repository = CachingTaskRepository(inner, LruTtlCache(10, 60))
+
+    # Act
+    first = repository.get(task.id)
+    second = repository.get(task.id)
+    second.title = "Changed without saving"
+
+    # Assert
+    inner.get.assert_called_once_with(task.id)
+    assert repository.get(task.id).title == "Cached"
+    assert first is task
+    assert repository.cache.stats().hits == 2
+
+
+def test_task_save_invalidates_task_and_owning_project(repositories):
+    """Test write-through invalidation of both caches."""
+    # Arrange
+    task_repo, project_repo = repositories
+    project = Project(name="Cached project", description="")
+    project_repo.save(project)
+    assert project_repo.get(project.id).tasks == []
+
+    # Act
+    task = Task(title="New", description="", project_id=project.id)
+    task_repo.save(task)
+    task_repo.get(task.id)
+    task.title = "Renamed"
+    task_repo.save(task)
+
+    # Assert
+    assert [t.title for t in project_repo.get(project.id).tasks] == ["Renamed"]
+    assert task_repo.get(task.id).title == "Renamed"
+
+
+def test_task_save_invalidates_project_through_the_identity_map(tmp_path, monkeypatch):
+    """Test that the project cache still hears about task saves when the identity map wraps it."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "file")
+    monkeypatch.setenv("TODO_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("TODO_CACHE_MAX_ENTRIES", "100")
+    task_repo, project_repo = create_repositories()
+    project = Project(name="Cached project", description="")
+    project_repo.save(project)
+    assert project_repo.get(project.id).tasks == []
+
+    # Act
+    task_repo.save(Task(title="New", description="", project_id=project.id))
+
+    # Assert
+    assert [t.title for t in project_repo.get(project.id).tasks] == ["New"]
+
+
+def test_conflicting_save_evicts_the_stale_copy(repositories, tmp_path):
+    """Test that a retry after a conflict re-reads storage instead of the stale cache."""
+    # Arrange
+    task_repo, _ = repositories
+    task = Task(title="Original", description="", project_id=UUID(int=1))
+    task_repo.save(task)
+    stale = task_repo.get(task.id)
+
+    other_writer = FileTaskRepository(tmp_path)
+    fresh = other_writer.get(task.id)
+    fresh.title = "Saved elsewhere"
+    other_writer.save(fresh)
+
+    # Act
+    stale.title = "Lost update"
+    with pytest.raises(ConcurrentModificationError):
+        task_repo.save(stale)
+
+    # Assert
+    assert task_repo.get(task.id).title == "Saved elsewhere"
+
+
+def test_cache_limits_and_expiry():
+    """Test eviction by entry count and by size, and expiry by TTL."""
+    by_entries = LruTtlCache(max_entries=2, ttl_seconds=60)
+    for key in "abc":
+        by_entries.put(key, key)
+    by_entries.get("b")
+    assert by_entries.get("a") is None
+    assert by_entries.stats().evictions == 1
+
+    by_bytes = LruTtlCache(max_entries=100, ttl_seconds=60, max_bytes=200)
+    for key in range(10):
+        by_bytes.put(key, "x" * 50)
+    stats = by_bytes.stats()
+    assert stats.bytes <= 200
+    assert stats.evictions == 10 - stats.entries
+
+    expired = LruTtlCache(max_entries=10, ttl_seconds=0)
+    expired.put("a", "a")
+    assert expired.get("a") is None
+    assert expired.stats().expirations == 1
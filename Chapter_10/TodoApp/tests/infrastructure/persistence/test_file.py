@@ -5,6 +5,7 @@ from todo_app.application.use_cases.task_use_cases import CreateTaskUseCase
 from todo_app.domain.value_objects import ProjectType
 from todo_app.domain.entities.task import Task
 from todo_app.domain.entities.project import Project
+from todo_app.domain.exceptions import ConcurrentModificationError
 from todo_app.infrastructure.persistence.file import FileTaskRepository, FileProjectRepository
 
 
@@ -72,3 +73,24 @@ def test_task_creation_with_persistence(tmp_path):
     assert result.is_success
     created_task = task_repo.get(UUID(result.value.id))
     assert created_task.project_id == project_repo.get_inbox().id
+
+
+def test_stale_task_save_is_rejected(tmp_path):
+    """Test that saving over a newer stored version raises instead of losing the update."""
+    # Arrange - two independent repositories load the same task
+    task = Task(title="Shared", description="Edited twice", project_id=UUID(int=1))
+    FileTaskRepository(tmp_path).save(task)
+    first_copy = FileTaskRepository(tmp_path).get(task.id)
+    second_copy = FileTaskRepository(tmp_path).get(task.id)
+
+    # Act - the first writer wins
+    first_copy.title = "First writer"
+    FileTaskRepository(tmp_path).save(first_copy)
+
+    # Assert - the second writer's stale copy is refused and the first update survives
+    second_copy.title = "Second writer"
+    with pytest.raises(ConcurrentModificationError):
+        FileTaskRepository(tmp_path).save(second_copy)
+    stored = FileTaskRepository(tmp_path).get(task.id)
+    assert stored.title == "First writer"
+    assert stored.version == 2
@@ -0,0 +1,84 @@
+import json
+import multiprocessing
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ConcurrentModificationError
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.locking import atomic_write
+
+WORKERS = 4
+OPERATIONS = 25
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="stress test relies on forked worker processes",
+)
+
+
+def _create_tasks(data_dir: Path, worker: int) -> None:
+    repo = FileTaskRepository(data_dir)
+    for n in range(OPERATIONS):
+        repo.save(Task(title=f"{worker}-{n}", description="", project_id=UUID(int=1)))
+
+
+def _append_to_description(data_dir: Path, task_id: UUID, worker: int) -> None:
+    repo = FileTaskRepository(data_dir)
+    for _ in range(OPERATIONS):
+        while True:
+            task = repo.get(task_id)
+            task.description += str(worker)
+            try:
+                repo.save(task)
+                break
+            except ConcurrentModificationError:
+                continue
+
+
+def _run_workers(target, *args) -> None:
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=target, args=(*args, w)) for w in range(WORKERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+
+def test_concurrent_inserts_are_not_lost(tmp_path):
+    """Test that processes appending tasks to the same file never drop each other's writes."""
+    # Act
+    _run_workers(_create_tasks, tmp_path)
+
+    # Assert - every insert survived and the file is valid JSON
+    tasks = FileTaskRepository(tmp_path)._load_tasks()
+    assert len(tasks) == WORKERS * OPERATIONS
+    assert len({t["title"] for t in tasks}) == WORKERS * OPERATIONS
+
+
+def test_concurrent_updates_are_not_lost(tmp_path):
+    """Test that read-modify-write updates from several processes all land."""
+    # Arrange
+    task = Task(title="Counter", description="", project_id=UUID(int=1))
+    FileTaskRepository(tmp_path).save(task)
+
+    # Act
+    _run_workers(_append_to_description, tmp_path, task.id)
+
+    # Assert - one character and one version per successful update
+    stored = FileTaskRepository(tmp_path).get(task.id)
+    assert len(stored.description) == WORKERS * OPERATIONS
+    assert stored.version == WORKERS * OPERATIONS + 1
+
+
+def test_atomic_write_leaves_no_temporary_files(tmp_path):
+    """Test that atomic writes replace the target and clean up after themselves."""
+    target = tmp_path / "tasks.json"
+    atomic_write(target, "[]")
+    atomic_write(target, json.dumps([{"id": 1}]))
+
+    assert json.loads(target.read_text()) == [{"id": 1}]
+    assert [p.name for p in tmp_path.iterdir()] == ["tasks.json"]
@@ -0,0 +1,89 @@
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ConcurrentModificationError
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.identity_map import (
+    IdentityMapProjectRepository,
+    IdentityMapTaskRepository,
+    begin_identity_scope,
+    current_identity_map,
+    end_identity_scope,
+)
+
+
+@pytest.fixture
+def identity_scope():
+    """Run the test inside an identity map scope, as a web request would."""
+    token = begin_identity_scope()
+    yield current_identity_map()
+    end_identity_scope(token)
+
+
+@pytest.fixture
+def repositories(tmp_path):
+    task_repo = IdentityMapTaskRepository(FileTaskRepository(tmp_path))
+    project_repo = IdentityMapProjectRepository(FileProjectRepository(tmp_path))
+    project_repo.set_task_repository(task_repo)
+    return task_repo, project_repo
+
+
+def test_repeated_loads_in_a_scope_return_the_same_instance(repositories, identity_scope):
+    """Test that a project and its tasks are hydrated once per scope."""
+    # Arrange
+    task_repo, project_repo = repositories
+    project = Project(name="Mapped", description="")
+    project_repo.save(project)
+    task = Task(title="Task", description="", project_id=project.id)
+    task_repo.save(task)
+    identity_scope.discard(Project, project.id)
+    identity_scope.discard(Task, task.id)
+
+    # Act
+    loaded = project_repo.get(project.id)
+
+    # Assert
+    assert project_repo.get(project.id) is loaded
+    assert [p for p in project_repo.get_all() if p.id == project.id][0] is loaded
+    assert task_repo.get(task.id) is loaded.tasks[0]
+
+
+def test_loads_outside_a_scope_are_not_shared():
+    """Test that the wrappers delegate when no scope is active."""
+    inner = Mock()
+    inner.get.side_effect = lambda task_id: Task(title="T", description="", project_id=UUID(int=1))
+    repository = IdentityMapTaskRepository(inner)
+
+    assert current_identity_map() is None
+    assert repository.get(UUID(int=7)) is not repository.get(UUID(int=7))
+
+
+def test_saving_a_task_drops_its_project_from_the_map(repositories, identity_scope):
+    """Test that the next project load sees a newly added task."""
+    task_repo, project_repo = repositories
+    project = Project(name="Mapped", description="")
+    project_repo.save(project)
+    assert project_repo.get(project.id).tasks == []
+
+    task_repo.save(Task(title="Added", description="", project_id=project.id))
+
+    assert [t.title for t in project_repo.get(project.id).tasks] == ["Added"]
+
+
+def test_conflicting_save_drops_the_stale_instance(identity_scope):
+    """Test that a use case retry after a conflict re-reads storage."""
+    task = Task(title="Stale", description="", project_id=UUID(int=1))
+    inner = Mock()
+    inner.get.return_value = task
+    inner.save.side_effect = ConcurrentModificationError("Task", task.id, 1, 2)
+    repository = IdentityMapTaskRepository(inner)
+    repository.get(task.id)
+
+    with pytest.raises(ConcurrentModificationError):
+        repository.save(task)
+
+    assert identity_scope.get(Task, task.id) is None
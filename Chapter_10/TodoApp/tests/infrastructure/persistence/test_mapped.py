@@ -0,0 +1,55 @@
+from uuid import UUID
+
+import pytest
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.mapped import MappedBinaryTaskRepository
+from todo_app.infrastructure.persistence.serializers import BinarySerializer
+
+
+@pytest.fixture
+def tasks(tmp_path):
+    """Store a few tasks in a binary file using the regular file repository."""
+    writer = FileTaskRepository(tmp_path, BinarySerializer())
+    tasks = [Task(title=f"Task {n}", description="", project_id=UUID(int=n % 2)) for n in range(5)]
+    for task in tasks:
+        writer.save(task)
+    return tasks
+
+
+def test_get_decodes_only_the_requested_task(tasks, tmp_path, monkeypatch):
+    """Test that a get goes through the index instead of loading the whole file."""
+    # Arrange
+    repository = MappedBinaryTaskRepository(tmp_path)
+    monkeypatch.setattr(
+        repository.serializer, "loads", lambda data: pytest.fail("full file decoded")
+    )
+
+    # Act / Assert
+    for task in tasks:
+        assert repository.get(task.id) == task
+    with pytest.raises(TaskNotFoundError):
+        repository.get(UUID(int=42))
+
+
+def test_reads_follow_writes_from_other_repositories(tasks, tmp_path):
+    """Test that the mapping is refreshed once the file is replaced."""
+    # Arrange
+    repository = MappedBinaryTaskRepository(tmp_path)
+    assert repository.get(tasks[0].id).title == "Task 0"
+
+    # Act - another process-like writer replaces the file
+    writer = FileTaskRepository(tmp_path, BinarySerializer())
+    updated = writer.get(tasks[0].id)
+    updated.title = "Renamed"
+    writer.save(updated)
+
+    # Assert
+    assert repository.get(tasks[0].id).title == "Renamed"
+    assert [t.title for t in repository.find_by_project(UUID(int=0))] == [
+        "Renamed",
+        "Task 2",
+        "Task 4",
+    ]
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from click.testing import CliRunner
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline, Priority
+from todo_app.infrastructure.cli.admin_cli import admin
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.serializers import (
+    BinarySerializer,
+    CompactJsonSerializer,
+    JsonSerializer,
+)
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [JsonSerializer(), CompactJsonSerializer(), BinarySerializer()],
+    ids=["json", "compact-json", "binary"],
+)
+def test_file_repositories_round_trip_entities(serializer, tmp_path):
+    """Test that every storage format restores entities exactly."""
+    # Arrange
+    task_repo = FileTaskRepository(tmp_path, serializer)
+    project_repo = FileProjectRepository(tmp_path, serializer)
+    project_repo.set_task_repository(task_repo)
+    project = Project(name="Launch", description="Ünïcode ✓")
+    task = Task(
+        title="Ship it",
+        description="",
+        project_id=project.id,
+        priority=Priority.HIGH,
+        due_date=Deadline(datetime.now(timezone.utc) + timedelta(days=3)),
+    )
+    task.complete(notes="done")
+    project_repo.save(project)
+    task_repo.save(task)
+
+    # Act
+    loaded_project = FileProjectRepository(tmp_path, serializer).get(project.id)
+    loaded_task = FileTaskRepository(tmp_path, serializer).get(task.id)
+
+    # Assert
+    assert loaded_project.description == project.description
+    assert loaded_project.version == project.version
+    assert loaded_task == task
+    assert (tmp_path / f"tasks{serializer.suffix}").exists()
+
+
+def test_binary_index_is_sorted_by_id():
+    """Test that the binary offset table is ordered for binary search."""
+    serializer = BinarySerializer()
+    records = [{"id": str(UUID(int=n)), "title": f"task {n}"} for n in (5, 1, 3)]
+
+    data = memoryview(serializer.dumps(records))
+    _, index_start, count = serializer.read_header(data)
+    entries = [
+        serializer.INDEX_ENTRY.unpack_from(data, index_start + i * serializer.INDEX_ENTRY.size)
+        for i in range(count)
+    ]
+
+    assert [UUID(bytes=id_bytes).int for id_bytes, _ in entries] == [1, 3, 5]
+    assert serializer.loads(bytes(data)) == records
+
+
+def test_convert_format_command_rewrites_json_store_as_binary(tmp_path):
+    """Test converting an existing JSON store to the binary format via the admin CLI."""
+    # Arrange
+    task = Task(title="Convert me", description="", project_id=UUID(int=1))
+    FileTaskRepository(tmp_path).save(task)
+
+    # Act
+    result = CliRunner().invoke(
+        admin, ["convert-format", "--from", "json", "--to", "binary", "--data-dir", str(tmp_path)]
+    )
+
+    # Assert
+    assert result.exit_code == 0, result.output
+    assert FileTaskRepository(tmp_path, BinarySerializer()).get(task.id) == task
@@ -0,0 +1,151 @@
+import json
+from uuid import UUID
+
+import pytest
+from click.testing import CliRunner
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ConcurrentModificationError, TaskNotFoundError
+from todo_app.infrastructure.cli.admin_cli import admin
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.sharded import ShardedFileTaskRepository
+
+PROJECT_A = UUID(int=1)
+PROJECT_B = UUID(int=2)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create a sharded repository using a temporary directory."""
+    return ShardedFileTaskRepository(tmp_path)
+
+
+def test_saving_a_task_only_writes_its_project_shard(repository):
+    """Test that tasks land in per-project shards and are found by project."""
+    # Arrange
+    task_a = Task(title="A", description="", project_id=PROJECT_A)
+    task_b = Task(title="B", description="", project_id=PROJECT_B)
+    repository.save(task_a)
+    repository.save(task_b)
+    shard_b_before = (repository.shard_dir / f"{PROJECT_B}.json").stat().st_mtime_ns
+
+    # Act
+    task_a.title = "A updated"
+    repository.save(task_a)
+
+    # Assert
+    assert (repository.shard_dir / f"{PROJECT_B}.json").stat().st_mtime_ns == shard_b_before
+    assert [t.title for t in repository.find_by_project(PROJECT_A)] == ["A updated"]
+    assert repository.get(task_b.id).title == "B"
+
+
+def test_moving_and_deleting_tasks_updates_manifest(repository):
+    """Test that a task moved between projects leaves its old shard."""
+    # Arrange
+    task = Task(title="Mover", description="", project_id=PROJECT_A)
+    repository.save(task)
+
+    # Act
+    task.project_id = PROJECT_B
+    repository.save(task)
+
+    # Assert
+    assert repository.find_by_project(PROJECT_A) == []
+    assert repository.get(task.id).project_id == PROJECT_B
+
+    repository.delete(task.id)
+    with pytest.raises(TaskNotFoundError):
+        repository.get(task.id)
+
+
+def test_single_task_operations_leave_the_manifest_alone(repository):
+    """Test that the manifest only changes when a project gets its first shard."""
+    # Arrange
+    repository.save(Task(title="First", description="", project_id=PROJECT_A))
+    manifest_before = repository.manifest_file.stat().st_mtime_ns
+
+    # Act
+    task = Task(title="Second", description="", project_id=PROJECT_A)
+    repository.save(task)
+    task.title = "Second, renamed"
+    repository.save(task)
+    loaded = repository.get(task.id)
+    repository.delete(task.id)
+
+    # Assert
+    assert loaded.title == "Second, renamed"
+    assert repository.manifest_file.stat().st_mtime_ns == manifest_before
+    assert json.loads(repository.manifest_file.read_text()) == {"projects": [str(PROJECT_A)]}
+
+
+def test_task_id_manifest_of_earlier_versions_is_upgraded(tmp_path):
+    """Test that a manifest mapping task ids to projects becomes pointer files."""
+    # Arrange
+    task = Task(title="Old layout", description="", project_id=PROJECT_A)
+    ShardedFileTaskRepository(tmp_path).save(task)
+    manifest_file = tmp_path / "tasks" / "manifest.json"
+    (tmp_path / "tasks" / "index" / str(task.id)).unlink()
+    manifest_file.write_text(json.dumps({str(task.id): str(PROJECT_A)}))
+
+    # Act
+    repository = ShardedFileTaskRepository(tmp_path)
+
+    # Assert
+    assert repository.get(task.id).title == "Old layout"
+    assert json.loads(manifest_file.read_text()) == {"projects": [str(PROJECT_A)]}
+
+
+def test_stale_save_is_rejected(repository, tmp_path):
+    """Test that the sharded layout keeps the optimistic concurrency check."""
+    task = Task(title="Shared", description="", project_id=PROJECT_A)
+    repository.save(task)
+    stale = ShardedFileTaskRepository(tmp_path).get(task.id)
+    repository.save(task)
+
+    with pytest.raises(ConcurrentModificationError):
+        repository.save(stale)
+
+
+def test_migrate_layout_command_moves_single_file_tasks(tmp_path):
+    """Test migrating an existing tasks.json into shards via the admin CLI."""
+    # Arrange
+    single = FileTaskRepository(tmp_path)
+    tasks = [
+        Task(title="A", description="", project_id=PROJECT_A),
+        Task(title="B", description="", project_id=PROJECT_B),
+    ]
+    for task in tasks:
+        single.save(task)
+
+    # Act
+    result = CliRunner().invoke(admin, ["migrate-layout", "--data-dir", str(tmp_path)])
+
+    # Assert
+    assert result.exit_code == 0, result.output
+    assert not (tmp_path / "tasks.json").exists()
+    sharded = ShardedFileTaskRepository(tmp_path)
+    for task in tasks:
+        migrated = sharded.get(task.id)
+        assert migrated.title == task.title
+        assert migrated.version == task.version
+    manifest = json.loads((sharded.shard_dir / "manifest.json").read_text())
+    assert manifest == {"projects": [str(PROJECT_A), str(PROJECT_B)]}
+    assert {p.name for p in sharded.index_dir.iterdir()} == {str(task.id) for task in tasks}
+
+
+def test_iter_active_tasks_streams_across_shards(repository):
+    """Test that streaming yields every active task without building a list."""
+    # Arrange
+    open_task = Task(title="Open", description="", project_id=PROJECT_A)
+    done_task = Task(title="Done", description="", project_id=PROJECT_B)
+    done_task.complete()
+    repository.save(open_task)
+    repository.save(done_task)
+
+    # Act
+    stream = repository.iter_active_tasks()
+
+    # Assert
+    assert iter(stream) is stream
+    assert [t.id for t in stream] == [open_task.id]
+    assert [t.id for t in repository.iter_by_project(PROJECT_B)] == [done_task.id]
@@ -0,0 +1,312 @@
+import json
+
+import pytest
+
+from todo_app.infrastructure.configuration.container import create_application
+from todo_app.infrastructure.notifications.recorder import NotificationRecorder
+from todo_app.infrastructure.persistence.identity_map import current_identity_map
+from todo_app.infrastructure.web.app import create_web_app
+from todo_app.interfaces.presenters.web import WebProjectPresenter, WebTaskPresenter
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Flask test client backed by in-memory repositories."""
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    return create_web_app(app_container).test_client()
+
+
+def test_api_creates_and_returns_task_as_json(client):
+    """Test that tasks round-trip through the JSON API with machine-readable fields."""
+    # Arrange
+    project = client.post("/api/v1/projects", json={"name": "API Project"}).get_json()
+
+    # Act
+    created = client.post(
+        f"/api/v1/projects/{project['id']}/tasks",
+        json={"title": "API Task", "description": "via JSON", "priority": "HIGH"},
+    )
+    fetched = client.get(f"/api/v1/tasks/{created.get_json()['id']}")
+
+    # Assert
+    assert created.status_code == 201
+    assert fetched.status_code == 200
+    assert fetched.get_json()["priority"] == "HIGH"
+    assert fetched.get_json()["project_id"] == project["id"]
+    assert fetched.headers["ETag"]
+    assert fetched.headers["Last-Modified"]
+
+
+def test_api_answers_matching_if_none_match_with_304(client):
+    """Test that an unchanged collection revalidates without a body."""
+    # Arrange
+    first = client.get("/api/v1/projects")
+    etag = first.headers["ETag"]
+
+    # Act
+    revalidated = client.get("/api/v1/projects", headers={"If-None-Match": etag})
+
+    # Assert
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+
+
+def test_api_etag_changes_when_an_entity_is_saved(client):
+    """Test that saving a task invalidates the project's validator."""
+    # Arrange
+    project = client.post("/api/v1/projects", json={"name": "Tracked"}).get_json()
+    before = client.get(f"/api/v1/projects/{project['id']}").headers["ETag"]
+
+    # Act
+    client.post(f"/api/v1/projects/{project['id']}/tasks", json={"title": "New work"})
+    after = client.get(f"/api/v1/projects/{project['id']}", headers={"If-None-Match": before})
+
+    # Assert
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before
+    assert len(after.get_json()["tasks"]) == 1
+
+
+def test_api_maps_error_codes_to_http_status(client):
+    """Test that application errors surface as HTTP status codes."""
+    missing = client.get("/api/v1/tasks/123e4567-e89b-12d3-a456-426614174000")
+    invalid = client.get("/api/v1/tasks/not-a-uuid")
+
+    assert missing.status_code == 404
+    assert missing.get_json()["error"]["code"] == "NOT_FOUND"
+    assert invalid.status_code == 400
+
+
+def test_identity_map_is_scoped_to_the_request(client):
+    """Test that the per-request identity map is dropped when the request ends."""
+    response = client.get("/api/v1/projects")
+
+    assert response.status_code == 200
+    assert current_identity_map() is None
+
+
+def test_timings_endpoint_reports_calls_for_a_trace(monkeypatch):
+    """Test that timed calls into each layer are exposed per trace id."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    monkeypatch.setenv("TODO_TIMING_ENABLED", "true")
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    web_app = create_web_app(app_container)
+    web_app.debug = True
+    client = web_app.test_client()
+
+    client.post("/api/v1/projects", json={"name": "Timed"})
+
+    # Act
+    client.get("/api/v1/projects", headers={"X-Trace-ID": "trace-under-test"})
+    timings = client.get("/admin/timings").get_json()
+    traced = client.get("/admin/timings?trace_id=trace-under-test").get_json()
+
+    # Assert
+    assert timings["methods"]["ListProjectsUseCase.execute"]["count"] == 1
+    assert timings["methods"]["ApiProjectPresenter.present_project"]["count"] >= 2
+    assert timings["layers"]["repository"]["count"] >= 1
+    assert timings["layers"]["presenter"]["count"] >= 2
+    assert {call["layer"] for call in traced["calls"]} == {
+        "controller",
+        "use_case",
+        "presenter",
+        "repository",
+    }
+
+
+def test_timings_endpoint_requires_the_admin_token(monkeypatch):
+    """Test that admin endpoints check X-Admin-Token, or only serve local debug use without one."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    monkeypatch.setenv("TODO_TIMING_ENABLED", "true")
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    local = create_web_app(app_container).test_client()
+    debug_app = create_web_app(app_container)
+    debug_app.debug = True
+    remote = debug_app.test_client()
+    remote.environ_base["REMOTE_ADDR"] = "203.0.113.7"
+    monkeypatch.setenv("TODO_ADMIN_TOKEN", "s3cret")
+    protected = create_web_app(app_container).test_client()
+
+    # Act / Assert
+    # Loopback is not enough outside debug mode: a local reverse proxy is loopback too
+    assert local.get("/admin/timings").status_code == 403
+    assert remote.get("/admin/timings").status_code == 403
+    assert debug_app.test_client().get("/admin/timings").status_code == 200
+    assert protected.get("/admin/timings").status_code == 403
+    assert protected.get("/admin/timings", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert protected.get("/admin/timings", headers={"X-Admin-Token": "s3cret"}).status_code == 200
+
+
+def test_timings_endpoint_is_hidden_when_timing_is_disabled(client):
+    """Test that the timings endpoint does not exist unless enabled."""
+    client.application.debug = True
+
+    assert client.get("/admin/timings").status_code == 404
+
+
+def test_metrics_endpoint_exposes_request_counts_and_latency(client):
+    """Test that requests are counted per route template and status."""
+    # Arrange
+    client.get("/api/v1/projects")
+    client.get("/api/v1/tasks/123e4567-e89b-12d3-a456-426614174000")
+
+    # Act
+    response = client.get("/metrics")
+    body = response.get_data(as_text=True)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert 'todo_http_requests_total{method="GET",route="/api/v1/projects",status="200"} 1' in body
+    assert (
+        'todo_http_requests_total{method="GET",route="/api/v1/tasks/<task_id>",status="404"} 1'
+        in body
+    )
+    assert "todo_http_requests_in_flight 1" in body  # the scrape itself
+    assert (
+        'todo_http_request_duration_seconds_count{method="GET",route="/api/v1/projects"} 1' in body
+    )
+
+
+def test_request_spans_nest_under_the_callers_traceparent(monkeypatch, tmp_path):
+    """Test that a request's spans form one tree rooted at the incoming traceparent."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    monkeypatch.setenv("TODO_TRACE_FILE", str(tmp_path / "spans.jsonl"))
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    client = create_web_app(app_container).test_client()
+    trace_id, caller_span = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+
+    # Act
+    response = client.get(
+        "/api/v1/projects", headers={"traceparent": f"00-{trace_id}-{caller_span}-01"}
+    )
+    app_container.tracer.exporter.flush()
+    spans = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+
+    # Assert
+    by_id = {span["span_id"]: span for span in spans}
+    request_span = next(span for span in spans if span["layer"] == "http")
+    assert response.headers["traceparent"].startswith(f"00-{trace_id}-")
+    assert {span["trace_id"] for span in spans} == {trace_id}
+    assert request_span["parent_id"] == caller_span
+    assert request_span["attributes"]["http.status_code"] == 200
+    assert {span["layer"] for span in spans} >= {"http", "controller", "use_case", "repository"}
+    for span in spans:
+        if span is not request_span:
+            assert span["parent_id"] in by_id
+            assert span["end_time"] >= span["start_time"]
+
+
+def test_request_with_profile_token_is_profiled(monkeypatch, tmp_path):
+    """Test that only requests carrying the profile token are profiled."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    monkeypatch.setenv("TODO_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("TODO_PROFILE_TOKEN", "s3cret")
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    client = create_web_app(app_container).test_client()
+
+    # Act
+    plain = client.get("/api/v1/projects")
+    profiled = client.get(
+        "/api/v1/projects", headers={"X-Profile-Token": "s3cret", "X-Trace-ID": "slow-request"}
+    )
+
+    # Assert
+    assert "X-Profile" not in plain.headers
+    assert profiled.headers["X-Profile"].startswith("slow-request.")
+    assert [p.name for p in tmp_path.iterdir()] == [f"{profiled.headers['X-Profile']}.pstats"]
+
+
+def test_memory_endpoints_snapshot_and_report_retained_entities(monkeypatch):
+    """Test the tracemalloc workflow and entity counts through the admin endpoints."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    monkeypatch.setenv("TODO_MEMORY_DIAGNOSTICS", "true")
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    web_app = create_web_app(app_container)
+    web_app.debug = True
+    client = web_app.test_client()
+
+    try:
+        # Act
+        premature = client.post("/admin/memory/snapshot")
+        client.post("/admin/memory/start")
+        client.post("/admin/memory/snapshot")
+        client.post("/api/v1/projects", json={"name": "Measured"})
+        client.post("/admin/memory/snapshot")
+        status = client.get("/admin/memory?top=3&group_by=module").get_json()
+        diff = client.get("/admin/memory/diff?limit=3")
+    finally:
+        client.post("/admin/memory/stop")
+
+    # Assert
+    assert premature.status_code == 409
+    assert status["tracing"] is True
+    assert status["snapshots"] == 2
+    assert status["retained"]["project_repository"]["InMemoryProjectRepository"] == 2
+    assert len(status["top"]) == 3
+    assert diff.status_code == 200
+    assert len(diff.get_json()["growth"]) == 3
+
+
+def test_memory_endpoints_require_the_admin_token(monkeypatch):
+    """Test that tracemalloc cannot be started or inspected without the admin token."""
+    # Arrange
+    monkeypatch.setenv("TODO_REPOSITORY_TYPE", "memory")
+    monkeypatch.setenv("TODO_MEMORY_DIAGNOSTICS", "true")
+    monkeypatch.setenv("TODO_ADMIN_TOKEN", "s3cret")
+    app_container = create_application(
+        notification_service=NotificationRecorder(),
+        task_presenter=WebTaskPresenter(),
+        project_presenter=WebProjectPresenter(),
+        app_context="WEB",
+    )
+    client = create_web_app(app_container).test_client()
+
+    # Act
+    denied = [
+        client.post(f"/admin/memory/{action}").status_code
+        for action in ("start", "snapshot", "stop")
+    ] + [client.get(path).status_code for path in ("/admin/memory", "/admin/memory/diff")]
+    allowed = client.get("/admin/memory", headers={"X-Admin-Token": "s3cret"})
+
+    # Assert
+    assert denied == [403] * 5
+    assert allowed.status_code == 200
+    assert allowed.get_json()["tracing"] is False
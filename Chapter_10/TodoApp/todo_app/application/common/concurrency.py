@@ -0,0 +1,51 @@
+"""
+This module contains retry support for use cases that read, modify and save entities.
+
+Repositories reject saves of stale entities with ConcurrentModificationError.
+Because use cases load their entities inside execute(), simply re-running
+execute() re-reads the latest state and re-applies the change on top of it.
+"""
+
+from functools import wraps
+from typing import Callable
+
+from todo_app.application.common.result import Error, Result
+from todo_app.domain.exceptions import ConcurrentModificationError
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFLICT_RETRIES = 3
+
+
+def retry_on_conflict(execute: Callable[..., Result]) -> Callable[..., Result]:
+    """
+    Re-run a use case's execute() when a save hits a concurrent modification.
+
+    The number of retries is read from the use case's ``conflict_retries``
+    attribute. Once retries are exhausted a CONFLICT failure is returned.
+    """
+
+    @wraps(execute)
+    def wrapper(self, *args, **kwargs) -> Result:
+        retries = getattr(self, "conflict_retries", DEFAULT_CONFLICT_RETRIES)
+        for attempt in range(retries + 1):
+            try:
+                return execute(self, *args, **kwargs)
+            except ConcurrentModificationError as e:
+                logger.warning(
+                    "Concurrent modification detected",
+                    extra={
+                        "context": {
+                            "use_case": type(self).__name__,
+                            "entity_id": str(e.entity_id),
+                            "attempt": attempt + 1,
+                            "error": str(e),
+                        }
+                    },
+                )
+                conflict = e
+        return Result.failure(Error.conflict(str(conflict)))
+
+    return wrapper
@@ -55,6 +55,11 @@ class Error:
         """Create a BUSINESS_RULE_VIOLATION error with the specified message."""
         return cls(code=ErrorCode.BUSINESS_RULE_VIOLATION, message=message)
 
+    @classmethod
+    def conflict(cls, message: str) -> Self:
+        """Create a CONFLICT error with the specified message."""
+        return cls(code=ErrorCode.CONFLICT, message=message)
+
 
 @dataclass(frozen=True)
 class Result(Generic[T]):
@@ -75,6 +75,8 @@ class ProjectResponse:
     project_type: ProjectType
     completion_date: Optional[datetime]
     tasks: Sequence[TaskResponse]
+    version: int = 0
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_entity(cls, project: Project) -> Self:
@@ -87,6 +89,8 @@ class ProjectResponse:
             project_type=project.project_type,
             completion_date=project.completed_at if project.completed_at else None,
             tasks=[TaskResponse.from_entity(task) for task in project.tasks],
+            version=project.version,
+            updated_at=project.updated_at,
         )
 
 
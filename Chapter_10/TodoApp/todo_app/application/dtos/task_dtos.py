@@ -100,6 +100,8 @@ class TaskResponse:
     due_date: Optional[datetime] = None
     completion_date: Optional[datetime] = None
     completion_notes: Optional[str] = None
+    version: int = 0
+    updated_at: Optional[datetime] = None
 
     @classmethod
     def from_entity(cls, task: Task) -> Self:
@@ -114,6 +116,8 @@ class TaskResponse:
             project_id=str(task.project_id),
             completion_date=task.completed_at,
             completion_notes=task.completion_notes,
+            version=task.version,
+            updated_at=task.updated_at,
         )
 
 
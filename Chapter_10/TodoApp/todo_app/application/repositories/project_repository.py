@@ -9,7 +9,13 @@ from todo_app.domain.entities.project import Project
 
 
 class ProjectRepository(ABC):
-    """Repository interface for Project entity persistence."""
+    """
+    Repository interface for Project entity persistence.
+
+    Unlike TaskRepository there are no iter_* methods: a user has a handful of
+    projects, so get_all() already holds only a small list, and the large
+    collections (a project's tasks) are streamed through the task repository.
+    """
 
     @abstractmethod
     def get(self, project_id: UUID) -> Project:
@@ -3,7 +3,7 @@ This module defines the repository interface for Task entity persistence.
 """
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Iterator, Sequence
 from uuid import UUID
 
 from todo_app.domain.entities.task import Task
@@ -70,3 +70,30 @@ class TaskRepository(ABC):
             A sequence of all active Tasks
         """
         pass
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        """
+        Stream the tasks of a project.
+
+        Implementations that can read storage incrementally override this so
+        callers never hold the whole result in memory.
+
+        Args:
+            project_id: The unique identifier of the project
+
+        Returns:
+            An iterator over the project's Task entities
+        """
+        yield from self.find_by_project(project_id)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        """
+        Stream all active tasks.
+
+        Long-running jobs should prefer this to get_active_tasks so their memory
+        use does not grow with the number of tasks.
+
+        Returns:
+            An iterator over all active Tasks
+        """
+        yield from self.get_active_tasks()
@@ -34,10 +34,12 @@ class CheckDeadlinesUseCase:
                 "Checking task deadlines",
                 extra={"context": {"warning_threshold_days": self.warning_threshold.days}},
             )
-            tasks = self.task_repository.get_active_tasks()
+            # Stream tasks so memory use does not grow with the number of tasks
+            tasks_checked = 0
             notifications_sent = 0
 
-            for task in tasks:
+            for task in self.task_repository.iter_active_tasks():
+                tasks_checked += 1
                 if task.due_date and task.due_date.is_approaching(self.warning_threshold):
                     remaining_days = int(
                         task.due_date.time_remaining().total_seconds() / (24 * 3600)
@@ -58,7 +60,7 @@ class CheckDeadlinesUseCase:
                 "Deadline check completed",
                 extra={
                     "context": {
-                        "total_tasks_checked": len(tasks),
+                        "total_tasks_checked": tasks_checked,
                         "notifications_sent": notifications_sent,
                     }
                 },
@@ -8,6 +8,7 @@ from uuid import UUID
 
 from todo_app.domain.value_objects import ProjectType
 from todo_app.application.common.result import Result, Error
+from todo_app.application.common.concurrency import DEFAULT_CONFLICT_RETRIES, retry_on_conflict
 from todo_app.application.dtos.project_dtos import (
     CreateProjectRequest,
     ProjectResponse,
@@ -72,7 +73,9 @@ class CompleteProjectUseCase:
     project_repository: ProjectRepository
     task_repository: TaskRepository
     notification_service: NotificationPort
+    conflict_retries: int = DEFAULT_CONFLICT_RETRIES
 
+    @retry_on_conflict
     def execute(self, request: CompleteProjectRequest) -> Result:
         """Execute the use case."""
         try:
@@ -113,8 +116,12 @@ class CompleteProjectUseCase:
                     "Failed to complete project",
                     extra={"context": {"project_id": str(project.id), "error": str(e)}},
                 )
+                # Snapshots overwrite whatever this attempt may have saved
+                current_tasks = {task.id: task for task in project.tasks}
                 for task_id, task_snapshot in task_snapshots.items():
+                    task_snapshot.version = current_tasks[task_id].version
                     self.task_repository.save(task_snapshot)
+                project_snapshot.version = project.version
                 self.project_repository.save(project_snapshot)
                 raise  # Re-raise the exception to be caught by outer try block
 
@@ -185,7 +192,9 @@ class UpdateProjectUseCase:
     """Use case for updating a project."""
 
     project_repository: ProjectRepository
+    conflict_retries: int = DEFAULT_CONFLICT_RETRIES
 
+    @retry_on_conflict
     def execute(self, request: UpdateProjectRequest) -> Result:
         """Execute the use case."""
         try:
@@ -8,6 +8,7 @@ from uuid import UUID
 
 from todo_app.application.dtos.operations import DeletionOutcome
 from todo_app.application.common.result import Result, Error
+from todo_app.application.common.concurrency import DEFAULT_CONFLICT_RETRIES, retry_on_conflict
 from todo_app.application.dtos.task_dtos import (
     CompleteTaskRequest,
     CreateTaskRequest,
@@ -43,7 +44,9 @@ class CompleteTaskUseCase:
 
     task_repository: TaskRepository
     notification_service: NotificationPort
+    conflict_retries: int = DEFAULT_CONFLICT_RETRIES
 
+    @retry_on_conflict
     def execute(self, request: CompleteTaskRequest) -> Result:
         """Execute the use case."""
         try:
@@ -76,6 +79,8 @@ class CompleteTaskUseCase:
                     "Failed to complete task",
                     extra={"context": {"task_id": str(task.id), "error": str(e)}},
                 )
+                # The snapshot overwrites whatever this attempt may have saved
+                task_snapshot.version = task.version
                 self.task_repository.save(task_snapshot)
                 raise  # Re-raise the exception to be caught by outer try block
 
@@ -181,7 +186,9 @@ class UpdateTaskUseCase:
 
     task_repository: TaskRepository
     notification_service: NotificationPort
+    conflict_retries: int = DEFAULT_CONFLICT_RETRIES
 
+    @retry_on_conflict
     def execute(self, request: UpdateTaskRequest) -> Result:
         try:
             params = request.to_execution_params()
@@ -219,6 +226,7 @@ class UpdateTaskUseCase:
                     "Failed to update task",
                     extra={"context": {"task_id": str(task.id), "error": str(e)}},
                 )
+                task_snapshot.version = task.version
                 self.task_repository.save(task_snapshot)
                 raise
 
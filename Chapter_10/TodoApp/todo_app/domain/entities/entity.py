@@ -1,4 +1,6 @@
 from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
 from uuid import UUID, uuid4
 
 
@@ -7,6 +9,9 @@ class Entity:
     # Automatically generates a unique UUID for the 'id' field;
     #   excluded from the __init__ method
     id: UUID = field(default_factory=uuid4, init=False)
+    # Persistence bookkeeping: advanced by repositories each time the entity is saved
+    version: int = field(default=0, init=False)
+    updated_at: Optional[datetime] = field(default=None, init=False)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
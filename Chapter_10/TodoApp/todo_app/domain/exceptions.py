@@ -45,3 +45,19 @@ class BusinessRuleViolation(DomainError):
     """Raised when a business rule is violated."""
 
     pass
+
+
+class ConcurrentModificationError(DomainError):
+    """Raised when saving an entity that was modified by someone else since it was read."""
+
+    def __init__(
+        self, entity: str, entity_id: UUID, expected_version: int, actual_version: int
+    ) -> None:
+        self.entity = entity
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"{entity} with id {entity_id} was modified concurrently "
+            f"(expected version {expected_version}, found {actual_version})"
+        )
@@ -0,0 +1,88 @@
+"""
+Administrative Click commands for maintaining the Todo application's storage.
+
+These operate on the configured data directory directly rather than through
+the application's use cases, and are meant to be run while the app is stopped.
+"""
+
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from todo_app.infrastructure.config import Config, StorageFormat
+from todo_app.infrastructure.persistence.locking import FileLock, atomic_write
+from todo_app.infrastructure.persistence.sharded import (
+    MANIFEST_FILE_NAME,
+    SHARD_DIR_NAME,
+    migrate_to_sharded,
+)
+from todo_app.infrastructure.repository_factory import create_serializer
+
+_FORMAT_CHOICE = click.Choice([f.value for f in StorageFormat])
+
+
+@click.group()
+def admin() -> None:
+    """Todo App administration commands."""
+
+
+@admin.command("migrate-layout")
+@click.option(
+    "--data-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Data directory to migrate (defaults to TODO_DATA_DIR).",
+)
+def migrate_layout(data_dir: Optional[Path]) -> None:
+    """Move tasks.json into the sharded per-project layout."""
+    data_dir = data_dir or Config.get_data_directory()
+    try:
+        migrated = migrate_to_sharded(data_dir, create_serializer())
+    except (FileNotFoundError, ValueError) as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Migrated {migrated} tasks to the sharded layout in {data_dir}")
+    click.echo("Set TODO_FILE_LAYOUT=sharded to use it.")
+
+
+@admin.command("convert-format")
+@click.option("--from", "source", type=_FORMAT_CHOICE, required=True, help="Current format.")
+@click.option("--to", "target", type=_FORMAT_CHOICE, required=True, help="Format to write.")
+@click.option(
+    "--data-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Data directory to convert (defaults to TODO_DATA_DIR).",
+)
+def convert_format(source: str, target: str, data_dir: Optional[Path]) -> None:
+    """Rewrite project and task files in another storage format."""
+    data_dir = data_dir or Config.get_data_directory()
+    reader = create_serializer(StorageFormat(source))
+    writer = create_serializer(StorageFormat(target))
+
+    stems = [data_dir / "projects", data_dir / "tasks"]
+    shard_dir = data_dir / SHARD_DIR_NAME
+    if shard_dir.is_dir():
+        stems += [
+            path.with_suffix("")
+            for path in shard_dir.glob(f"*{reader.suffix}")
+            if path.name != MANIFEST_FILE_NAME
+        ]
+
+    converted = 0
+    for stem in stems:
+        source_file = stem.with_name(stem.name + reader.suffix)
+        target_file = stem.with_name(stem.name + writer.suffix)
+        if not source_file.exists():
+            continue
+        # JSON variants share a suffix, so the file may be rewritten in place
+        same_file = source_file == target_file
+        with FileLock(source_file).exclusive(), (
+            nullcontext() if same_file else FileLock(target_file).exclusive()
+        ):
+            records = reader.loads(source_file.read_bytes())
+            atomic_write(target_file, writer.dumps(records))
+        converted += 1
+    click.echo(f"Converted {converted} files from {source} to {target} in {data_dir}")
+    click.echo(f"Set TODO_STORAGE_FORMAT={target} to use them.")
@@ -16,6 +16,7 @@ class ClickCli:
     def __init__(self, app: Application):
         self.app = app
         self.current_projects = []  # Cached list of projects for display
+        self.profile_next = False  # set by the 'profile' command
 
     def run(self) -> int:
         """Entry point for running the Click CLI application"""
@@ -34,6 +35,12 @@ class ClickCli:
         """Display all projects and their tasks."""
         click.clear()
         click.echo("\nProjects: [type 'np' to create new project]")
+        if self.app.timings is not None:
+            click.echo("[type 'stats' to show call timings]")
+        if self.app.profiler is not None:
+            click.echo("[type 'profile' to profile the next command]")
+        if self.app.memory is not None:
+            click.echo("[type 'memory' for memory diagnostics]")
 
         result = self.app.project_controller.handle_list()
         if not result.is_success:
@@ -165,7 +172,7 @@ class ClickCli:
         click.pause()
 
     def _handle_selection(self) -> None:
-        """Handle project/task selection."""
+        """Handle project/task selection, profiling it when requested or sampled."""
         selection = (
             click.prompt(
                 "\nSelect a project or task (e.g., '1' or '1.a')", type=str, show_default=False
@@ -174,10 +181,41 @@ class ClickCli:
             .lower()
         )
 
+        profiler = self.app.profiler
+        if profiler is None:
+            self._dispatch_selection(selection)
+            return
+
+        if selection == "profile":
+            self.profile_next = True
+            return
+
+        if not (self.profile_next or profiler.wants()):
+            self._dispatch_selection(selection)
+            return
+
+        self.profile_next = False
+        # Time spent in any follow-up prompts is part of the profile
+        with profiler.profile(get_trace_id()) as session:
+            self._dispatch_selection(selection)
+        if session is not None:
+            click.echo(f"Profile written to {session.path_stem}.*")
+            click.pause()
+
+    def _dispatch_selection(self, selection: str) -> None:
+        """Run the command for a selection."""
         if selection == "np":
             self._create_new_project()
             return
 
+        if selection == "stats" and self.app.timings is not None:
+            self._display_timings()
+            return
+
+        if selection == "memory" and self.app.memory is not None:
+            self._memory_menu()
+            return
+
         try:
             if "." in selection:  # Task selection (e.g., "1.a")
                 project_num, task_letter = selection.split(".")
@@ -225,6 +263,75 @@ class ClickCli:
         if not result.is_success:
             click.secho(result.error.message, fg="red", err=True)
 
+    def _display_timings(self) -> None:
+        """Display call counts and latencies of the instrumented methods."""
+        click.clear()
+        click.echo("\nCALL TIMINGS (ms)")
+        click.echo(f"{'method':<45} {'calls':>6} {'mean':>8} {'p95':>8} {'max':>8}")
+        for name, stats in self.app.timings.summary().items():
+            click.echo(
+                f"{name:<45} {stats['count']:>6} {stats['mean_ms']:>8.2f} "
+                f"{stats['p95_ms']:>8.2f} {stats['max_ms']:>8.2f}"
+            )
+        click.echo("\nTotals per layer:")
+        for layer, totals in self.app.timings.layer_totals().items():
+            click.echo(f"  {layer:<12} {totals['count']:>6} calls {totals['total_ms']:>10.2f} ms")
+        recent = self.app.timings.samples_for_trace(get_trace_id())
+        click.echo(f"\nRecent calls in this session (trace {get_trace_id()}): {len(recent)}")
+        click.pause()
+
+    def _memory_menu(self) -> None:
+        """Control tracemalloc and show what is holding memory."""
+        memory = self.app.memory
+        while True:
+            click.clear()
+            click.echo("\nMEMORY DIAGNOSTICS")
+            for name, value in memory.status().items():
+                click.echo(f"  {name}: {value}")
+            click.echo("\nRetained objects:")
+            for component, counts in self.app.retained_objects().items():
+                for holder, count in counts.items():
+                    click.echo(f"  {component:<22} {holder:<32} {count:>8}")
+
+            click.echo("\nActions:")
+            click.echo("[1] Start tracing")
+            click.echo("[2] Take snapshot")
+            click.echo("[3] Top allocators (latest snapshot)")
+            click.echo("[4] Growth since previous snapshot")
+            click.echo("[5] Stop tracing")
+            click.echo("[Enter] Return to main menu")
+            choice = click.prompt("Choose an action", type=str, default="")
+            if choice == "":
+                break
+
+            try:
+                if choice == "1":
+                    memory.start()
+                elif choice == "2":
+                    memory.take_snapshot()
+                elif choice in ("3", "4"):
+                    group_by = click.prompt(
+                        "Group by", type=click.Choice(["line", "module"]), default="line"
+                    )
+                    if choice == "3":
+                        for stat in memory.top(group_by):
+                            click.echo(
+                                f"{stat['size_bytes']:>12} B {stat['count']:>8}  "
+                                f"{stat['location']}"
+                            )
+                    else:
+                        for stat in memory.diff(group_by):
+                            click.echo(
+                                f"{stat['size_diff_bytes']:>+12} B {stat['count_diff']:>+8}  "
+                                f"{stat['location']}"
+                            )
+                    click.pause()
+                elif choice == "5":
+                    memory.stop()
+            except RuntimeError as e:
+                click.secho(str(e), fg="red", err=True)
+                click.pause()
+
     def _display_task_menu(self, task_id: str) -> None:
         """Display and handle task menu."""
         while True:
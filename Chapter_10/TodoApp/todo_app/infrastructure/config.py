@@ -5,7 +5,7 @@ Configuration setup for the Todo application.
 from enum import Enum
 import os
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from dotenv import load_dotenv
 
@@ -19,12 +19,35 @@ class RepositoryType(Enum):
     FILE = "file"
 
 
+# Task file layouts for the file repository
+class FileLayout(Enum):
+    SINGLE = "single"  # every task in tasks.json
+    SHARDED = "sharded"  # one file per project, a project manifest and per-task pointers
+
+
+# On-disk formats for the file repository
+class StorageFormat(Enum):
+    JSON = "json"  # pretty-printed, human-readable
+    COMPACT_JSON = "compact_json"
+    BINARY = "binary"  # length-prefixed records with an id offset table
+
+
+# Profilers for on-demand request profiling
+class ProfileMode(Enum):
+    CPROFILE = "cprofile"  # deterministic, writes .pstats
+    SAMPLING = "sampling"  # samples the stack, writes collapsed stacks
+
+
 class Config:
     """Application configuration."""
 
     # Default values
     DEFAULT_REPOSITORY_TYPE: RepositoryType = RepositoryType.MEMORY
     DEFAULT_DATA_DIR = "repo_data"
+    DEFAULT_FILE_LAYOUT: FileLayout = FileLayout.SINGLE
+    DEFAULT_STORAGE_FORMAT: StorageFormat = StorageFormat.JSON
+    DEFAULT_CACHE_MAX_ENTRIES = 0  # repository caching is off unless a size is configured
+    DEFAULT_CACHE_TTL_SECONDS = 30.0
     DEFAULT_LOG_DIR = "logs"  # Relative to where app is run
     DEFAULT_LOG_FILE = "todo_app.log"
 
@@ -45,6 +68,85 @@ class Config:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    @classmethod
+    def get_file_layout(cls) -> FileLayout:
+        """Get the task file layout used by the file repository."""
+        layout_str = os.getenv("TODO_FILE_LAYOUT", cls.DEFAULT_FILE_LAYOUT.value)
+        try:
+            return FileLayout(layout_str.lower())
+        except ValueError:
+            raise ValueError(f"Invalid file layout: {layout_str}")
+
+    @classmethod
+    def get_storage_format(cls) -> StorageFormat:
+        """Get the on-disk format used by the file repository."""
+        format_str = os.getenv("TODO_STORAGE_FORMAT", cls.DEFAULT_STORAGE_FORMAT.value)
+        try:
+            return StorageFormat(format_str.lower())
+        except ValueError:
+            raise ValueError(f"Invalid storage format: {format_str}")
+
+    @classmethod
+    def get_cache_max_entries(cls) -> int:
+        """Get the number of entities each repository cache may hold (0 disables caching)."""
+        return int(os.getenv("TODO_CACHE_MAX_ENTRIES", cls.DEFAULT_CACHE_MAX_ENTRIES))
+
+    @classmethod
+    def get_cache_max_bytes(cls) -> int:
+        """Get the approximate byte limit of each repository cache (0 for no limit)."""
+        return int(os.getenv("TODO_CACHE_MAX_BYTES", 0))
+
+    @classmethod
+    def get_cache_ttl_seconds(cls) -> float:
+        """Get how long a cached entity may be served before it is re-read."""
+        return float(os.getenv("TODO_CACHE_TTL_SECONDS", cls.DEFAULT_CACHE_TTL_SECONDS))
+
+    @classmethod
+    def get_timing_enabled(cls) -> bool:
+        """Whether use case and repository calls are timed."""
+        return os.getenv("TODO_TIMING_ENABLED", "").lower() in ("1", "true", "yes")
+
+    @classmethod
+    def get_span_export_path(cls) -> Optional[Path]:
+        """Get the JSONL file spans are exported to (None disables span tracing)."""
+        path = os.getenv("TODO_TRACE_FILE", "")
+        return Path(path) if path else None
+
+    @classmethod
+    def get_memory_diagnostics_enabled(cls) -> bool:
+        """Whether tracemalloc diagnostics can be controlled from the CLI and web app."""
+        return os.getenv("TODO_MEMORY_DIAGNOSTICS", "").lower() in ("1", "true", "yes")
+
+    @classmethod
+    def get_profile_directory(cls) -> Optional[Path]:
+        """Get the directory profiles are written to (None disables profiling)."""
+        path = os.getenv("TODO_PROFILE_DIR", "")
+        return Path(path) if path else None
+
+    @classmethod
+    def get_admin_token(cls) -> str:
+        """Get the secret for the X-Admin-Token header (empty allows local debug use only)."""
+        return os.getenv("TODO_ADMIN_TOKEN", "")
+
+    @classmethod
+    def get_profile_token(cls) -> str:
+        """Get the secret that requests a profile via the X-Profile-Token header."""
+        return os.getenv("TODO_PROFILE_TOKEN", "")
+
+    @classmethod
+    def get_profile_sample_rate(cls) -> float:
+        """Get the fraction of requests profiled without a token."""
+        return float(os.getenv("TODO_PROFILE_SAMPLE_RATE", 0))
+
+    @classmethod
+    def get_profile_mode(cls) -> ProfileMode:
+        """Get the profiler used for profiled requests."""
+        mode_str = os.getenv("TODO_PROFILE_MODE", ProfileMode.CPROFILE.value)
+        try:
+            return ProfileMode(mode_str.lower())
+        except ValueError:
+            raise ValueError(f"Invalid profile mode: {mode_str}")
+
     @classmethod
     def get_sendgrid_api_key(cls) -> str:
         """Get the SendGrid API key."""
@@ -3,6 +3,7 @@ Application container that configures and wires together all components.
 """
 
 from dataclasses import dataclass
+from typing import Dict, Optional, TypeVar
 
 from todo_app.infrastructure.notifications.factory import create_notification_service
 from todo_app.application.service_ports.notifications import NotificationPort
@@ -25,6 +26,15 @@ from todo_app.application.use_cases.task_use_cases import (
 )
 from todo_app.interfaces.controllers.project_controller import ProjectController
 from todo_app.interfaces.controllers.task_controller import TaskController
+from todo_app.infrastructure.config import Config
+from todo_app.infrastructure.instrumentation.memory import MemoryDiagnostics, retained_counts
+from todo_app.infrastructure.instrumentation.profiling import Profiler
+from todo_app.infrastructure.instrumentation.timing import TimingRegistry, instrument
+from todo_app.infrastructure.instrumentation.tracing import (
+    JsonlSpanExporter,
+    Tracer,
+    trace_component,
+)
 from todo_app.infrastructure.repository_factory import create_repositories
 
 
@@ -32,6 +42,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+C = TypeVar("C")
+
 
 def create_application(
     notification_service: NotificationPort,
@@ -56,12 +68,28 @@ def create_application(
     # Create notification service with automatic fallback
     notification_service = create_notification_service()
 
+    span_export_path = Config.get_span_export_path()
+    profile_dir = Config.get_profile_directory()
+
     return Application(
         task_repository=task_repository,
         project_repository=project_repository,
         notification_service=notification_service,
         task_presenter=task_presenter,
         project_presenter=project_presenter,
+        timings=TimingRegistry() if Config.get_timing_enabled() else None,
+        tracer=Tracer(JsonlSpanExporter(span_export_path)) if span_export_path else None,
+        profiler=(
+            Profiler(
+                profile_dir,
+                token=Config.get_profile_token() or None,
+                sample_rate=Config.get_profile_sample_rate(),
+                mode=Config.get_profile_mode(),
+            )
+            if profile_dir
+            else None
+        ),
+        memory=MemoryDiagnostics() if Config.get_memory_diagnostics_enabled() else None,
     )
 
 
@@ -74,6 +102,10 @@ class Application:
     notification_service: NotificationPort
     task_presenter: TaskPresenter
     project_presenter: ProjectPresenter
+    timings: Optional[TimingRegistry] = None  # set to time calls into each layer
+    tracer: Optional[Tracer] = None  # set to record a span for calls into each layer
+    profiler: Optional[Profiler] = None  # set to allow profiling requests and commands
+    memory: Optional[MemoryDiagnostics] = None  # set to allow tracemalloc diagnostics
     # logger: ApplicationLogger
 
     def __post_init__(self):
@@ -125,3 +157,41 @@ class Application:
             update_use_case=self.update_project_use_case,
             presenter=self.project_presenter,
         )
+
+        if self.timings is not None or self.tracer is not None:
+            self._instrument()
+
+    def _instrument(self) -> None:
+        """Instrument every controller, use case, presenter, repository and the notifier."""
+        self.instrument(self.task_repository, "repository")
+        self.instrument(self.project_repository, "repository")
+        self.instrument(self.notification_service, "notification")
+        self.instrument(self.task_presenter, "presenter")
+        self.instrument(self.project_presenter, "presenter")
+        for name, component in list(vars(self).items()):
+            if name.endswith("_use_case"):
+                self.instrument(component, "use_case")
+            elif name.endswith("_controller"):
+                self.instrument(component, "controller")
+        logger.info(
+            "Instrumentation enabled",
+            extra={
+                "context": {"timing": self.timings is not None, "tracing": self.tracer is not None}
+            },
+        )
+
+    def retained_objects(self) -> Dict[str, Dict[str, int]]:
+        """Objects held in memory by the repositories, their caches and the notifier."""
+        return {
+            "task_repository": retained_counts(self.task_repository),
+            "project_repository": retained_counts(self.project_repository),
+            "notification_service": retained_counts(self.notification_service),
+        }
+
+    def instrument(self, component: C, layer: str) -> C:
+        """Apply the enabled timing and tracing to a component's public methods."""
+        if self.timings is not None:
+            instrument(component, layer, self.timings)
+        if self.tracer is not None:
+            trace_component(component, layer, self.tracer)
+        return component
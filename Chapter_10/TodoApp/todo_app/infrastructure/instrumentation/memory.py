@@ -0,0 +1,133 @@
+"""
+Memory diagnostics: tracemalloc snapshots and counts of retained objects.
+
+tracemalloc only sees allocations made after it starts, so the usual workflow
+is start, take a baseline snapshot, let the app run, take another snapshot and
+diff the two to see which modules and lines keep growing.
+"""
+
+import threading
+import tracemalloc
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+# Allocation statistics can be grouped per source line or per file (module)
+GROUPINGS = {"line": "lineno", "module": "filename"}
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryDiagnostics:
+    """
+    Controls tracemalloc and keeps the most recent snapshots for diffing.
+
+    Args:
+        max_snapshots: How many snapshots to keep; older ones are dropped
+    """
+
+    def __init__(self, max_snapshots: int = 5):
+        self._snapshots: Deque[tracemalloc.Snapshot] = deque(maxlen=max_snapshots)
+        self._lock = threading.Lock()
+
+    @property
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """Start tracing allocations, recording up to `frames` frames per allocation."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        """Stop tracing and drop the kept snapshots."""
+        with self._lock:
+            self._snapshots.clear()
+        tracemalloc.stop()
+
+    def status(self) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            return {"tracing": False, "snapshots": len(self._snapshots)}
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": True,
+            "snapshots": len(self._snapshots),
+            "traced_bytes": current,
+            "peak_traced_bytes": peak,
+        }
+
+    def take_snapshot(self) -> int:
+        """Snapshot the traced allocations, returning the number of snapshots kept."""
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        with self._lock:
+            self._snapshots.append(snapshot)
+            return len(self._snapshots)
+
+    def top(self, group_by: str = "line", limit: int = 10) -> List[Dict[str, Any]]:
+        """Largest allocators in the latest snapshot."""
+        key_type = _key_type(group_by)
+        snapshot = self._latest(1)[-1]
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics(key_type)[:limit]
+        ]
+
+    def diff(self, group_by: str = "line", limit: int = 10) -> List[Dict[str, Any]]:
+        """Allocators that grew the most between the previous and the latest snapshot."""
+        key_type = _key_type(group_by)
+        previous, latest = self._latest(2)
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "size_bytes": stat.size,
+            }
+            for stat in latest.compare_to(previous, key_type)[:limit]
+        ]
+
+    def _latest(self, count: int) -> List[tracemalloc.Snapshot]:
+        with self._lock:
+            if len(self._snapshots) < count:
+                raise RuntimeError(f"Need {count} snapshot(s), have {len(self._snapshots)}")
+            return list(self._snapshots)[-count:]
+
+
+def _key_type(group_by: str) -> str:
+    if group_by not in GROUPINGS:
+        raise ValueError(f"Invalid grouping: {group_by} (use one of {', '.join(GROUPINGS)})")
+    return GROUPINGS[group_by]
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    frame = traceback[0]
+    return frame.filename if group_by == "module" else f"{frame.filename}:{frame.lineno}"
+
+
+def retained_counts(component: Any) -> Dict[str, int]:
+    """
+    Objects held in memory by a component and the decorators around it.
+
+    Walks the `inner` chain of repository decorators, reporting the size of
+    anything that keeps objects: in-memory stores (via len()) and caches.
+    """
+    counts: Dict[str, int] = {}
+    while component is not None:
+        name = type(component).__name__
+        cache = getattr(component, "cache", None)
+        if cache is not None and hasattr(cache, "stats"):
+            counts[name] = cache.stats().entries
+        elif hasattr(type(component), "__len__"):
+            counts[name] = len(component)
+        component = getattr(component, "inner", None)
+    return counts
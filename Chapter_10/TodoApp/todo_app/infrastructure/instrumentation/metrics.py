@@ -0,0 +1,124 @@
+"""
+HTTP request metrics in the Prometheus text exposition format.
+
+Each thread records into its own shard, so the request path takes no locks;
+a scrape merges the shards. When a thread has exited its counters are folded
+into one retired shard, so totals never go backwards while only live threads
+keep a shard of their own.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Tuple
+
+# Upper bounds of the request duration buckets, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+RouteKey = Tuple[str, str]  # (method, route)
+
+
+class _Shard:
+    """Counters owned by one thread."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.requests: DefaultDict[Tuple[str, str, int], int] = defaultdict(int)
+        # Per route: one count per bucket plus +Inf, then the sum of durations
+        self.durations: Dict[RouteKey, List[float]] = {}
+
+
+class RequestMetrics:
+    """Request counts, in-flight requests and latency histograms per route."""
+
+    def __init__(self, namespace: str = "todo") -> None:
+        self.namespace = namespace
+        self._local = threading.local()
+        self._shards: Dict[threading.Thread, _Shard] = {}
+        self._retired = _Shard()  # counters of threads that have exited
+        # Only taken when a thread creates its shard and on scrapes
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                # Servers that start a thread per request would otherwise pile
+                # up shards between scrapes
+                self._reap()
+                self._shards[threading.current_thread()] = shard
+        return shard
+
+    def _reap(self) -> None:
+        """Fold the shards of exited threads into the retired shard; hold _shards_lock."""
+        for thread in [thread for thread in self._shards if not thread.is_alive()]:
+            _merge(self._retired, self._shards.pop(thread))
+
+    def request_started(self) -> None:
+        self._shard().in_flight += 1
+
+    def request_finished(self, method: str, route: str, status: int, duration: float) -> None:
+        shard = self._shard()
+        shard.in_flight -= 1
+        shard.requests[(method, route, status)] += 1
+        histogram = shard.durations.get((method, route))
+        if histogram is None:
+            histogram = shard.durations[(method, route)] = [0] * (len(DURATION_BUCKETS) + 2)
+        histogram[bisect_left(DURATION_BUCKETS, duration)] += 1
+        histogram[-1] += duration
+
+    def render(self) -> str:
+        """Merge every thread's counters into the text exposition format."""
+        totals = _Shard()
+        with self._shards_lock:
+            self._reap()
+            _merge(totals, self._retired)
+            shards = list(self._shards.values())
+        for shard in shards:
+            _merge(totals, shard)
+        in_flight, requests, durations = totals.in_flight, totals.requests, totals.durations
+
+        prefix = f"{self.namespace}_http_request"
+        lines = [
+            f"# HELP {prefix}s_total Total HTTP requests by method, route and status.",
+            f"# TYPE {prefix}s_total counter",
+        ]
+        for (method, route, status), count in sorted(requests.items()):
+            lines.append(
+                f'{prefix}s_total{{method="{method}",route="{_escape(route)}",'
+                f'status="{status}"}} {count}'
+            )
+
+        lines += [
+            f"# HELP {prefix}s_in_flight HTTP requests currently being handled.",
+            f"# TYPE {prefix}s_in_flight gauge",
+            f"{prefix}s_in_flight {in_flight}",
+            f"# HELP {prefix}_duration_seconds HTTP request latency by method and route.",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        for (method, route), histogram in sorted(durations.items()):
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip((*map(str, DURATION_BUCKETS), "+Inf"), histogram[:-1]):
+                cumulative += count
+                lines.append(f'{prefix}_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_duration_seconds_sum{{{labels}}} {histogram[-1]}")
+            lines.append(f"{prefix}_duration_seconds_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _merge(into: _Shard, shard: _Shard) -> None:
+    """Add the counters of shard to into."""
+    into.in_flight += shard.in_flight
+    # list() copies atomically under the GIL while the owner keeps writing
+    for key, count in list(shard.requests.items()):
+        into.requests[key] += count
+    for key, histogram in list(shard.durations.items()):
+        merged = into.durations.setdefault(key, [0] * len(histogram))
+        for i, value in enumerate(list(histogram)):
+            merged[i] += value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
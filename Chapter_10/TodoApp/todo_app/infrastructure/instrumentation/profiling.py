@@ -0,0 +1,169 @@
+"""
+On-demand profiling of single web requests and CLI commands.
+
+A profiled unit of work runs under cProfile and is written to
+<output_dir>/<trace_id>.<timestamp>.pstats, or with the sampling mode its
+stacks are sampled from a background thread and written as collapsed stacks
+(one "frame;frame;frame count" line per stack, ready for flamegraph tools).
+
+Only one profile runs at a time: the interpreter allows a single active
+cProfile, and sampling a second request would skew both. Work arriving while
+a profile is running is simply not profiled.
+"""
+
+import cProfile
+import hmac
+import logging
+import random
+import re
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from typing import Iterator, Optional
+
+from todo_app.infrastructure.config import ProfileMode
+
+logger = logging.getLogger(__name__)
+
+
+class _StackSampler:
+    """Samples one thread's stack at a fixed interval and counts identical stacks."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+class ProfileSession:
+    """A running profile of one request or command; stop() writes it out."""
+
+    def __init__(self, profiler: "Profiler", path_stem: Path):
+        self._profiler = profiler
+        self.path_stem = path_stem
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_StackSampler] = None
+        if profiler.mode is ProfileMode.CPROFILE:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        else:
+            self._sampler = _StackSampler(threading.get_ident(), profiler.sample_interval)
+            self._sampler.start()
+
+    def stop(self) -> Path:
+        """Stop profiling and write the output file, returning its path."""
+        try:
+            if self._cprofile is not None:
+                self._cprofile.disable()
+                path = Path(f"{self.path_stem}.pstats")
+                self._cprofile.dump_stats(path)
+            else:
+                self._sampler.stop()
+                path = Path(f"{self.path_stem}.collapsed")
+                path.write_text(self._sampler.collapsed())
+        finally:
+            self._profiler._release()
+        logger.info("Profile written", extra={"context": {"path": str(path)}})
+        return path
+
+
+class Profiler:
+    """
+    Decides which requests to profile and runs the profiles.
+
+    Args:
+        output_dir: Directory the profiles are written to
+        token: Secret that, sent in the X-Profile-Token header, profiles a request
+        sample_rate: Fraction of requests profiled without a token (0 to 1)
+        mode: cProfile or stack sampling
+        sample_interval: Seconds between stack samples in sampling mode
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        token: Optional[str] = None,
+        sample_rate: float = 0.0,
+        mode: ProfileMode = ProfileMode.CPROFILE,
+        sample_interval: float = 0.001,
+    ):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.token = token
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self._busy = threading.Lock()
+
+    def wants(self, provided_token: Optional[str] = None) -> bool:
+        """Whether a unit of work should be profiled, by token or by sampling."""
+        if self.token and provided_token:
+            return hmac.compare_digest(self.token.encode(), provided_token.encode())
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self, trace_id: str) -> Optional[ProfileSession]:
+        """Start profiling, or return None if another profile is running."""
+        if not self._busy.acquire(blocking=False):
+            logger.info(
+                "Profile skipped, another is running", extra={"context": {"trace_id": trace_id}}
+            )
+            return None
+        try:
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+            # Trace ids can come from request headers, so keep them to a safe file name
+            safe_trace_id = re.sub(r"[^A-Za-z0-9_-]", "_", trace_id)[:64]
+            return ProfileSession(self, self.output_dir / f"{safe_trace_id}.{timestamp}")
+        except ValueError:
+            # cProfile refuses to start while another profiler or debugger is active
+            self._busy.release()
+            logger.warning(
+                "Profile skipped, another profiling tool is active",
+                extra={"context": {"trace_id": trace_id}},
+            )
+            return None
+        except BaseException:
+            self._busy.release()
+            raise
+
+    def _release(self) -> None:
+        self._busy.release()
+
+    @contextmanager
+    def profile(self, trace_id: str) -> Iterator[Optional[ProfileSession]]:
+        session = self.start(trace_id)
+        try:
+            yield session
+        finally:
+            if session is not None:
+                session.stop()
@@ -0,0 +1,185 @@
+"""
+Latency instrumentation for use cases, repositories, controllers and presenters.
+
+Components are instrumented by replacing their public methods on the instance
+with timed wrappers, so no class in the inner layers needs to know about it.
+Every call is added to a per-method latency histogram, and recent calls are
+kept with the trace id they ran under so one request can be broken down by
+layer.
+
+Methods that return a generator (the repositories' ``iter_*`` methods) do their
+work while the generator is consumed, so such calls are recorded when the
+generator is exhausted or closed, and cover the time spent producing items but
+not the time the caller spends between them.
+"""
+
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, TypeVar
+
+from todo_app.infrastructure.instrumentation.wrapping import wrap_public_methods
+from todo_app.infrastructure.logging.trace import trace_id_var
+
+C = TypeVar("C")
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Call count and latency distribution of one instrumented method."""
+
+    def __init__(self, layer: str):
+        self.layer = layer
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        # One extra bucket for calls slower than the last bound
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def observe(self, duration_ms: float, failed: bool) -> None:
+        self.count += 1
+        self.errors += failed
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKET_BOUNDS_MS, self.buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "layer": self.layer,
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip([*map(str, BUCKET_BOUNDS_MS), "+Inf"], self.buckets)),
+        }
+
+
+@dataclass(frozen=True)
+class TimingSample:
+    """One instrumented call."""
+
+    name: str
+    layer: str
+    duration_ms: float
+    trace_id: Optional[str]
+    failed: bool
+
+
+class TimingRegistry:
+    """Collects timings of instrumented calls."""
+
+    def __init__(self, recent_samples: int = 1000):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._recent: Deque[TimingSample] = deque(maxlen=recent_samples)
+        self._lock = threading.Lock()
+
+    def record(self, name: str, layer: str, duration_ms: float, failed: bool = False) -> None:
+        sample = TimingSample(name, layer, duration_ms, trace_id_var.get(), failed)
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram(layer)
+            histogram.observe(duration_ms, failed)
+            self._recent.append(sample)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregates per instrumented method, slowest total time first."""
+        with self._lock:
+            ranked = sorted(self._histograms.items(), key=lambda item: -item[1].total_ms)
+            return {name: histogram.summary() for name, histogram in ranked}
+
+    def layer_totals(self) -> Dict[str, Dict[str, float]]:
+        """Call counts and total time per layer."""
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for histogram in self._histograms.values():
+                layer = totals.setdefault(histogram.layer, {"count": 0, "total_ms": 0.0})
+                layer["count"] += histogram.count
+                layer["total_ms"] = round(layer["total_ms"] + histogram.total_ms, 3)
+        return totals
+
+    def samples_for_trace(self, trace_id: str) -> List[TimingSample]:
+        """Recent calls made while handling the given trace id, oldest first."""
+        with self._lock:
+            return [sample for sample in self._recent if sample.trace_id == trace_id]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._recent.clear()
+
+
+def timed(func: Callable, name: str, layer: str, registry: TimingRegistry) -> Callable:
+    """Wrap a callable so each call is recorded in the registry."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            registry.record(name, layer, (time.perf_counter() - start) * 1000, True)
+            raise
+        elapsed = time.perf_counter() - start
+        if inspect.isgenerator(result):
+            return _timed_generator(result, name, layer, registry, elapsed)
+        registry.record(name, layer, elapsed * 1000, False)
+        return result
+
+    return wrapper
+
+
+def _timed_generator(
+    generator: Generator, name: str, layer: str, registry: TimingRegistry, elapsed: float
+) -> Generator:
+    """Pass a generator's items through, recording the time spent producing them."""
+    failed = False
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                elapsed += time.perf_counter() - start
+            yield item
+    finally:
+        generator.close()
+        registry.record(name, layer, elapsed * 1000, failed)
+
+
+def instrument(component: C, layer: str, registry: TimingRegistry) -> C:
+    """
+    Time every public method of a component instance.
+
+    Instrumenting the same instance twice has no effect.
+    """
+    return wrap_public_methods(
+        component, "__timed__", lambda method, name: timed(method, name, layer, registry)
+    )
@@ -0,0 +1,226 @@
+"""
+Span tracing on top of the request trace id.
+
+A span covers one controller, use case, repository or notification call (or a
+whole web request) and records when it started and ended, which span it ran
+inside, and a few attributes. Spans share the trace id from
+todo_app.infrastructure.logging.trace, so they line up with the log records
+of the same request, and are written in batches to a JSONL file.
+"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from todo_app.infrastructure.instrumentation.wrapping import wrap_public_methods
+from todo_app.infrastructure.logging.trace import get_trace_id
+
+logger = logging.getLogger(__name__)
+
+# version-trace_id-parent_id-flags, see https://www.w3.org/TR/trace-context/
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Return (trace_id, parent_span_id) from a W3C traceparent header, if valid."""
+    match = _TRACEPARENT.match((header or "").strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(1), match.group(2)
+
+
+def format_traceparent(trace_id: str, span_id: str) -> Optional[str]:
+    """Build a traceparent header, or None if the trace id is not W3C-shaped."""
+    trace_hex = trace_id.replace("-", "").lower()
+    if not re.fullmatch(r"[0-9a-f]{32}", trace_hex):
+        return None
+    return f"00-{trace_hex}-{span_id}-01"
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    layer: str
+    start_time: float  # seconds since the epoch
+    end_time: Optional[float] = None
+    duration_ms: Optional[float] = None
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    _started: float = field(default=0.0, repr=False)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        del data["_started"]
+        return data
+
+
+# The innermost open span of the current context
+current_span_var: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class JsonlSpanExporter:
+    """
+    Buffers finished spans and appends them to a JSONL file in batches.
+
+    A background thread writes a batch once max_batch spans are waiting or
+    flush_interval seconds have passed, so request threads never touch the file.
+    """
+
+    def __init__(self, path: Path, max_batch: int = 256, flush_interval: float = 2.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: List[Span] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._worker.start()
+        atexit.register(self.shutdown)
+
+    def export(self, span: Span) -> None:
+        with self._condition:
+            self._pending.append(span)
+            if len(self._pending) >= self.max_batch:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Write every pending span now."""
+        with self._condition:
+            batch, self._pending = self._pending, []
+        self._write(batch)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._worker.join(timeout=5)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if len(self._pending) < self.max_batch and not self._closed:
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+                batch, self._pending = self._pending, []
+            self._write(batch)
+
+    def _write(self, batch: List[Span]) -> None:
+        if not batch:
+            return
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in batch)
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            logger.exception("Failed to export spans", extra={"context": {"path": str(self.path)}})
+
+
+class Tracer:
+    """Creates spans nested under the current span and hands finished ones to the exporter."""
+
+    def __init__(self, exporter: JsonlSpanExporter):
+        self.exporter = exporter
+
+    def begin(
+        self,
+        name: str,
+        layer: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent_id: Optional[str] = None,
+    ) -> Tuple[Span, Token]:
+        """
+        Open a span and make it current; close it with end().
+
+        parent_id overrides the current span as parent, e.g. for a span id
+        received in a traceparent header.
+        """
+        parent = current_span_var.get()
+        span = Span(
+            trace_id=get_trace_id(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id or (parent.span_id if parent else None),
+            name=name,
+            layer=layer,
+            start_time=time.time(),
+            attributes=dict(attributes or {}),
+            _started=time.perf_counter(),
+        )
+        return span, current_span_var.set(span)
+
+    def end(self, span: Span, token: Token, error: Optional[BaseException] = None) -> None:
+        span.duration_ms = round((time.perf_counter() - span._started) * 1000, 3)
+        span.end_time = span.start_time + span.duration_ms / 1000
+        if error is not None:
+            span.status = "error"
+            span.attributes["error.type"] = type(error).__name__
+        current_span_var.reset(token)
+        self.exporter.export(span)
+
+    @contextmanager
+    def span(
+        self, name: str, layer: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Span]:
+        span, token = self.begin(name, layer, attributes)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, token, e)
+            raise
+        self.end(span, token)
+
+
+def traced(func: Callable, name: str, layer: str, tracer: Tracer) -> Callable:
+    """Wrap a callable so each call runs in its own span."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.span(name, layer, _call_attributes(args)) as span:
+            result = func(*args, **kwargs)
+            # Use cases and controllers report failures in a result rather than raising
+            if getattr(result, "is_success", True) is False:
+                code = result.error.code
+                span.status = "error"
+                span.set_attribute("error.code", getattr(code, "value", code))
+            return result
+
+    return wrapper
+
+
+def _call_attributes(args: tuple) -> Dict[str, Any]:
+    """Ids of the entities a call works on; other arguments are left out of the trace."""
+    attributes = {}
+    for i, arg in enumerate(args):
+        if isinstance(arg, UUID):
+            attributes[f"arg.{i}"] = str(arg)
+        elif isinstance(getattr(arg, "id", None), UUID):
+            attributes[f"arg.{i}.{type(arg).__name__.lower()}_id"] = str(arg.id)
+    return attributes
+
+
+def trace_component(component: Any, layer: str, tracer: Tracer) -> Any:
+    """Run every public method of a component instance in a span."""
+    return wrap_public_methods(
+        component, "__traced__", lambda method, name: traced(method, name, layer, tracer)
+    )
@@ -0,0 +1,32 @@
+"""
+Helper for decorating the methods of an already constructed component.
+"""
+
+from typing import Callable, TypeVar
+
+C = TypeVar("C")
+
+
+def wrap_public_methods(
+    component: C, marker: str, wrap: Callable[[Callable, str], Callable]
+) -> C:
+    """
+    Replace each public bound method of a component with wrap(method, name).
+
+    The wrappers are set as instance attributes, shadowing the class methods for
+    this instance only; name is "ClassName.method". Wrappers are tagged with the
+    marker attribute, and methods already carrying it are left alone.
+    """
+    component_name = type(component).__name__
+    for attr in dir(component):
+        if attr.startswith("_"):
+            continue
+        method = getattr(component, attr, None)
+        if not callable(method) or getattr(method, marker, False):
+            continue
+        if not hasattr(method, "__self__"):
+            continue  # not a bound method, e.g. a stored callable or class
+        wrapper = wrap(method, f"{component_name}.{attr}")
+        setattr(wrapper, marker, True)
+        setattr(component, attr, wrapper)
+    return component
@@ -15,6 +15,7 @@ demonstrating how Clean Architecture enables swapping notification mechanisms
 while maintaining core functionality.
 """
 
+from collections import deque
 from dataclasses import dataclass
 from todo_app.domain.entities.task import Task
 from todo_app.application.service_ports.notifications import NotificationPort
@@ -34,10 +35,20 @@ class NotificationRecorder(NotificationPort):
     in actual notification service implementations.
     """
 
-    def __init__(self) -> None:
-        self.completed_tasks = []
-        self.high_priority_tasks = []
-        self.deadline_warnings = []
+    # Only the most recent notifications of each kind are kept, so a long-running
+    # app does not grow without bound
+    DEFAULT_MAX_RECORDS = 1000
+
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS) -> None:
+        self.completed_tasks = deque(maxlen=max_records)
+        self.high_priority_tasks = deque(maxlen=max_records)
+        self.deadline_warnings = deque(maxlen=max_records)
+
+    def __len__(self) -> int:
+        """Number of notifications currently recorded."""
+        return sum(
+            map(len, (self.completed_tasks, self.high_priority_tasks, self.deadline_warnings))
+        )
 
     def notify_task_completed(self, task: Task) -> None:
         """Record a task completion notification."""
@@ -0,0 +1,242 @@
+"""
+Caching decorators for any TaskRepository or ProjectRepository implementation.
+
+Entities are cached by id in an LRU cache with a time-to-live and optional
+entry and size limits. Saves and deletes go straight to the wrapped repository
+and invalidate the affected entries. Cache hits hand out copies, so changes
+to a returned entity only take effect when it is saved.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Iterator, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+
+T = TypeVar("T")
+
+# Called with (task_id, project_id) when a task changes; project_id is None if unknown
+TaskChangeListener = Callable[[UUID, Optional[UUID]], None]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int
+    misses: int
+    evictions: int  # entries dropped to stay within the entry or byte limit
+    expirations: int  # entries dropped because their TTL passed
+    invalidations: int  # entries dropped because the entity was saved or deleted
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    expires_at: float
+    size: int
+
+
+class LruTtlCache(Generic[T]):
+    """
+    Thread-safe LRU cache with per-entry expiry.
+
+    Args:
+        max_entries: Maximum number of cached values
+        ttl_seconds: How long a value may be served after it was cached
+        max_bytes: Optional limit on the total pickled size of cached values
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry[T]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._drop(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def peek(self, key: Hashable) -> Optional[T]:
+        """Return a cached value, expired or not, without counting a lookup."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.value if entry else None
+
+    def put(self, key: Hashable, value: T) -> None:
+        # Sizing pickles the value, so only pay for it when a byte limit is set
+        size = len(pickle.dumps(value)) if self.max_bytes else 0
+        if self.max_bytes and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(value, time.monotonic() + self.ttl_seconds, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes and self._bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _drop(self, key: Hashable) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+
+class CachingTaskRepository(TaskRepository):
+    """TaskRepository decorator caching tasks by id."""
+
+    def __init__(self, inner: TaskRepository, cache: LruTtlCache[Task]):
+        self.inner = inner
+        self.cache = cache
+        self._listeners: List[TaskChangeListener] = []
+
+    def add_change_listener(self, listener: TaskChangeListener) -> None:
+        """Register a callback invoked after a task is saved or deleted."""
+        self._listeners.append(listener)
+
+    def _changed(self, task_id: UUID, project_id: Optional[UUID]) -> None:
+        self.cache.invalidate(task_id)
+        for listener in self._listeners:
+            listener(task_id, project_id)
+
+    def get(self, task_id: UUID) -> Task:
+        task = self.cache.get(task_id)
+        if task is None:
+            task = self.inner.get(task_id)
+            self.cache.put(task_id, deepcopy(task))
+            return task
+        return deepcopy(task)
+
+    def save(self, task: Task) -> None:
+        previous = self.cache.peek(task.id)
+        try:
+            self.inner.save(task)
+        finally:
+            # Also on failure: after a ConcurrentModificationError the cached copy may be
+            # the stale one, and the caller's retry must re-read storage
+            self._changed(task.id, task.project_id)
+            if previous is not None and previous.project_id != task.project_id:
+                self._changed(task.id, previous.project_id)
+
+    def delete(self, task_id: UUID) -> None:
+        cached = self.cache.peek(task_id)
+        self.inner.delete(task_id)
+        self._changed(task_id, cached.project_id if cached else None)
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+        return self.inner.find_by_project(project_id)
+
+    def get_active_tasks(self) -> Sequence[Task]:
+        return self.inner.get_active_tasks()
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        return self.inner.iter_by_project(project_id)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        return self.inner.iter_active_tasks()
+
+
+class CachingProjectRepository(ProjectRepository):
+    """
+    ProjectRepository decorator caching projects, with their tasks, by id.
+
+    Cached projects include their tasks, so task changes made through a
+    CachingTaskRepository invalidate the owning project as well.
+    """
+
+    def __init__(self, inner: ProjectRepository, cache: LruTtlCache[Project]):
+        self.inner = inner
+        self.cache = cache
+
+    def set_task_repository(self, task_repo: TaskRepository) -> None:
+        self.inner.set_task_repository(task_repo)
+        # The caching task repository may itself be wrapped, e.g. by the identity map
+        while not isinstance(task_repo, CachingTaskRepository) and hasattr(task_repo, "inner"):
+            task_repo = task_repo.inner
+        if isinstance(task_repo, CachingTaskRepository):
+            task_repo.add_change_listener(self._task_changed)
+
+    def _task_changed(self, task_id: UUID, project_id: Optional[UUID]) -> None:
+        if project_id is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(project_id)
+
+    def get(self, project_id: UUID) -> Project:
+        project = self.cache.get(project_id)
+        if project is None:
+            project = self.inner.get(project_id)
+            self.cache.put(project_id, deepcopy(project))
+            return project
+        return deepcopy(project)
+
+    def get_all(self) -> list[Project]:
+        return self.inner.get_all()
+
+    def save(self, project: Project) -> None:
+        try:
+            self.inner.save(project)
+        finally:
+            self.cache.invalidate(project.id)
+
+    def delete(self, project_id: UUID) -> None:
+        self.inner.delete(project_id)
+        self.cache.invalidate(project_id)
+
+    def get_inbox(self) -> Project:
+        return self.inner.get_inbox()
@@ -1,11 +1,13 @@
 """
-JSON file-based repository implementation.
+File-based repository implementation, storing JSON by default.
+
+Reads hold a shared lock and read-modify-write sequences an exclusive lock on
+each data file, so several processes can safely share one data directory.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 from uuid import UUID
 
 from todo_app.domain.entities.task import Task
@@ -14,42 +16,41 @@ from todo_app.domain.exceptions import TaskNotFoundError, ProjectNotFoundError,
 from todo_app.domain.value_objects import ProjectType, TaskStatus, ProjectStatus, Priority, Deadline
 from todo_app.application.repositories.task_repository import TaskRepository
 from todo_app.application.repositories.project_repository import ProjectRepository
-
-
-class JsonEncoder(json.JSONEncoder):
-    """Custom JSON encoder for domain objects."""
-
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, (TaskStatus, ProjectStatus, Priority)):
-            return obj.name
-        return super().default(obj)
+from todo_app.infrastructure.persistence.locking import FileLock, atomic_write
+from todo_app.infrastructure.persistence.serializers import JsonSerializer, RecordSerializer
+from todo_app.infrastructure.persistence.versioning import versioned_save
 
 
 class FileTaskRepository(TaskRepository):
     """JSON file-based implementation of TaskRepository."""
 
-    def __init__(self, data_dir: Path):
-        self.tasks_file = data_dir / "tasks.json"
+    def __init__(self, data_dir: Path, serializer: Optional[RecordSerializer] = None):
+        self.serializer = serializer or JsonSerializer()
+        self.tasks_file = data_dir / f"tasks{self.serializer.suffix}"
+        self._lock = FileLock(self.tasks_file)
         self._ensure_file_exists()
 
     def _ensure_file_exists(self) -> None:
         """Create the tasks file if it doesn't exist."""
-        if not self.tasks_file.exists():
-            self.tasks_file.write_text("[]")
+        with self._lock.exclusive():
+            if not self.tasks_file.exists():
+                atomic_write(self.tasks_file, self.serializer.dumps([]))
 
     def _load_tasks(self) -> list[Dict[str, Any]]:
-        """Load all tasks from the JSON file."""
-        return json.loads(self.tasks_file.read_text())
+        """Load all tasks from the data file."""
+        with self._lock.shared():
+            return self._read_tasks()
+
+    def _read_tasks(self) -> list[Dict[str, Any]]:
+        """Read the data file; the caller must hold the lock."""
+        return self.serializer.loads(self.tasks_file.read_bytes())
 
     def _save_tasks(self, tasks: list[Dict[str, Any]]) -> None:
-        """Save tasks to the JSON file."""
-        self.tasks_file.write_text(json.dumps(tasks, indent=2, cls=JsonEncoder))
+        """Save tasks to the data file; the caller must hold the exclusive lock."""
+        atomic_write(self.tasks_file, self.serializer.dumps(tasks))
 
-    def _task_to_dict(self, task: Task) -> Dict[str, Any]:
+    @staticmethod
+    def _task_to_dict(task: Task) -> Dict[str, Any]:
         """Convert a Task entity to a dictionary for JSON storage."""
         return {
             "id": task.id,
@@ -61,9 +62,12 @@ class FileTaskRepository(TaskRepository):
             "status": task.status.name,
             "completed_at": task.completed_at,
             "completion_notes": task.completion_notes,
+            "version": task.version,
+            "updated_at": task.updated_at,
         }
 
-    def _dict_to_task(self, data: Dict[str, Any]) -> Task:
+    @staticmethod
+    def _dict_to_task(data: Dict[str, Any]) -> Task:
         """Convert a dictionary to a Task entity."""
         # Create task with required attributes
         task = Task(
@@ -80,6 +84,10 @@ class FileTaskRepository(TaskRepository):
         if data["completed_at"]:
             task.completed_at = datetime.fromisoformat(data["completed_at"])
         task.completion_notes = data["completion_notes"]
+        # Records written before versioning was introduced default to version 0
+        task.version = data.get("version", 0)
+        if data.get("updated_at"):
+            task.updated_at = datetime.fromisoformat(data["updated_at"])
 
         # Explicitly set ID to maintain consistency
         task.id = UUID(data["id"])
@@ -95,27 +103,29 @@ class FileTaskRepository(TaskRepository):
         raise TaskNotFoundError(task_id)
 
     def save(self, task: Task) -> None:
-        """Save a task."""
-        tasks = self._load_tasks()
-
-        # Update existing task or append new one
-        updated = False
-        for i, task_data in enumerate(tasks):
-            if UUID(task_data["id"]) == task.id:
-                tasks[i] = self._task_to_dict(task)
-                updated = True
-                break
-
-        if not updated:
-            tasks.append(self._task_to_dict(task))
-
-        self._save_tasks(tasks)
+        """Save a task, rejecting it if the stored copy has a different version."""
+        with self._lock.exclusive():
+            tasks = self._read_tasks()
+
+            # Locate the stored copy, if any, to compare versions
+            index = next(
+                (i for i, task_data in enumerate(tasks) if UUID(task_data["id"]) == task.id), None
+            )
+            stored_version = tasks[index].get("version", 0) if index is not None else 0
+
+            with versioned_save(task, stored_version):
+                if index is not None:
+                    tasks[index] = self._task_to_dict(task)
+                else:
+                    tasks.append(self._task_to_dict(task))
+                self._save_tasks(tasks)
 
     def delete(self, task_id: UUID) -> None:
         """Delete a task."""
-        tasks = self._load_tasks()
-        tasks = [t for t in tasks if UUID(t["id"]) != task_id]
-        self._save_tasks(tasks)
+        with self._lock.exclusive():
+            tasks = self._read_tasks()
+            tasks = [t for t in tasks if UUID(t["id"]) != task_id]
+            self._save_tasks(tasks)
 
     def find_by_project(self, project_id: UUID) -> Sequence[Task]:
         """Find all tasks for a project."""
@@ -127,12 +137,36 @@ class FileTaskRepository(TaskRepository):
         tasks = self._load_tasks()
         return [self._dict_to_task(t) for t in tasks if t["status"] != TaskStatus.DONE.name]
 
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        """
+        Yield a project's tasks, building each entity only as it is consumed.
+
+        The data file is still read and decoded in full; only entity
+        construction is lazy. Use the sharded or mapped backend to bound memory.
+        """
+        for task_data in self._load_tasks():
+            if UUID(task_data["project_id"]) == project_id:
+                yield self._dict_to_task(task_data)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        """
+        Yield non-completed tasks, building each entity only as it is consumed.
+
+        The data file is still read and decoded in full; only entity
+        construction is lazy. Use the sharded or mapped backend to bound memory.
+        """
+        for task_data in self._load_tasks():
+            if task_data["status"] != TaskStatus.DONE.name:
+                yield self._dict_to_task(task_data)
+
 
 class FileProjectRepository(ProjectRepository):
     """JSON file-based implementation of ProjectRepository."""
 
-    def __init__(self, data_dir: Path):
-        self.projects_file = data_dir / "projects.json"
+    def __init__(self, data_dir: Path, serializer: Optional[RecordSerializer] = None):
+        self.serializer = serializer or JsonSerializer()
+        self.projects_file = data_dir / f"projects{self.serializer.suffix}"
+        self._lock = FileLock(self.projects_file)
         self._ensure_file_exists()
         self._task_repo = None
 
@@ -141,28 +175,43 @@ class FileProjectRepository(ProjectRepository):
         The key is that while INBOX's existence is guaranteed by 
         infrastructure, its behavior and rules remain in the domain layer.
         """
-        inbox = self._fetch_inbox()
-        if not inbox:
-            inbox = Project.create_inbox()
-            self.save(inbox)
+        self._ensure_inbox()
 
     def set_task_repository(self, task_repo: TaskRepository) -> None:
         self._task_repo = task_repo
 
     def _ensure_file_exists(self) -> None:
         """Create the projects file if it doesn't exist."""
-        if not self.projects_file.exists():
-            self.projects_file.write_text("[]")
+        with self._lock.exclusive():
+            if not self.projects_file.exists():
+                atomic_write(self.projects_file, self.serializer.dumps([]))
+
+    def _ensure_inbox(self) -> None:
+        """Create the INBOX unless it exists; checked and created under one lock."""
+        with self._lock.exclusive():
+            projects = self._read_projects()
+            if any(p.get("project_type") == ProjectType.INBOX.name for p in projects):
+                return
+            inbox = Project.create_inbox()
+            with versioned_save(inbox, 0):
+                projects.append(self._project_to_dict(inbox))
+                self._save_projects(projects)
 
     def _load_projects(self) -> list[Dict[str, Any]]:
-        """Load all projects from the JSON file."""
-        return json.loads(self.projects_file.read_text())
+        """Load all projects from the data file."""
+        with self._lock.shared():
+            return self._read_projects()
+
+    def _read_projects(self) -> list[Dict[str, Any]]:
+        """Read the data file; the caller must hold the lock."""
+        return self.serializer.loads(self.projects_file.read_bytes())
 
     def _save_projects(self, projects: list[Dict[str, Any]]) -> None:
-        """Save projects to the JSON file."""
-        self.projects_file.write_text(json.dumps(projects, indent=2, cls=JsonEncoder))
+        """Save projects to the data file; the caller must hold the exclusive lock."""
+        atomic_write(self.projects_file, self.serializer.dumps(projects))
 
-    def _project_to_dict(self, project: Project) -> Dict[str, Any]:
+    @staticmethod
+    def _project_to_dict(project: Project) -> Dict[str, Any]:
         """Convert a Project entity to a dictionary for JSON storage."""
         return {
             "id": project.id,
@@ -172,9 +221,12 @@ class FileProjectRepository(ProjectRepository):
             "status": project.status.name,
             "completed_at": project.completed_at,
             "completion_notes": project.completion_notes,
+            "version": project.version,
+            "updated_at": project.updated_at,
         }
 
-    def _dict_to_project(self, data: Dict[str, Any]) -> Project:
+    @staticmethod
+    def _dict_to_project(data: Dict[str, Any]) -> Project:
         """Convert a dictionary to a Project entity."""
         # Handle INBOX project specially
         if data.get("project_type") == ProjectType.INBOX.name:
@@ -187,6 +239,9 @@ class FileProjectRepository(ProjectRepository):
         if data["completed_at"]:
             project.completed_at = datetime.fromisoformat(data["completed_at"])
         project.completion_notes = data["completion_notes"]
+        project.version = data.get("version", 0)
+        if data.get("updated_at"):
+            project.updated_at = datetime.fromisoformat(data["updated_at"])
 
         # Explicitly set ID to maintain consistency
         project.id = UUID(data["id"])
@@ -215,21 +270,22 @@ class FileProjectRepository(ProjectRepository):
         return projects
 
     def save(self, project: Project) -> None:
-        """Save a project and its tasks."""
-        projects = self._load_projects()
-
-        # Update existing project or append new one
-        updated = False
-        for i, project_data in enumerate(projects):
-            if UUID(project_data["id"]) == project.id:
-                projects[i] = self._project_to_dict(project)
-                updated = True
-                break
-
-        if not updated:
-            projects.append(self._project_to_dict(project))
-
-        self._save_projects(projects)
+        """Save a project and its tasks, rejecting stale versions."""
+        with self._lock.exclusive():
+            projects = self._read_projects()
+
+            # Locate the stored copy, if any, to compare versions
+            index = next(
+                (i for i, data in enumerate(projects) if UUID(data["id"]) == project.id), None
+            )
+            stored_version = projects[index].get("version", 0) if index is not None else 0
+
+            with versioned_save(project, stored_version):
+                if index is not None:
+                    projects[index] = self._project_to_dict(project)
+                else:
+                    projects.append(self._project_to_dict(project))
+                self._save_projects(projects)
 
         # Save associated tasks
         for task in project.tasks:
@@ -242,9 +298,10 @@ class FileProjectRepository(ProjectRepository):
             self._task_repo.delete(task.id)
 
         # Then delete the project
-        projects = self._load_projects()
-        projects = [p for p in projects if UUID(p["id"]) != project_id]
-        self._save_projects(projects)
+        with self._lock.exclusive():
+            projects = self._read_projects()
+            projects = [p for p in projects if UUID(p["id"]) != project_id]
+            self._save_projects(projects)
 
     def _fetch_inbox(self) -> Optional[Project]:
         """Find the INBOX project."""
@@ -0,0 +1,168 @@
+"""
+Request-scoped identity map for repository reads.
+
+While a scope is active (one per web request), every entity loaded through the
+wrapped repositories is registered under its type and id, and later loads in
+the same scope return that same instance instead of hydrating a new one.
+Outside a scope the wrappers simply delegate.
+"""
+
+from contextvars import ContextVar, Token
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+from uuid import UUID
+
+from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.domain.entities.entity import Entity
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+
+E = TypeVar("E", bound=Entity)
+
+
+class IdentityMap:
+    """Entities loaded in the current scope, keyed by (entity type, id)."""
+
+    def __init__(self) -> None:
+        self._entities: Dict[Tuple[type, UUID], Entity] = {}
+
+    def get(self, entity_type: Type[E], entity_id: UUID) -> Optional[E]:
+        return self._entities.get((entity_type, entity_id))  # type: ignore[return-value]
+
+    def add(self, entity: E) -> E:
+        """Register an entity, returning the instance already mapped for its id if any."""
+        return self._entities.setdefault((type(entity), entity.id), entity)  # type: ignore
+
+    def replace(self, entity: Entity) -> None:
+        self._entities[(type(entity), entity.id)] = entity
+
+    def discard(self, entity_type: type, entity_id: UUID) -> None:
+        self._entities.pop((entity_type, entity_id), None)
+
+    def discard_all(self, entity_type: type) -> None:
+        for key in [key for key in self._entities if key[0] is entity_type]:
+            del self._entities[key]
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+# Context variable so concurrent requests (threads or tasks) each see their own map
+identity_map_var: ContextVar[Optional[IdentityMap]] = ContextVar("identity_map", default=None)
+
+
+def begin_identity_scope() -> Token:
+    """Start a new identity map for the current context; pass the token to end it."""
+    return identity_map_var.set(IdentityMap())
+
+
+def end_identity_scope(token: Token) -> None:
+    """Drop the identity map started with begin_identity_scope."""
+    identity_map_var.reset(token)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    return identity_map_var.get()
+
+
+def _canonical(entities: Iterable[E]) -> List[E]:
+    identity_map = current_identity_map()
+    if identity_map is None:
+        return list(entities)
+    return [identity_map.add(entity) for entity in entities]
+
+
+class IdentityMapTaskRepository(TaskRepository):
+    """TaskRepository decorator consulting the current identity map."""
+
+    def __init__(self, inner: TaskRepository):
+        self.inner = inner
+
+    def get(self, task_id: UUID) -> Task:
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return self.inner.get(task_id)
+        task = identity_map.get(Task, task_id)
+        if task is None:
+            task = identity_map.add(self.inner.get(task_id))
+        return task
+
+    def save(self, task: Task) -> None:
+        identity_map = current_identity_map()
+        try:
+            self.inner.save(task)
+        except Exception:
+            # A failed save (e.g. a version conflict) leaves the mapped instance suspect
+            if identity_map is not None:
+                identity_map.discard(Task, task.id)
+            raise
+        if identity_map is not None:
+            identity_map.replace(task)
+            # The owning project's task list may have changed
+            identity_map.discard(Project, task.project_id)
+
+    def delete(self, task_id: UUID) -> None:
+        self.inner.delete(task_id)
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            task = identity_map.get(Task, task_id)
+            identity_map.discard(Task, task_id)
+            if task is not None:
+                identity_map.discard(Project, task.project_id)
+            else:
+                identity_map.discard_all(Project)
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+        return _canonical(self.inner.find_by_project(project_id))
+
+    def get_active_tasks(self) -> Sequence[Task]:
+        return _canonical(self.inner.get_active_tasks())
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        # Streams are not registered, so the map does not grow with them
+        return self.inner.iter_by_project(project_id)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        return self.inner.iter_active_tasks()
+
+
+class IdentityMapProjectRepository(ProjectRepository):
+    """ProjectRepository decorator consulting the current identity map."""
+
+    def __init__(self, inner: ProjectRepository):
+        self.inner = inner
+
+    def set_task_repository(self, task_repo: TaskRepository) -> None:
+        self.inner.set_task_repository(task_repo)
+
+    def get(self, project_id: UUID) -> Project:
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return self.inner.get(project_id)
+        project = identity_map.get(Project, project_id)
+        if project is None:
+            project = identity_map.add(self.inner.get(project_id))
+        return project
+
+    def get_all(self) -> list[Project]:
+        return _canonical(self.inner.get_all())
+
+    def save(self, project: Project) -> None:
+        identity_map = current_identity_map()
+        try:
+            self.inner.save(project)
+        except Exception:
+            if identity_map is not None:
+                identity_map.discard(Project, project.id)
+            raise
+        if identity_map is not None:
+            identity_map.replace(project)
+
+    def delete(self, project_id: UUID) -> None:
+        self.inner.delete(project_id)
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            identity_map.discard(Project, project_id)
+
+    def get_inbox(self) -> Project:
+        return _canonical([self.inner.get_inbox()])[0]
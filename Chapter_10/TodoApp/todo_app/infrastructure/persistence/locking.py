@@ -0,0 +1,97 @@
+"""
+Cross-process file locking and atomic writes for the file-based repositories.
+
+Several processes (e.g. web workers) may share one data directory. Readers take
+a shared lock and writers an exclusive lock on a sidecar ``.lock`` file; the
+data file itself cannot carry the lock because atomic writes replace it with a
+new inode. Writes go to a temporary file in the same directory, are fsynced and
+then renamed over the original so readers never observe a half-written file.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = getLogger(__name__)
+
+if fcntl is None:  # pragma: no cover
+    logger.warning("fcntl is unavailable; file repositories are not safe across processes")
+
+
+class FileLock:
+    """
+    Reader/writer lock backed by flock(2) on a sidecar lock file.
+
+    Each acquisition opens its own file descriptor, so the lock also serializes
+    threads within one process. Locks are not reentrant: code holding the
+    exclusive lock must not try to take the lock again.
+    """
+
+    def __init__(self, data_file: Path):
+        self.path = data_file.with_name(data_file.name + ".lock")
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the lock for reading; other readers may hold it concurrently."""
+        with self._acquire(fcntl.LOCK_SH if fcntl else None):
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the lock for a read-modify-write sequence."""
+        with self._acquire(fcntl.LOCK_EX if fcntl else None):
+            yield
+
+    @contextmanager
+    def _acquire(self, operation) -> Iterator[None]:
+        if operation is None:  # pragma: no cover
+            yield
+            return
+        with open(self.path, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: Path, content: Union[str, bytes]) -> None:
+    """
+    Replace a file's content so readers see either the old or the new version.
+
+    The content is written to a temporary file next to the target, flushed to
+    disk and renamed over the target.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(content.encode() if isinstance(content, str) else content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist the rename itself; not supported on every platform."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # pragma: no cover
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,126 @@
+"""
+Memory-mapped read path for binary task files.
+
+The binary format stores an id->offset table sorted by id, so a task can be
+found by binary search over the mapped table and decoded on its own. Nothing is
+read into memory up front: a cold get() touches the header, a handful of index
+pages and one record.
+"""
+
+import mmap
+import os
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.serializers import BinarySerializer
+
+
+@dataclass(frozen=True)
+class _Mapping:
+    """An open mapping of one version of the data file."""
+
+    data: mmap.mmap
+    identity: tuple[int, int, int]  # (inode, mtime_ns, size)
+    field_names: List[str]
+    index_start: int
+    count: int
+
+
+class _IndexKeys(Sequence[bytes]):
+    """The id column of the mapped offset table, for bisect."""
+
+    def __init__(self, mapping: _Mapping):
+        self._mapping = mapping
+
+    def __len__(self) -> int:
+        return self._mapping.count
+
+    def __getitem__(self, i: int) -> bytes:
+        start = self._mapping.index_start + i * BinarySerializer.INDEX_ENTRY.size
+        return self._mapping.data[start : start + 16]
+
+
+class MappedBinaryTaskRepository(FileTaskRepository):
+    """
+    Binary file task repository that reads through a memory map.
+
+    Writes are inherited from FileTaskRepository. Because they replace the file
+    atomically, a mapping always shows one consistent version; it is re-opened
+    when the file's inode, modification time or size changes.
+    """
+
+    def __init__(self, data_dir: Path):
+        super().__init__(data_dir, BinarySerializer())
+        self._mapping: Optional[_Mapping] = None
+
+    def _current_mapping(self) -> _Mapping:
+        stat = os.stat(self.tasks_file)
+        mapping = self._mapping
+        if mapping and mapping.identity == (stat.st_ino, stat.st_mtime_ns, stat.st_size):
+            return mapping
+
+        with open(self.tasks_file, "rb") as f:
+            # Identify the file actually opened, which may be newer than the stat above
+            stat = os.fstat(f.fileno())
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        field_names, index_start, count = self.serializer.read_header(data)
+        # The previous mapping is closed when the last reader drops it
+        self._mapping = _Mapping(
+            data, (stat.st_ino, stat.st_mtime_ns, stat.st_size), field_names, index_start, count
+        )
+        return self._mapping
+
+    def _find_record(self, task_id: UUID) -> Optional[Dict[str, Any]]:
+        mapping = self._current_mapping()
+        keys = _IndexKeys(mapping)
+        i = bisect_left(keys, task_id.bytes)
+        if i == len(keys) or keys[i] != task_id.bytes:
+            return None
+        entry = mapping.index_start + i * BinarySerializer.INDEX_ENTRY.size
+        _, offset = BinarySerializer.INDEX_ENTRY.unpack_from(mapping.data, entry)
+        record, _ = self.serializer.decode_record(mapping.data, offset, mapping.field_names)
+        return record
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        mapping = self._current_mapping()
+        offset = mapping.index_start + mapping.count * BinarySerializer.INDEX_ENTRY.size
+        for _ in range(mapping.count):
+            record, offset = self.serializer.decode_record(
+                mapping.data, offset, mapping.field_names
+            )
+            yield record
+
+    def get(self, task_id: UUID) -> Task:
+        """Retrieve a task by ID, decoding only that task."""
+        record = self._find_record(task_id)
+        if record is None:
+            raise TaskNotFoundError(task_id)
+        return self._dict_to_task(record)
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+        """Find all tasks for a project."""
+        return list(self.iter_by_project(project_id))
+
+    def get_active_tasks(self) -> Sequence[Task]:
+        """Get all non-completed tasks."""
+        return list(self.iter_active_tasks())
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        """Stream a project's tasks, decoding records from the mapping one at a time."""
+        project_key = str(project_id)
+        for task_data in self._iter_records():
+            if task_data["project_id"] == project_key:
+                yield self._dict_to_task(task_data)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        """Stream non-completed tasks, decoding records from the mapping one at a time."""
+        for task_data in self._iter_records():
+            if task_data["status"] != TaskStatus.DONE.name:
+                yield self._dict_to_task(task_data)
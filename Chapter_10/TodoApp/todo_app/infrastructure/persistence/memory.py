@@ -8,6 +8,7 @@ from todo_app.domain.entities.task import Task
 from todo_app.domain.value_objects import TaskStatus, ProjectType
 from todo_app.application.repositories.project_repository import ProjectRepository
 from todo_app.domain.exceptions import InboxNotFoundError, ProjectNotFoundError, TaskNotFoundError
+from todo_app.infrastructure.persistence.versioning import versioned_save
 
 logger = getLogger(__name__)
 
@@ -18,6 +19,10 @@ class InMemoryTaskRepository(TaskRepository):
     def __init__(self) -> None:
         self._tasks: Dict[UUID, Task] = {}
 
+    def __len__(self) -> int:
+        """Number of tasks held in memory."""
+        return len(self._tasks)
+
     def get(self, task_id: UUID) -> Task:
         """
         Retrieve a task by ID.
@@ -41,9 +46,14 @@ class InMemoryTaskRepository(TaskRepository):
 
         Args:
             task: The task to save
+
+        Raises:
+            ConcurrentModificationError: If the stored task has a different version
         """
         logger.debug(f"Saving task {task.id} for project {task.project_id}")
-        self._tasks[task.id] = task
+        stored = self._tasks.get(task.id)
+        with versioned_save(task, stored.version if stored else 0):
+            self._tasks[task.id] = task
 
     def delete(self, task_id: UUID) -> None:
         """
@@ -84,6 +94,10 @@ class InMemoryProjectRepository(ProjectRepository):
         self._task_repo: Optional[TaskRepository] = None
         self._initialize_inbox()
 
+    def __len__(self) -> int:
+        """Number of projects held in memory."""
+        return len(self._projects)
+
     def _initialize_inbox(self) -> None:
         """
         Initialize the INBOX project if it doesn't exist.
@@ -165,8 +179,13 @@ class InMemoryProjectRepository(ProjectRepository):
 
         Args:
             project: The project to save
+
+        Raises:
+            ConcurrentModificationError: If the stored project has a different version
         """
-        self._projects[project.id] = project
+        stored = self._projects.get(project.id)
+        with versioned_save(project, stored.version if stored else 0):
+            self._projects[project.id] = project
 
     def delete(self, project_id: UUID) -> None:
         """
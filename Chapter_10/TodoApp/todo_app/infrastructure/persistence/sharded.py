@@ -0,0 +1,252 @@
+"""
+Sharded file layout for task storage.
+
+Tasks are stored in one file per project under ``<data_dir>/tasks/``. A small
+manifest lists the projects that have a shard, and ``tasks/index/`` holds one
+pointer file per task naming its project, so a task can be found by id without
+reading anything that grows with the total number of tasks. Saving a task
+rewrites only its project's shard, and find_by_project reads a single shard.
+"""
+
+import json
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.locking import FileLock, atomic_write
+from todo_app.infrastructure.persistence.serializers import JsonSerializer, RecordSerializer
+from todo_app.infrastructure.persistence.versioning import versioned_save
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+SHARD_DIR_NAME = "tasks"
+MANIFEST_FILE_NAME = "manifest.json"
+INDEX_DIR_NAME = "index"
+
+
+class ShardedFileTaskRepository(FileTaskRepository):
+    """
+    Per-project file implementation of TaskRepository.
+
+    Records use the same format and serializer as FileTaskRepository. Saves of
+    existing tasks lock only their own shard, located from task.project_id;
+    get() reads the task's pointer file and then that one shard. Creating,
+    moving or deleting a task also locks the manifest, which serializes those
+    operations with each other, but only rewrites it when a project gets its
+    first shard.
+    """
+
+    def __init__(self, data_dir: Path, serializer: Optional[RecordSerializer] = None):
+        self.serializer = serializer or JsonSerializer()
+        self.shard_dir = data_dir / SHARD_DIR_NAME
+        self.index_dir = self.shard_dir / INDEX_DIR_NAME
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_file = self.shard_dir / MANIFEST_FILE_NAME
+        self._manifest_lock = FileLock(self.manifest_file)
+        with self._manifest_lock.exclusive():
+            if not self.manifest_file.exists():
+                self._write_projects([])
+            else:
+                self._upgrade_manifest()
+
+    def _shard_file(self, project_id: UUID) -> Path:
+        return self.shard_dir / f"{project_id}{self.serializer.suffix}"
+
+    def _pointer_file(self, task_id: UUID) -> Path:
+        return self.index_dir / str(task_id)
+
+    def _read_projects(self) -> List[str]:
+        """Read the ids of the projects that have a shard; the caller must hold the manifest lock."""
+        return json.loads(self.manifest_file.read_text())["projects"]
+
+    def _write_projects(self, project_ids: Iterable[str]) -> None:
+        """Write the manifest; the caller must hold its exclusive lock."""
+        atomic_write(self.manifest_file, json.dumps({"projects": sorted(set(project_ids))}))
+
+    def _upgrade_manifest(self) -> None:
+        """
+        Replace a manifest mapping every task id to its project, as written by
+        earlier versions, with pointer files; the caller must hold its lock.
+        """
+        manifest = json.loads(self.manifest_file.read_text())
+        if "projects" in manifest:
+            return
+        for task_id, project_id in manifest.items():
+            atomic_write(self._pointer_file(UUID(task_id)), project_id)
+        self._write_projects(manifest.values())
+
+    def _project_of(self, task_id: UUID) -> Optional[UUID]:
+        """The project a task's pointer file names, if the task exists."""
+        try:
+            return UUID(self._pointer_file(task_id).read_text())
+        except FileNotFoundError:
+            return None
+
+    def _read_shard(self, project_id: UUID) -> List[Dict[str, Any]]:
+        """Read a project's shard; the caller must hold its lock."""
+        shard_file = self._shard_file(project_id)
+        return self.serializer.loads(shard_file.read_bytes()) if shard_file.exists() else []
+
+    def _load_shard(self, project_id: UUID) -> List[Dict[str, Any]]:
+        with FileLock(self._shard_file(project_id)).shared():
+            return self._read_shard(project_id)
+
+    def _write_shard(self, project_id: UUID, records: List[Dict[str, Any]]) -> None:
+        """Write a project's shard; the caller must hold its exclusive lock."""
+        atomic_write(self._shard_file(project_id), self.serializer.dumps(records))
+
+    def _shard_ids(self) -> List[UUID]:
+        with self._manifest_lock.shared():
+            return [UUID(project_id) for project_id in self._read_projects()]
+
+    def _load_tasks(self) -> list[Dict[str, Any]]:
+        """Load all task records across shards."""
+        return [record for shard in self._shard_ids() for record in self._load_shard(shard)]
+
+    @staticmethod
+    def _index_of(records: List[Dict[str, Any]], task_id: UUID) -> Optional[int]:
+        return next((i for i, data in enumerate(records) if UUID(data["id"]) == task_id), None)
+
+    def get(self, task_id: UUID) -> Task:
+        """Retrieve a task by ID."""
+        project_id = self._project_of(task_id)
+        if project_id is not None:
+            for task_data in self._load_shard(project_id):
+                if UUID(task_data["id"]) == task_id:
+                    return self._dict_to_task(task_data)
+        raise TaskNotFoundError(task_id)
+
+    def save(self, task: Task) -> None:
+        """Save a task, rewriting only its project's shard."""
+        if not self._save_in_place(task):
+            self._save_new_or_moved(task)
+
+    def _save_in_place(self, task: Task) -> bool:
+        """Update a task already in its project's shard; False if it is not there."""
+        with FileLock(self._shard_file(task.project_id)).exclusive():
+            records = self._read_shard(task.project_id)
+            index = self._index_of(records, task.id)
+            if index is None:
+                return False
+            with versioned_save(task, records[index].get("version", 0)):
+                records[index] = self._task_to_dict(task)
+                self._write_shard(task.project_id, records)
+            return True
+
+    def _save_new_or_moved(self, task: Task) -> None:
+        """Insert a task or move it between shards, updating its pointer file."""
+        with self._manifest_lock.exclusive():
+            previous_id = self._project_of(task.id)
+            source_id = previous_id if previous_id != task.project_id else None
+            with ExitStack() as locks:
+                # Shards are locked in a fixed order, so two moves cannot deadlock
+                for project_id in sorted({task.project_id, source_id} - {None}, key=str):
+                    locks.enter_context(FileLock(self._shard_file(project_id)).exclusive())
+
+                records = self._read_shard(task.project_id)
+                index = self._index_of(records, task.id)
+                source_records = self._read_shard(source_id) if source_id else []
+                source_index = self._index_of(source_records, task.id)
+                if index is not None:
+                    # Another writer inserted it first
+                    stored_version = records[index].get("version", 0)
+                elif source_index is not None:
+                    stored_version = source_records[source_index].get("version", 0)
+                else:
+                    stored_version = 0
+
+                with versioned_save(task, stored_version):
+                    new_shard = not self._shard_file(task.project_id).exists()
+                    if index is not None:
+                        records[index] = self._task_to_dict(task)
+                    else:
+                        records.append(self._task_to_dict(task))
+                    self._write_shard(task.project_id, records)
+                    if source_index is not None:
+                        del source_records[source_index]
+                        self._write_shard(source_id, source_records)
+                    if previous_id != task.project_id:
+                        atomic_write(self._pointer_file(task.id), str(task.project_id))
+                    if new_shard:
+                        self._write_projects([*self._read_projects(), str(task.project_id)])
+
+    def delete(self, task_id: UUID) -> None:
+        """Delete a task."""
+        with self._manifest_lock.exclusive():
+            project_id = self._project_of(task_id)
+            if project_id is None:
+                return
+            with FileLock(self._shard_file(project_id)).exclusive():
+                records = [t for t in self._read_shard(project_id) if UUID(t["id"]) != task_id]
+                self._write_shard(project_id, records)
+            self._pointer_file(task_id).unlink()
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+        """Find all tasks for a project by reading its shard."""
+        return [self._dict_to_task(t) for t in self._load_shard(project_id)]
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        """Stream a project's tasks from its shard."""
+        for task_data in self._load_shard(project_id):
+            yield self._dict_to_task(task_data)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        """Stream non-completed tasks, holding one shard in memory at a time."""
+        for project_id in self._shard_ids():
+            for task_data in self._load_shard(project_id):
+                if task_data["status"] != TaskStatus.DONE.name:
+                    yield self._dict_to_task(task_data)
+
+    def get_active_tasks(self) -> Sequence[Task]:
+        """Get all non-completed tasks."""
+        return [
+            self._dict_to_task(t) for t in self._load_tasks() if t["status"] != TaskStatus.DONE.name
+        ]
+
+
+def migrate_to_sharded(data_dir: Path, serializer: Optional[RecordSerializer] = None) -> int:
+    """
+    Convert a single-file task store in data_dir to the sharded layout.
+
+    The original tasks file is kept with a ``.migrated`` suffix so the
+    migration can be reverted by renaming it back.
+
+    Returns:
+        The number of tasks migrated
+    """
+    serializer = serializer or JsonSerializer()
+    tasks_file = data_dir / f"tasks{serializer.suffix}"
+    if not tasks_file.exists():
+        raise FileNotFoundError(f"No single-file task store at {tasks_file}")
+
+    single = FileTaskRepository(data_dir, serializer)
+    repo = ShardedFileTaskRepository(data_dir, serializer)
+    with single._lock.exclusive(), repo._manifest_lock.exclusive():
+        if repo._read_projects():
+            raise ValueError(f"Sharded task store in {repo.shard_dir} is not empty")
+
+        records = single._read_tasks()
+        shards: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            shards.setdefault(record["project_id"], []).append(record)
+
+        for project_id, shard_records in shards.items():
+            with FileLock(repo._shard_file(UUID(project_id))).exclusive():
+                repo._write_shard(UUID(project_id), shard_records)
+        for record in records:
+            atomic_write(repo._pointer_file(UUID(str(record["id"]))), str(record["project_id"]))
+        repo._write_projects(shards)
+        tasks_file.rename(tasks_file.with_name(tasks_file.name + ".migrated"))
+
+    logger.info(
+        "Migrated tasks to sharded layout",
+        extra={"context": {"tasks": len(records), "shards": len(shards)}},
+    )
+    return len(records)
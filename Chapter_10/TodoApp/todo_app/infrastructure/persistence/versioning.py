@@ -0,0 +1,47 @@
+"""
+Helpers for the version bookkeeping repositories perform when saving entities.
+
+Every save is a compare-and-set: the entity's version must still match the
+version currently stored, otherwise someone else saved it in the meantime.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator
+
+from todo_app.domain.entities.entity import Entity
+from todo_app.domain.exceptions import ConcurrentModificationError
+
+
+def stamp_new_version(entity: Entity) -> None:
+    """Advance the entity's version and modification time as part of a save."""
+    entity.version += 1
+    entity.updated_at = datetime.now(timezone.utc)
+
+
+@contextmanager
+def versioned_save(entity: Entity, stored_version: int) -> Iterator[None]:
+    """
+    Guard a save with an optimistic concurrency check.
+
+    Args:
+        entity: The entity being saved
+        stored_version: Version currently persisted (0 if the entity is new)
+
+    Raises:
+        ConcurrentModificationError: If the entity is stale
+
+    The entity is stamped with its new version before the body runs so the
+    body can persist it; the stamp is rolled back if the body fails.
+    """
+    if entity.version != stored_version:
+        raise ConcurrentModificationError(
+            type(entity).__name__, entity.id, entity.version, stored_version
+        )
+    previous = entity.version, entity.updated_at
+    stamp_new_version(entity)
+    try:
+        yield
+    except BaseException:
+        entity.version, entity.updated_at = previous
+        raise
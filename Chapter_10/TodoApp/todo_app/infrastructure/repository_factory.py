@@ -3,7 +3,7 @@ Factory functions for creating repositories based on configuration.
 """
 
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from todo_app.application.repositories.project_repository import ProjectRepository
 from todo_app.application.repositories.task_repository import TaskRepository
@@ -15,7 +15,35 @@ from todo_app.infrastructure.persistence.file import (
     FileTaskRepository,
     FileProjectRepository,
 )
-from todo_app.infrastructure.config import Config, RepositoryType
+from todo_app.infrastructure.persistence.caching import (
+    CachingProjectRepository,
+    CachingTaskRepository,
+    LruTtlCache,
+)
+from todo_app.infrastructure.persistence.identity_map import (
+    IdentityMapProjectRepository,
+    IdentityMapTaskRepository,
+)
+from todo_app.infrastructure.persistence.mapped import MappedBinaryTaskRepository
+from todo_app.infrastructure.persistence.serializers import (
+    BinarySerializer,
+    CompactJsonSerializer,
+    JsonSerializer,
+    RecordSerializer,
+)
+from todo_app.infrastructure.persistence.sharded import ShardedFileTaskRepository
+from todo_app.infrastructure.config import Config, FileLayout, RepositoryType, StorageFormat
+
+_SERIALIZERS = {
+    StorageFormat.JSON: JsonSerializer,
+    StorageFormat.COMPACT_JSON: CompactJsonSerializer,
+    StorageFormat.BINARY: BinarySerializer,
+}
+
+
+def create_serializer(storage_format: Optional[StorageFormat] = None) -> RecordSerializer:
+    """Create the serializer for a storage format, defaulting to the configured one."""
+    return _SERIALIZERS[storage_format or Config.get_storage_format()]()
 
 
 def create_repositories() -> Tuple[TaskRepository, ProjectRepository]:
@@ -29,16 +57,37 @@ def create_repositories() -> Tuple[TaskRepository, ProjectRepository]:
 
     if repo_type == RepositoryType.FILE:
         data_dir = Config.get_data_directory()
-        task_repo = FileTaskRepository(data_dir)
-        project_repo = FileProjectRepository(data_dir)
-        project_repo.set_task_repository(task_repo)
-        return task_repo, project_repo
+        serializer = create_serializer()
+        if Config.get_file_layout() == FileLayout.SHARDED:
+            task_repo = ShardedFileTaskRepository(data_dir, serializer)
+        elif isinstance(serializer, BinarySerializer):
+            # Binary files carry an id index, so reads can go through a memory map
+            task_repo = MappedBinaryTaskRepository(data_dir)
+        else:
+            task_repo = FileTaskRepository(data_dir, serializer)
+        project_repo = FileProjectRepository(data_dir, serializer)
     elif repo_type == RepositoryType.MEMORY:
         # Memory repositories
         task_repo = InMemoryTaskRepository()
         project_repo = InMemoryProjectRepository()
-        # Connect the repositories
-        project_repo.set_task_repository(task_repo)
-        return task_repo, project_repo
     else:
         raise ValueError(f"Invalid repository type: {repo_type}")
+
+    max_entries = Config.get_cache_max_entries()
+    if max_entries:
+        ttl_seconds = Config.get_cache_ttl_seconds()
+        max_bytes = Config.get_cache_max_bytes() or None
+        task_repo = CachingTaskRepository(
+            task_repo, LruTtlCache(max_entries, ttl_seconds, max_bytes)
+        )
+        project_repo = CachingProjectRepository(
+            project_repo, LruTtlCache(max_entries, ttl_seconds, max_bytes)
+        )
+
+    # Outermost, so repeated loads within a request skip the cache and storage entirely
+    task_repo = IdentityMapTaskRepository(task_repo)
+    project_repo = IdentityMapProjectRepository(project_repo)
+
+    # Connect the repositories
+    project_repo.set_task_repository(task_repo)
+    return task_repo, project_repo
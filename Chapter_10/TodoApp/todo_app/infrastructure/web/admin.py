@@ -0,0 +1,129 @@
+"""
+Operational endpoints for the Todo App web interface.
+
+They expose internals, so every endpoint calls _require_admin(): with
+TODO_ADMIN_TOKEN set a request must send it in the X-Admin-Token header.
+Without a token they are only served to loopback clients of an app running in
+debug mode (web_main.py). Behind a reverse proxy on the same host every client
+looks like loopback, so deployments must set the token.
+"""
+
+import hmac
+from dataclasses import asdict
+from typing import Optional
+
+from flask import Blueprint, abort, current_app, jsonify, request
+
+bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+LOOPBACK_ADDRESSES = frozenset({"127.0.0.1", "::1"})
+
+
+def _require_admin() -> None:
+    """Abort with 403 unless the request may use the admin endpoints."""
+    token = current_app.config.get("ADMIN_TOKEN")
+    if token:
+        provided = request.headers.get("X-Admin-Token", "")
+        if not hmac.compare_digest(token.encode(), provided.encode()):
+            abort(403)
+    elif not current_app.debug or request.remote_addr not in LOOPBACK_ADDRESSES:
+        abort(403)
+
+
+def _memory_diagnostics():
+    _require_admin()
+    memory = current_app.config["APP_CONTAINER"].memory
+    if memory is None:
+        abort(404)
+    return memory
+
+
+def _memory_error(message: str, status: int = 409):
+    return jsonify({"error": {"code": "MEMORY_DIAGNOSTICS", "message": message}}), status
+
+
+@bp.route("/timings", methods=["GET"])
+def timings():
+    """
+    Latency aggregates per use case and repository method.
+
+    Pass ?trace_id=... to list the recent calls made while handling one request.
+    Returns 404 unless TODO_TIMING_ENABLED is set, and 403 without the
+    X-Admin-Token header (or, if no token is configured, outside local debug use).
+    """
+    _require_admin()
+    registry = current_app.config["APP_CONTAINER"].timings
+    if registry is None:
+        abort(404)
+
+    trace_id = request.args.get("trace_id")
+    if trace_id:
+        samples = registry.samples_for_trace(trace_id)
+        return jsonify({"trace_id": trace_id, "calls": [asdict(sample) for sample in samples]})
+    return jsonify({"layers": registry.layer_totals(), "methods": registry.summary()})
+
+
+@bp.route("/memory", methods=["GET"])
+def memory_status():
+    """
+    tracemalloc status and the objects retained by the repositories.
+
+    With ?top=N the largest allocators of the latest snapshot are included;
+    ?group_by=module|line (default line) sets how allocations are grouped.
+    Returns 404 unless TODO_MEMORY_DIAGNOSTICS is set. Like every /admin/memory
+    endpoint, answers 403 to clients _require_admin() rejects.
+    """
+    memory = _memory_diagnostics()
+    app = current_app.config["APP_CONTAINER"]
+    body = {**memory.status(), "retained": app.retained_objects()}
+    top: Optional[int] = request.args.get("top", type=int)
+    if top:
+        try:
+            body["top"] = memory.top(request.args.get("group_by", "line"), top)
+        except ValueError as e:
+            return _memory_error(str(e), 400)
+        except RuntimeError as e:
+            return _memory_error(str(e))
+    return jsonify(body)
+
+
+@bp.route("/memory/start", methods=["POST"])
+def memory_start():
+    """Start tracing allocations (?frames=N frames per allocation, default 1)."""
+    memory = _memory_diagnostics()
+    memory.start(request.args.get("frames", 1, type=int))
+    return jsonify(memory.status())
+
+
+@bp.route("/memory/stop", methods=["POST"])
+def memory_stop():
+    """Stop tracing allocations and drop the snapshots."""
+    memory = _memory_diagnostics()
+    memory.stop()
+    return jsonify(memory.status())
+
+
+@bp.route("/memory/snapshot", methods=["POST"])
+def memory_snapshot():
+    """Take a snapshot of the traced allocations."""
+    memory = _memory_diagnostics()
+    try:
+        memory.take_snapshot()
+    except RuntimeError as e:
+        return _memory_error(str(e))
+    return jsonify(memory.status()), 201
+
+
+@bp.route("/memory/diff", methods=["GET"])
+def memory_diff():
+    """Allocators that grew most between the last two snapshots (?group_by=, ?limit=)."""
+    memory = _memory_diagnostics()
+    try:
+        growth = memory.diff(
+            request.args.get("group_by", "line"), request.args.get("limit", 10, type=int)
+        )
+    except ValueError as e:
+        return _memory_error(str(e), 400)
+    except RuntimeError as e:
+        return _memory_error(str(e))
+    return jsonify({"growth": growth})
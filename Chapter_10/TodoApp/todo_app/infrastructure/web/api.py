@@ -0,0 +1,209 @@
+"""
+JSON REST API for the Todo App.
+
+Routes go through the same controllers and use cases as the HTML interface;
+only the presenters differ. Read endpoints carry ETag/Last-Modified validators
+derived from entity versions so polling clients can revalidate cheaply.
+"""
+
+from dataclasses import asdict, replace
+from datetime import datetime
+from hashlib import sha1
+from typing import Iterator, Optional, Union
+
+from flask import Blueprint, current_app, jsonify, request
+
+from todo_app.interfaces.controllers.project_controller import ProjectController
+from todo_app.interfaces.controllers.task_controller import TaskController
+from todo_app.interfaces.presenters.api import ApiProjectPresenter, ApiTaskPresenter
+from todo_app.interfaces.view_models.base import ErrorViewModel
+from todo_app.interfaces.view_models.project_vm import ProjectResourceViewModel
+from todo_app.interfaces.view_models.task_vm import TaskResourceViewModel
+
+bp = Blueprint("api", __name__, url_prefix="/api/v1")
+
+Resource = Union[TaskResourceViewModel, ProjectResourceViewModel]
+
+# HTTP status for each application ErrorCode
+_ERROR_STATUS = {
+    "NOT_FOUND": 404,
+    "VALIDATION_ERROR": 400,
+    "BUSINESS_RULE_VIOLATION": 422,
+    "UNAUTHORIZED": 401,
+    "CONFLICT": 409,
+}
+
+
+def _controllers() -> tuple[TaskController, ProjectController]:
+    """Controllers sharing the container's use cases but presenting API resources."""
+    controllers = current_app.extensions.get("todo_api_controllers")
+    if controllers is None:
+        app = current_app.config["APP_CONTAINER"]
+        # Presenters are built per app so each is timed into that app's registry;
+        # replace() builds new controllers, so they are instrumented separately
+        task_presenter = app.instrument(ApiTaskPresenter(), "presenter")
+        project_presenter = app.instrument(ApiProjectPresenter(), "presenter")
+        controllers = (
+            app.instrument(replace(app.task_controller, presenter=task_presenter), "controller"),
+            app.instrument(
+                replace(app.project_controller, presenter=project_presenter), "controller"
+            ),
+        )
+        current_app.extensions["todo_api_controllers"] = controllers
+    return controllers
+
+
+def _error_response(error: ErrorViewModel):
+    status = _ERROR_STATUS.get(error.code or "", 500)
+    return jsonify({"error": {"code": error.code, "message": error.message}}), status
+
+
+def _versioned(resource: Resource) -> Iterator[tuple[str, int, Optional[str]]]:
+    """Yield (id, version, updated_at) for a resource and anything embedded in it."""
+    yield resource.id, resource.version, resource.updated_at
+    if isinstance(resource, ProjectResourceViewModel):
+        for task in resource.tasks:
+            yield task.id, task.version, task.updated_at
+
+
+def _validators(resources: list[Resource]) -> tuple[str, Optional[datetime]]:
+    """
+    Compute the ETag and Last-Modified for a representation.
+
+    The ETag covers the id and version of every entity in the representation, so
+    it changes whenever one of them is saved, added or removed.
+    """
+    digest = sha1()
+    last_modified = None
+    for resource in resources:
+        for entity_id, version, updated_at in _versioned(resource):
+            digest.update(f"{entity_id}:{version};".encode())
+            if updated_at:
+                modified = datetime.fromisoformat(updated_at)
+                if last_modified is None or modified > last_modified:
+                    last_modified = modified
+    return digest.hexdigest(), last_modified
+
+
+def _resource_response(view_model: Union[Resource, list[Resource]], status: int = 200):
+    """
+    Build a JSON response with cache validators.
+
+    When the client's If-None-Match already matches, a bodiless 304 is returned
+    without serializing the representation.
+    """
+    resources = view_model if isinstance(view_model, list) else [view_model]
+    etag, last_modified = _validators(resources)
+
+    if status == 200 and request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        if isinstance(view_model, list):
+            response = jsonify([asdict(resource) for resource in view_model])
+        else:
+            response = jsonify(asdict(view_model))
+        response.status_code = status
+
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    return response
+
+
+def _json_body() -> dict:
+    return request.get_json(silent=True) or {}
+
+
+@bp.route("/projects", methods=["GET"])
+def list_projects():
+    """List all projects with their tasks."""
+    _, project_controller = _controllers()
+    result = project_controller.handle_list()
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success)
+
+
+@bp.route("/projects", methods=["POST"])
+def create_project():
+    """Create a project."""
+    _, project_controller = _controllers()
+    data = _json_body()
+    result = project_controller.handle_create(
+        name=data.get("name", ""), description=data.get("description", "")
+    )
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success, status=201)
+
+
+@bp.route("/projects/<project_id>", methods=["GET"])
+def get_project(project_id):
+    """Get a single project with its tasks."""
+    _, project_controller = _controllers()
+    result = project_controller.handle_get(project_id)
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success)
+
+
+@bp.route("/projects/<project_id>", methods=["PATCH"])
+def update_project(project_id):
+    """Update a project's name and/or description."""
+    _, project_controller = _controllers()
+    data = _json_body()
+    result = project_controller.handle_update(
+        project_id=project_id, name=data.get("name"), description=data.get("description")
+    )
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success)
+
+
+@bp.route("/projects/<project_id>/tasks", methods=["POST"])
+def create_task(project_id):
+    """Create a task in a project."""
+    task_controller, _ = _controllers()
+    data = _json_body()
+    result = task_controller.handle_create(
+        title=data.get("title", ""),
+        description=data.get("description", ""),
+        project_id=project_id,
+        priority=data.get("priority"),
+        due_date=data.get("due_date"),
+    )
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success, status=201)
+
+
+@bp.route("/tasks/<task_id>", methods=["GET"])
+def get_task(task_id):
+    """Get a single task."""
+    task_controller, _ = _controllers()
+    result = task_controller.handle_get(task_id)
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success)
+
+
+@bp.route("/tasks/<task_id>/complete", methods=["POST"])
+def complete_task(task_id):
+    """Complete a task with optional notes."""
+    task_controller, _ = _controllers()
+    result = task_controller.handle_complete(
+        task_id=task_id, notes=_json_body().get("completion_notes")
+    )
+    if not result.is_success:
+        return _error_response(result.error)
+    return _resource_response(result.success)
+
+
+@bp.route("/tasks/<task_id>", methods=["DELETE"])
+def delete_task(task_id):
+    """Delete a task."""
+    task_controller, _ = _controllers()
+    result = task_controller.handle_delete(task_id)
+    if not result.is_success:
+        return _error_response(result.error)
+    return "", 204
@@ -3,8 +3,15 @@ Flask web application setup for the Todo App.
 """
 
 from flask import Flask
+from todo_app.infrastructure.config import Config
 from todo_app.infrastructure.configuration.container import Application
-from todo_app.infrastructure.web.middleware import trace_requests
+from todo_app.infrastructure.web.middleware import (
+    identity_map_per_request,
+    profile_requests,
+    record_request_metrics,
+    record_request_spans,
+    trace_requests,
+)
 
 
 def create_web_app(app_container: Application) -> Flask:
@@ -12,13 +19,23 @@ def create_web_app(app_container: Application) -> Flask:
     flask_app = Flask(__name__)
     flask_app.config["SECRET_KEY"] = "dev"  # Change this in production
     flask_app.config["APP_CONTAINER"] = app_container  # Store container in config
+    flask_app.config["ADMIN_TOKEN"] = Config.get_admin_token()
 
     # Add trace ID middleware
     trace_requests(flask_app)
+    identity_map_per_request(flask_app)
+    record_request_metrics(flask_app)
+    if app_container.tracer is not None:
+        record_request_spans(flask_app, app_container.tracer)
+    # Only hooked in when enabled, so unprofiled deployments pay nothing
+    if app_container.profiler is not None:
+        profile_requests(flask_app, app_container.profiler)
 
     # Register blueprints
-    from . import routes
+    from . import admin, api, routes
 
     flask_app.register_blueprint(routes.bp)
+    flask_app.register_blueprint(api.bp)
+    flask_app.register_blueprint(admin.bp)
 
     return flask_app
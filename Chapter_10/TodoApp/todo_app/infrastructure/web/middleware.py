@@ -1,6 +1,12 @@
 from functools import wraps
+import time
+from typing import Optional
 from flask import request, g
+from ..instrumentation.metrics import RequestMetrics
+from ..instrumentation.profiling import Profiler
+from ..instrumentation.tracing import Tracer, format_traceparent, parse_traceparent
 from ..logging.trace import set_trace_id, get_trace_id
+from ..persistence.identity_map import begin_identity_scope, end_identity_scope
 import logging
 
 
@@ -8,13 +14,17 @@ def trace_requests(flask_app):
     """Add trace ID to all requests.
 
     This middleware:
-    1. Generates or propagates trace IDs across requests
+    1. Generates or propagates trace IDs across requests, from an X-Trace-ID
+       or W3C traceparent header
     2. Adds trace ID to response headers
     """
 
     @flask_app.before_request
     def before_request():
-        trace_id = request.headers.get("X-Trace-ID") or None
+        traceparent = parse_traceparent(request.headers.get("traceparent"))
+        trace_id = request.headers.get("X-Trace-ID") or (traceparent and traceparent[0]) or None
+        # The caller's span becomes the parent of this request's span
+        g.remote_parent_span_id = traceparent[1] if traceparent else None
         # pull trace id from globals
         g.trace_id = set_trace_id(trace_id)
 
@@ -27,3 +37,117 @@ def trace_requests(flask_app):
     logging.getLogger("werkzeug").addFilter(
         lambda record: setattr(record, "trace_id", get_trace_id()) or True
     )
+
+
+def identity_map_per_request(flask_app):
+    """Give each request its own identity map.
+
+    Repeated repository loads within one request return the same entity
+    instance; the map is dropped when the request ends.
+    """
+
+    @flask_app.before_request
+    def begin_identity_map():
+        g.identity_map_token = begin_identity_scope()
+
+    @flask_app.teardown_request
+    def end_identity_map(exc):
+        token = g.pop("identity_map_token", None)
+        if token is not None:
+            end_identity_scope(token)
+
+
+def record_request_metrics(flask_app, metrics: Optional[RequestMetrics] = None) -> RequestMetrics:
+    """Count requests per route and serve the totals on /metrics.
+
+    Routes are labelled by their URL rule (e.g. /api/v1/tasks/<task_id>) so the
+    number of series stays bounded; requests matching no rule share one label.
+    """
+    metrics = metrics or RequestMetrics()
+    flask_app.extensions["todo_request_metrics"] = metrics
+
+    @flask_app.before_request
+    def start_request_timer():
+        g.request_started_at = time.perf_counter()
+        metrics.request_started()
+
+    @flask_app.after_request
+    def remember_status(response):
+        g.response_status = response.status_code
+        return response
+
+    @flask_app.teardown_request
+    def record_request(exc):
+        started_at = g.pop("request_started_at", None)
+        if started_at is None:
+            return
+        # after_request is skipped when a view raises, which Flask answers with a 500
+        status = g.pop("response_status", 500)
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        metrics.request_finished(request.method, route, status, time.perf_counter() - started_at)
+
+    def serve_metrics():
+        return metrics.render(), 200, {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+    flask_app.add_url_rule("/metrics", "metrics", serve_metrics)
+    return metrics
+
+
+def record_request_spans(flask_app, tracer: Tracer):
+    """Record a span for each request, parenting the spans of the layers it calls.
+
+    Must be registered after trace_requests so the request's trace id is set.
+    """
+
+    @flask_app.before_request
+    def begin_request_span():
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        g.request_span = tracer.begin(
+            f"{request.method} {route}",
+            "http",
+            {"http.method": request.method, "http.route": route},
+            parent_id=g.get("remote_parent_span_id"),
+        )
+
+    @flask_app.after_request
+    def add_traceparent(response):
+        if "request_span" in g:
+            span, _ = g.request_span
+            span.set_attribute("http.status_code", response.status_code)
+            traceparent = format_traceparent(span.trace_id, span.span_id)
+            if traceparent:
+                response.headers["traceparent"] = traceparent
+        return response
+
+    @flask_app.teardown_request
+    def end_request_span(exc):
+        request_span = g.pop("request_span", None)
+        if request_span is not None:
+            span, token = request_span
+            tracer.end(span, token, exc)
+
+
+def profile_requests(flask_app, profiler: Profiler):
+    """Profile requests carrying the profiler's X-Profile-Token, or a sample of all requests.
+
+    Profiles are named after the request's trace id, which is echoed in the
+    X-Profile response header. Must be registered after trace_requests.
+    """
+
+    @flask_app.before_request
+    def start_profile():
+        if profiler.wants(request.headers.get("X-Profile-Token")):
+            g.profile_session = profiler.start(g.trace_id)
+
+    @flask_app.after_request
+    def add_profile_header(response):
+        session = g.get("profile_session")
+        if session is not None:
+            response.headers["X-Profile"] = session.path_stem.name
+        return response
+
+    @flask_app.teardown_request
+    def stop_profile(exc):
+        session = g.pop("profile_session", None)
+        if session is not None:
+            session.stop()
@@ -0,0 +1,81 @@
+"""
+JSON API presenters for formatting data for machine clients.
+
+Unlike the CLI and web presenters, these keep values machine-readable:
+enum names instead of display labels and ISO 8601 timestamps.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from todo_app.application.dtos.project_dtos import CompleteProjectResponse, ProjectResponse
+from todo_app.application.dtos.task_dtos import TaskResponse
+from todo_app.interfaces.presenters.base import ProjectPresenter, TaskPresenter
+from todo_app.interfaces.view_models.base import ErrorViewModel
+from todo_app.interfaces.view_models.project_vm import (
+    ProjectCompletionViewModel,
+    ProjectResourceViewModel,
+)
+from todo_app.interfaces.view_models.task_vm import TaskResourceViewModel
+
+
+def _format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class ApiTaskPresenter(TaskPresenter):
+    """JSON API task presenter."""
+
+    def present_task(self, task_response: TaskResponse) -> TaskResourceViewModel:
+        """Format task as an API resource."""
+        return TaskResourceViewModel(
+            id=task_response.id,
+            title=task_response.title,
+            description=task_response.description,
+            status=task_response.status.value,
+            priority=task_response.priority.name,
+            project_id=task_response.project_id,
+            due_date=_format_timestamp(task_response.due_date),
+            completed_at=_format_timestamp(task_response.completion_date),
+            completion_notes=task_response.completion_notes,
+            version=task_response.version,
+            updated_at=_format_timestamp(task_response.updated_at),
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for API clients."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
+
+
+class ApiProjectPresenter(ProjectPresenter):
+    """JSON API project presenter."""
+
+    def __init__(self):
+        self.task_presenter = ApiTaskPresenter()
+
+    def present_project(self, project_response: ProjectResponse) -> ProjectResourceViewModel:
+        """Format project, including its tasks, as an API resource."""
+        return ProjectResourceViewModel(
+            id=project_response.id,
+            name=project_response.name,
+            description=project_response.description or "",
+            project_type=project_response.project_type.name,
+            status=project_response.status.value,
+            completed_at=_format_timestamp(project_response.completion_date),
+            version=project_response.version,
+            updated_at=_format_timestamp(project_response.updated_at),
+            tasks=[self.task_presenter.present_task(task) for task in project_response.tasks],
+        )
+
+    def present_completion(
+        self, completion_response: CompleteProjectResponse
+    ) -> ProjectCompletionViewModel:
+        """Format project completion for API clients."""
+        return ProjectCompletionViewModel(
+            project_id=completion_response.id,
+            completion_notes=completion_response.completion_notes,
+        )
+
+    def present_error(self, error_msg: str, code: Optional[str] = None) -> ErrorViewModel:
+        """Format error for API clients."""
+        return ErrorViewModel(message=error_msg, code=code or "ERROR")
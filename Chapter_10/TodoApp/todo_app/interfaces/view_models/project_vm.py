@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from todo_app.interfaces.view_models.task_vm import TaskViewModel
+from todo_app.interfaces.view_models.task_vm import TaskResourceViewModel, TaskViewModel
 
 
 @dataclass(frozen=True)
@@ -47,3 +47,18 @@ class TaskListItemViewModel:
     status_display: str
     priority_display: str
     due_date_display: Optional[str]
+
+
+@dataclass(frozen=True)
+class ProjectResourceViewModel:
+    """Machine-readable representation of a project for the JSON API."""
+
+    id: str
+    name: str
+    description: str
+    project_type: str
+    status: str
+    completed_at: Optional[str]  # ISO 8601
+    version: int
+    updated_at: Optional[str]  # ISO 8601
+    tasks: list[TaskResourceViewModel]
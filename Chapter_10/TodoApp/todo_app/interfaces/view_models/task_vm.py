@@ -14,3 +14,19 @@ class TaskViewModel:
     project_display: Optional[str]  # Project name if available
     completion_info: Optional[str]  # Formatted completion details
 
+
+@dataclass(frozen=True)
+class TaskResourceViewModel:
+    """Machine-readable representation of a task for the JSON API."""
+
+    id: str
+    title: str
+    description: str
+    status: str
+    priority: str
+    project_id: str
+    due_date: Optional[str]  # ISO 8601
+    completed_at: Optional[str]  # ISO 8601
+    completion_notes: Optional[str]
+    version: int
+    updated_at: Optional[str]  # ISO 8601
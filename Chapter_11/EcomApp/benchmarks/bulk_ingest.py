@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Benchmark bulk order ingestion through SQLiteOrderRepository.
+
+Variants, each on a fresh database file:
+
+    per-statement  the previous save: an existence check, then an UPDATE or
+                   INSERT, then one INSERT per item, one transaction per order
+    save           save(): an upsert and executemany for the items, one
+                   transaction per order
+    save_many      save_many() in batches of --batch-size orders, one
+                   transaction per batch
+
+Run from the EcomApp directory:
+
+    python -m benchmarks.bulk_ingest --orders 20000 --items 3
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from order_system.domain.entities.order import Order, OrderItem, OrderStatus
+from order_system.infrastructure.database import SQLiteConnectionProvider
+from order_system.infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+from order_system.infrastructure.schema import migrate
+
+
+def generate_orders(count: int, items: int, customers: int = 500) -> List[Order]:
+    customer_ids = [uuid4() for _ in range(customers)]
+    product_ids = [uuid4() for _ in range(50)]
+    orders = []
+    for n in range(count):
+        order = Order(customer_id=customer_ids[n % customers], status=OrderStatus.PAID)
+        for i in range(items):
+            order.add_item(OrderItem(product_ids[(n + i) % 50], quantity=1 + i, price=9.99))
+        orders.append(order)
+    return orders
+
+
+def _save_per_statement(repository: SQLiteOrderRepository, order: Order) -> None:
+    with repository.connections.transaction() as conn:
+        exists = conn.execute("SELECT 1 FROM orders WHERE id = ?", (str(order.id),)).fetchone()
+        if exists:
+            conn.execute(
+                "UPDATE orders SET status = ?, updated_at = ?, total_price = ?, item_count = ? WHERE id = ?",
+                (
+                    order.status.value,
+                    order.updated_at.isoformat() if order.updated_at else None,
+                    order.total_price,
+                    len(order.items),
+                    str(order.id),
+                ),
+            )
+            conn.execute("DELETE FROM order_items WHERE order_id = ?", (str(order.id),))
+        else:
+            conn.execute(
+                "INSERT INTO orders (id, customer_id, status, created_at, updated_at, total_price, item_count) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(order.id),
+                    str(order.customer_id),
+                    order.status.value,
+                    order.created_at.isoformat(),
+                    order.updated_at.isoformat() if order.updated_at else None,
+                    order.total_price,
+                    len(order.items),
+                ),
+            )
+        for item in order.items:
+            conn.execute(
+                "INSERT INTO order_items (order_id, product_id, quantity, price) VALUES (?, ?, ?, ?)",
+                (str(order.id), str(item.product_id), item.quantity, item.price),
+            )
+
+
+def _ingest(variant: str, batch_size: int) -> Callable[[SQLiteOrderRepository, List[Order]], None]:
+    def per_statement(repository, orders):
+        for order in orders:
+            _save_per_statement(repository, order)
+
+    def save(repository, orders):
+        for order in orders:
+            repository.save(order)
+
+    def save_many(repository, orders):
+        for start in range(0, len(orders), batch_size):
+            repository.save_many(orders[start : start + batch_size])
+
+    return {"per-statement": per_statement, "save": save, "save_many": save_many}[variant]
+
+
+VARIANTS = ("per-statement", "save", "save_many")
+
+
+def run(orders: int, items: int, batch_size: int, variants: List[str]) -> List[Dict]:
+    results = []
+    dataset = generate_orders(orders, items)
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in variants:
+            connections = SQLiteConnectionProvider(str(Path(tmp) / f"{variant}.db"))
+            migrate(connections)
+            repository = SQLiteOrderRepository(connections)
+
+            ingest = _ingest(variant, batch_size)
+            start = time.perf_counter()
+            ingest(repository, dataset)
+            elapsed = time.perf_counter() - start
+            connections.close()
+
+            results.append(
+                {
+                    "variant": variant,
+                    "orders": orders,
+                    "items_per_order": items,
+                    "batch_size": batch_size if variant == "save_many" else 1,
+                    "seconds": round(elapsed, 4),
+                    "orders_per_second": round(orders / elapsed, 1),
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--items", type=int, default=3, help="Line items per order")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Orders per save_many call")
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.orders, args.items, args.batch_size, args.variants)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'variant':<14} {'orders':>7} {'seconds':>9} {'orders/s':>10}")
+    for row in results:
+        print(
+            f"{row['variant']:<14} {row['orders']:>7} {row['seconds']:>9.3f} "
+            f"{row['orders_per_second']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
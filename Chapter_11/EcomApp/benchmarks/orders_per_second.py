@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Benchmark order placement throughput with and without pooled connections.
+
+Each variant gets a fresh database file and places orders through
+CreateOrderUseCase with the SQLite repositories, from one or more threads:
+
+    unpooled  a new connection for every repository call, with SQLite's
+              defaults (rollback journal, synchronous=FULL), as the
+              repositories used to connect
+    pooled    SQLiteConnectionProvider: reused connections, WAL journaling,
+              synchronous=NORMAL and a warm statement cache
+
+Run from the EcomApp directory:
+
+    python -m benchmarks.orders_per_second --orders 2000 --threads 1 4
+"""
+import argparse
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from order_system.application.use_cases.create_order import CreateOrderRequest, CreateOrderUseCase
+from order_system.infrastructure.database import SQLiteConnectionProvider
+from order_system.infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+from order_system.infrastructure.repositories.sqlite_product_repository import (
+    SQLiteProductRepository,
+)
+from order_system.infrastructure.repositories.sqlite_unit_of_work import SQLiteUnitOfWork
+from order_system.infrastructure.schema import migrate
+from order_system.infrastructure.services.dummy_payment_service import DummyPaymentService
+
+
+class UnpooledConnections(SQLiteConnectionProvider):
+    """Opens and closes a connection around every repository call."""
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        return self._open()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        conn.close()
+
+
+VARIANTS: Dict[str, Callable[[str], SQLiteConnectionProvider]] = {
+    "unpooled": UnpooledConnections,
+    "pooled": SQLiteConnectionProvider,
+}
+
+
+def _place_orders(use_case: CreateOrderUseCase, product_ids: List[str], count: int, items: int):
+    errors = 0
+    for n in range(count):
+        request = CreateOrderRequest(
+            customer_id=uuid4(),
+            items=[
+                {"product_id": product_ids[(n + i) % len(product_ids)], "quantity": 1}
+                for i in range(items)
+            ],
+        )
+        try:
+            use_case.execute(request)
+        except Exception:
+            errors += 1
+    return errors
+
+
+def measure(variant: str, db_path: str, orders: int, threads: int, items: int) -> Dict:
+    connections = VARIANTS[variant](db_path)
+    migrate(connections)
+    product_repository = SQLiteProductRepository(connections)
+    use_case = CreateOrderUseCase(
+        unit_of_work=SQLiteUnitOfWork(
+            connections, SQLiteOrderRepository(connections), product_repository
+        ),
+        payment_service=DummyPaymentService(),
+    )
+    # Enough stock that no order fails for lack of it
+    with connections.transaction() as conn:
+        conn.execute("UPDATE products SET stock = ?", (10**9,))
+    product_ids = [str(product.id) for product in product_repository.get_all()]
+
+    per_thread = orders // threads
+    errors: List[int] = []
+
+    def worker():
+        errors.append(_place_orders(use_case, product_ids, per_thread, items))
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    connections.close()
+
+    placed = per_thread * threads - sum(errors)
+    return {
+        "variant": variant,
+        "threads": threads,
+        "items_per_order": items,
+        "orders": placed,
+        "errors": sum(errors),
+        "seconds": round(elapsed, 4),
+        "orders_per_second": round(placed / elapsed, 1),
+    }
+
+
+def run(orders: int, threads: List[int], items: int, variants: List[str]) -> List[Dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for thread_count in threads:
+            for variant in variants:
+                db_path = str(Path(tmp) / f"{variant}-{thread_count}.db")
+                results.append(measure(variant, db_path, orders, thread_count, items))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orders", type=int, default=1000, help="Orders placed per run")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--items", type=int, default=2, help="Line items per order")
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.orders, args.threads, args.items, args.variants)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'variant':<10} {'threads':>7} {'orders':>7} {'errors':>7} {'orders/s':>10}")
+    for row in results:
+        print(
+            f"{row['variant']:<10} {row['threads']:>7} {row['orders']:>7} "
+            f"{row['errors']:>7} {row['orders_per_second']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
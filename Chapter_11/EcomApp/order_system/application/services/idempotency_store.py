@@ -0,0 +1,31 @@
+# order_system/application/services/idempotency_store.py
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
+
+
+class IdempotencyKeyReused(Exception):
+    """The key was already used for a request with a different body"""
+
+    pass
+
+
+class IdempotencyKeyInProgress(Exception):
+    """A request with the key is still running and did not finish in time"""
+
+    pass
+
+
+class IdempotencyStore(ABC):
+    @abstractmethod
+    def run(
+        self, key: str, fingerprint: str, operation: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run an operation at most once per key.
+
+        The first request with a key runs the operation and its response is
+        stored; later requests with the same key and fingerprint get the
+        stored response without running it. If the operation raises, nothing
+        is stored and a retry runs it again.
+        """
+        pass
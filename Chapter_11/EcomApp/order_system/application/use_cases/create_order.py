@@ -1,11 +1,11 @@
 # order_system/application/use_cases/create_order.py
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from ...domain.entities.order import Order, OrderItem
-from ...domain.repositories.order_repository import OrderRepository
-from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.unit_of_work import UnitOfWork
 from ...domain.services.payment_service import PaymentService, PaymentResult
 
 
@@ -17,39 +17,63 @@ class CreateOrderRequest:
 
 @dataclass
 class CreateOrderUseCase:
-    order_repository: OrderRepository
-    product_repository: ProductRepository
+    unit_of_work: UnitOfWork
     payment_service: PaymentService
 
     def execute(self, request: CreateOrderRequest) -> Order:
         # Create order entity with basic information
         order = Order(customer_id=request.customer_id)
 
-        # Add items to order, checking inventory
-        for item_data in request.items:
-            product_id = UUID(item_data["product_id"])
-            quantity = item_data["quantity"]
+        lines = [(UUID(item_data["product_id"]), item_data["quantity"]) for item_data in request.items]
 
-            # Get product and check inventory
-            product = self.product_repository.get_by_id(product_id)
-            if not product:
-                raise ValueError(f"Product with ID {product_id} not found")
+        # Reserve the stock and record the order in one short transaction.
+        # Payment is an external call, so it runs after this commits instead of
+        # holding the database's write lock and stalling every other order.
+        with self.unit_of_work.transaction():
+            # Load every product in the cart at once
+            products = self.unit_of_work.products.get_many(product_id for product_id, _ in lines)
 
-            # Update inventory
-            product.decrease_stock(quantity)
-            self.product_repository.update(product)
+            # Add items to order, checking inventory
+            quantities: Dict[UUID, int] = defaultdict(int)
+            for product_id, quantity in lines:
+                product = products.get(product_id)
+                if not product:
+                    raise ValueError(f"Product with ID {product_id} not found")
 
-            # Add item to order
-            order_item = OrderItem(product_id=product_id, quantity=quantity, price=product.price)
-            order.add_item(order_item)
+                # Check inventory; lines for the same product draw on the same stock
+                product.decrease_stock(quantity)
+                quantities[product_id] += quantity
+
+                # Add item to order
+                order_item = OrderItem(product_id=product_id, quantity=quantity, price=product.price)
+                order.add_item(order_item)
+
+            # Reserve the stock; the repository re-checks it atomically
+            if not self.unit_of_work.products.reserve_stock_many(quantities):
+                raise ValueError("Insufficient stock for one or more products")
+
+            self.unit_of_work.orders.save(order)
 
         # Process payment
-        payment_result = self.payment_service.process_payment(order)
+        try:
+            payment_result = self.payment_service.process_payment(order)
+        except Exception:
+            self._cancel(order, quantities)
+            raise
         if not payment_result.success:
+            self._cancel(order, quantities)
             raise ValueError(f"Payment failed: {payment_result.error_message}")
 
         # Mark order as paid and save
-        order.mark_as_paid()
-        self.order_repository.save(order)
+        with self.unit_of_work.transaction():
+            order.mark_as_paid()
+            self.unit_of_work.orders.save(order)
 
         return order
+
+    def _cancel(self, order: Order, quantities: Dict[UUID, int]) -> None:
+        """Give the reserved stock back and keep the order as canceled"""
+        with self.unit_of_work.transaction():
+            self.unit_of_work.products.release_stock_many(quantities)
+            order.mark_as_canceled()
+            self.unit_of_work.orders.save(order)
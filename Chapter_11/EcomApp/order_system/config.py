@@ -8,6 +8,11 @@ class Config:
 
     # Database
     DB_PATH = os.getenv("DB_PATH", "order_system.db")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+    DB_SYNCHRONOUS = os.getenv("DB_SYNCHRONOUS", "NORMAL")
+
+    # Seconds another process's catalog change may go unnoticed; 0 disables the cache
+    CATALOG_CACHE_SECONDS = float(os.getenv("CATALOG_CACHE_SECONDS", "5"))
 
     # Feature Flags
     USE_CLEAN_ARCHITECTURE = os.getenv("USE_CLEAN_ARCHITECTURE", "True").lower() in (
@@ -48,3 +48,9 @@ class Order:
             raise ValueError(f"Cannot mark as paid: order is {self.status.value}")
         self.status = OrderStatus.PAID
         self.updated_at = datetime.now()
+
+    def mark_as_canceled(self) -> None:
+        if self.status != OrderStatus.CREATED:
+            raise ValueError(f"Cannot cancel: order is {self.status.value}")
+        self.status = OrderStatus.CANCELED
+        self.updated_at = datetime.now()
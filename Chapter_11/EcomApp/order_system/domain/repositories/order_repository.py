@@ -1,6 +1,6 @@
 # order_system/domain/repositories/order_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from uuid import UUID
 
 from ..entities.order import Order
@@ -12,12 +12,24 @@ class OrderRepository(ABC):
         """Save an order to the repository"""
         pass
 
+    def save_many(self, orders: Iterable[Order]) -> None:
+        """Save several orders; repositories that can should do so in one transaction"""
+        for order in orders:
+            self.save(order)
+
     @abstractmethod
     def get_by_id(self, order_id: UUID) -> Optional[Order]:
         """Retrieve an order by its ID"""
         pass
 
     @abstractmethod
-    def get_by_customer(self, customer_id: UUID) -> List[Order]:
-        """Retrieve all orders for a customer"""
+    def get_by_customer(
+        self, customer_id: UUID, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Order]:
+        """Retrieve a customer's orders, newest first, optionally one page at a time"""
+        pass
+
+    @abstractmethod
+    def iter_by_customer(self, customer_id: UUID, batch_size: int = 500) -> Iterator[Order]:
+        """Stream all of a customer's orders, newest first, loading them in batches"""
         pass
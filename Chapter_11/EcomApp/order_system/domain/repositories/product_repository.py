@@ -1,6 +1,6 @@
 # order_system/domain/repositories/product_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from ..entities.product import Product
@@ -12,6 +12,11 @@ class ProductRepository(ABC):
         """Retrieve a product by its ID"""
         pass
 
+    @abstractmethod
+    def get_many(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        """Retrieve several products by ID; IDs not found are left out"""
+        pass
+
     @abstractmethod
     def save(self, product: Product) -> None:
         """Save a product to the repository"""
@@ -26,3 +31,18 @@ class ProductRepository(ABC):
     def update(self, product: Product) -> None:
         """Update a product"""
         pass
+
+    @abstractmethod
+    def reserve_stock(self, product_id: UUID, quantity: int) -> bool:
+        """Decrease a product's stock if enough is available; False if not"""
+        pass
+
+    @abstractmethod
+    def reserve_stock_many(self, quantities: Dict[UUID, int]) -> bool:
+        """Decrease several products' stock, or none of it and return False if any lacks enough"""
+        pass
+
+    @abstractmethod
+    def release_stock_many(self, quantities: Dict[UUID, int]) -> None:
+        """Give back stock taken by reserve_stock_many"""
+        pass
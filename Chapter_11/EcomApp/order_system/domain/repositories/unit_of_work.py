@@ -0,0 +1,19 @@
+# order_system/domain/repositories/unit_of_work.py
+from abc import ABC, abstractmethod
+from typing import ContextManager
+
+from .order_repository import OrderRepository
+from .product_repository import ProductRepository
+
+
+class UnitOfWork(ABC):
+    orders: OrderRepository
+    products: ProductRepository
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+        """
+        Run a block atomically: changes made through the repositories commit
+        together when the block completes, and none do if it raises
+        """
+        pass
@@ -0,0 +1,81 @@
+# order_system/infrastructure/container.py
+"""
+Composition root: builds the clean architecture components once per process.
+"""
+from dataclasses import dataclass
+
+from ..application.use_cases.create_order import CreateOrderUseCase
+from ..domain.repositories.product_repository import ProductRepository
+from ..interfaces.controllers.order_controller import OrderController
+from .database import SQLiteConnectionProvider
+from .queries.recent_orders import RecentOrdersQuery
+from .repositories.caching_product_repository import CachingProductRepository
+from .repositories.sqlite_order_repository import SQLiteOrderRepository
+from .repositories.sqlite_product_repository import SQLiteProductRepository
+from .repositories.sqlite_unit_of_work import SQLiteUnitOfWork
+from .schema import migrate
+from .services.dummy_payment_service import DummyPaymentService
+from .services.sqlite_idempotency_store import SQLiteIdempotencyStore
+
+
+@dataclass
+class Container:
+    connections: SQLiteConnectionProvider
+    order_repository: SQLiteOrderRepository
+    product_repository: ProductRepository
+    create_order_use_case: CreateOrderUseCase
+    order_controller: OrderController
+    recent_orders_query: RecentOrdersQuery
+    idempotency_store: SQLiteIdempotencyStore
+    schema_version: int
+
+    def close(self) -> None:
+        self.connections.close()
+
+
+def create_container(
+    db_path: str,
+    pool_size: int = 8,
+    synchronous: str = "NORMAL",
+    catalog_cache_seconds: float = 5.0,
+) -> Container:
+    """
+    Wire the repositories, use cases and controllers around one connection pool.
+
+    Brings the schema up to date first, so the components built here (and any
+    request using them) can assume the tables and seed data exist.
+    """
+    # Pooled connections shared by the clean architecture repositories
+    connections = SQLiteConnectionProvider(db_path, pool_size=pool_size, synchronous=synchronous)
+    schema_version = migrate(connections)
+
+    # Create repositories
+    order_repository = SQLiteOrderRepository(connections)
+    product_repository = SQLiteProductRepository(connections)
+    if catalog_cache_seconds > 0:
+        product_repository = CachingProductRepository(
+            product_repository, max_staleness=catalog_cache_seconds
+        )
+    unit_of_work = SQLiteUnitOfWork(connections, order_repository, product_repository)
+
+    # Create use case
+    create_order_use_case = CreateOrderUseCase(
+        unit_of_work=unit_of_work,
+        payment_service=DummyPaymentService(),
+    )
+
+    idempotency_store = SQLiteIdempotencyStore(connections)
+    idempotency_store.purge()
+
+    return Container(
+        connections=connections,
+        order_repository=order_repository,
+        product_repository=product_repository,
+        create_order_use_case=create_order_use_case,
+        order_controller=OrderController(
+            create_use_case=create_order_use_case, idempotency_store=idempotency_store
+        ),
+        recent_orders_query=RecentOrdersQuery(connections),
+        idempotency_store=idempotency_store,
+        schema_version=schema_version,
+    )
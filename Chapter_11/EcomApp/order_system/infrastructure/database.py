@@ -0,0 +1,174 @@
+# order_system/infrastructure/database.py
+"""
+Shared SQLite connections for the repositories.
+
+Opening a connection costs a file open, schema parsing and pragma setup, and
+a new connection starts with an empty statement cache. The provider keeps a
+bounded pool of configured connections and lends one to each thread for the
+duration of a unit of work instead.
+"""
+import queue
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class ConnectionPoolTimeout(Exception):
+    pass
+
+
+class SQLiteConnectionProvider:
+    """
+    Bounded pool of SQLite connections.
+
+    connection() lends a connection to the calling thread; nested calls on the
+    same thread get the same connection back, so a repository method called
+    inside another's transaction() joins that transaction.
+
+    Connections use WAL journaling, which lets readers proceed while a write is
+    in progress. With WAL, synchronous=NORMAL is still corruption-safe: a power
+    loss can only roll back the most recent commits.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = 8,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cached_statements: int = 256,
+        timeout: float = 5.0,
+        busy_retries: int = 5,
+        busy_backoff: float = 0.05,
+    ):
+        if journal_mode.upper() not in JOURNAL_MODES:
+            raise ValueError(f"Invalid journal mode: {journal_mode}")
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.journal_mode = journal_mode.upper()
+        self.synchronous = synchronous.upper()
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self.busy_retries = busy_retries
+        self.busy_backoff = busy_backoff
+
+        # LIFO, so the most recently used (warmest) connection is lent first
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            # Transactions are started explicitly by transaction()
+            isolation_level=None,
+            cached_statements=self.cached_statements,
+            # Each connection is used by one thread at a time, but may be
+            # returned to the pool and lent to another
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.pool_size:
+                conn = self._open()
+                self._opened.append(conn)
+                return conn
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise ConnectionPoolTimeout(
+                f"No database connection available within {self.timeout}s "
+                f"(pool size {self.pool_size})"
+            )
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Lend a connection to the calling thread until the block exits."""
+        held = getattr(self._local, "connection", None)
+        if held is not None:
+            yield held
+            return
+
+        conn = self._acquire()
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            self._local.connection = None
+            if conn.in_transaction:
+                conn.rollback()
+            self._release(conn)
+
+    def _begin(self, conn: sqlite3.Connection) -> None:
+        """
+        Start a write transaction, retrying with backoff while the database is busy.
+
+        BEGIN IMMEDIATE takes the write lock up front. A deferred transaction
+        that reads first and writes later can deadlock with another writer,
+        and SQLite then fails one of them at once instead of waiting.
+        """
+        for attempt in range(self.busy_retries + 1):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if attempt == self.busy_retries or not _is_busy(e):
+                    raise
+            # Exponential backoff with jitter, so waiting writers do not retry in step
+            time.sleep(self.busy_backoff * 2**attempt * random.uniform(0.5, 1.5))
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run the block in a write transaction, committing if it completes.
+
+        Reentrant: a transaction() inside another on the same thread joins the
+        outer one, and everything commits or rolls back together.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+
+            self._begin(conn)
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self) -> None:
+        """Close every pooled connection; connections lent out are closed too."""
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for conn in opened:
+            conn.close()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+
+def _is_busy(error: sqlite3.OperationalError) -> bool:
+    return "locked" in str(error) or "busy" in str(error)
@@ -0,0 +1,9 @@
+-- Demo catalog, only added to an empty products table
+INSERT INTO products (id, name, price, stock)
+SELECT * FROM (
+    SELECT 'eeb9e5e6-7585-4809-abb5-548f46ca93ea', 'Laptop', 999.99, 10
+    UNION ALL SELECT '1c9e3f9a-9cf8-4df0-8426-7bd241592cef', 'Smartphone', 499.99, 20
+    UNION ALL SELECT 'd8cf7035-7cb1-4dd5-8a9b-3d9a618dbf10', 'Headphones', 99.99, 30
+    UNION ALL SELECT 'f6c843d5-907b-462c-8513-82e19638a735', 'Tablet', 349.99, 15
+)
+WHERE NOT EXISTS (SELECT 1 FROM products);
@@ -0,0 +1,8 @@
+-- Order history: customer's orders, newest first
+CREATE INDEX IF NOT EXISTS idx_orders_customer_created ON orders (customer_id, created_at);
+
+-- Recent orders listing sorts every order by creation time
+CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders (created_at);
+
+-- Loading an order's items, and joining items to orders
+CREATE INDEX IF NOT EXISTS idx_order_items_order_id ON order_items (order_id);
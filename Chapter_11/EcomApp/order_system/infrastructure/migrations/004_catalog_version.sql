@@ -0,0 +1,24 @@
+-- Bumped on every change to the catalog, so caches in any process can tell
+-- when to reload. Stock changes are not catalog changes and do not bump it.
+CREATE TABLE IF NOT EXISTS catalog_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS products_catalog_insert AFTER INSERT ON products
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS products_catalog_update AFTER UPDATE OF id, name, price ON products
+WHEN OLD.id IS NOT NEW.id OR OLD.name IS NOT NEW.name OR OLD.price IS NOT NEW.price
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS products_catalog_delete AFTER DELETE ON products
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
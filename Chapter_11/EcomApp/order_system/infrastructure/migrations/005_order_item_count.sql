@@ -0,0 +1,6 @@
+-- Line items per order, kept on the order so listings need no join or GROUP BY
+ALTER TABLE orders ADD COLUMN item_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE orders SET item_count = (
+    SELECT COUNT(*) FROM order_items WHERE order_items.order_id = orders.id
+);
@@ -0,0 +1,9 @@
+-- Responses to requests sent with an Idempotency-Key header. A row without
+-- a response is a claim: the first request with that key is still running.
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    response TEXT,
+    claimed_at REAL NOT NULL,
+    completed_at REAL
+);
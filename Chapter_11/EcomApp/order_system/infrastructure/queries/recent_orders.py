@@ -0,0 +1,27 @@
+# order_system/infrastructure/queries/recent_orders.py
+from typing import Any, Dict, List
+
+from ..database import SQLiteConnectionProvider
+
+
+class RecentOrdersQuery:
+    """
+    Read side for order listings: summary rows straight from the orders table,
+    without loading Order entities. Served by the index on orders (created_at).
+    """
+
+    def __init__(self, connections: SQLiteConnectionProvider):
+        self.connections = connections
+
+    def execute(self, limit: int = 10) -> List[Dict[str, Any]]:
+        with self.connections.connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT id, customer_id, status, created_at, total_price, item_count
+                FROM orders
+                ORDER BY created_at DESC
+                LIMIT ?
+            """,
+                (limit,),
+            )
+            return [dict(row) for row in cursor]
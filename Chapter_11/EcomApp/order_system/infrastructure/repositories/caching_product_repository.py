@@ -0,0 +1,97 @@
+# order_system/infrastructure/repositories/caching_product_repository.py
+import threading
+import time
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from ...domain.entities.product import Product
+from ...domain.repositories.product_repository import ProductRepository
+from .sqlite_product_repository import SQLiteProductRepository
+
+
+class CachingProductRepository(ProductRepository):
+    """
+    Keeps the product catalog (names and prices) in memory.
+
+    Stock changes with every order, so it is never cached: each read fetches
+    the current stock of the products it returns. The catalog is reloaded
+    after a save or update through this repository, and when the database's
+    catalog version has moved on, which is checked at most every
+    `max_staleness` seconds. Changes made by other processes therefore show
+    up within that bound.
+    """
+
+    def __init__(
+        self,
+        inner: SQLiteProductRepository,
+        max_staleness: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.inner = inner
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._catalog: Optional[Dict[UUID, Product]] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._catalog = None
+
+    def _load_catalog(self, force: bool = False) -> Dict[UUID, Product]:
+        with self._lock:
+            now = self._clock()
+            if self._catalog is not None and not force:
+                if now - self._checked_at < self.max_staleness:
+                    return self._catalog
+
+            version = self.inner.catalog_version()
+            if self._catalog is None or force or version != self._version:
+                # Read the version first: a change landing in between leaves
+                # the newer catalog under the older version, and the next
+                # check reloads it again rather than missing the change
+                self._catalog = {product.id: product for product in self.inner.get_all()}
+                self._version = version
+            self._checked_at = now
+            return self._catalog
+
+    def _with_stock(self, product_ids: Optional[Iterable[UUID]] = None) -> Dict[UUID, Product]:
+        stock = self.inner.get_stock(product_ids)
+        catalog = self._load_catalog()
+        if any(product_id not in catalog for product_id in stock):
+            # Added since the catalog was loaded
+            catalog = self._load_catalog(force=True)
+        # Copies, so callers can change them without touching the cache
+        return {
+            product_id: replace(catalog[product_id], stock=quantity)
+            for product_id, quantity in stock.items()
+            if product_id in catalog
+        }
+
+    def get_by_id(self, product_id: UUID) -> Optional[Product]:
+        return self._with_stock([product_id]).get(product_id)
+
+    def get_many(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        return self._with_stock(product_ids)
+
+    def get_all(self) -> List[Product]:
+        return list(self._with_stock().values())
+
+    def save(self, product: Product) -> None:
+        self.inner.save(product)
+        self.invalidate()
+
+    def update(self, product: Product) -> None:
+        self.inner.update(product)
+        self.invalidate()
+
+    def reserve_stock(self, product_id: UUID, quantity: int) -> bool:
+        return self.inner.reserve_stock(product_id, quantity)
+
+    def reserve_stock_many(self, quantities: Dict[UUID, int]) -> bool:
+        return self.inner.reserve_stock_many(quantities)
+
+    def release_stock_many(self, quantities: Dict[UUID, int]) -> None:
+        self.inner.release_stock_many(quantities)
@@ -1,10 +1,22 @@
 # order_system/infrastructure/repositories/sqlite_order_repository.py
-import sqlite3
-from typing import List, Optional
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
 from uuid import UUID
 
 from ...domain.entities.order import Order, OrderItem, OrderStatus
 from ...domain.repositories.order_repository import OrderRepository
+from ..database import SQLiteConnectionProvider
+
+
+# Orders per IN (...) query, well under SQLite's limit on bound parameters
+ITEM_BATCH_SIZE = 500
+
+# Customer and product ids repeat across orders. Converting them between
+# UUID and text is the largest cost of loading and of saving orders in bulk.
+_cached_uuid = lru_cache(maxsize=4096)(UUID)
+_product_str = lru_cache(maxsize=4096)(str)
 
 
 class RepositoryError(Exception):
@@ -12,149 +24,177 @@ class RepositoryError(Exception):
 
 
 class SQLiteOrderRepository(OrderRepository):
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-        self._ensure_tables()
-
-    def _ensure_tables(self) -> None:
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS orders (
-                    id TEXT PRIMARY KEY,
-                    customer_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT,
-                    total_price REAL NOT NULL
+    def __init__(self, connections: SQLiteConnectionProvider):
+        self.connections = connections
+
+    def _existing_ids(self, conn, order_ids: Sequence[str]) -> Set[str]:
+        existing = set()
+        for start in range(0, len(order_ids), ITEM_BATCH_SIZE):
+            batch = order_ids[start : start + ITEM_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = conn.execute(f"SELECT id FROM orders WHERE id IN ({placeholders})", batch)
+            existing.update(row["id"] for row in cursor)
+        return existing
+
+    def _write(self, conn, orders: Sequence[Order]) -> None:
+        order_rows, item_rows = [], []
+        for order in orders:
+            order_id = str(order.id)
+            order_rows.append(
+                (
+                    order_id,
+                    str(order.customer_id),
+                    order.status.value,
+                    order.created_at.isoformat(),
+                    order.updated_at.isoformat() if order.updated_at else None,
+                    order.total_price,
+                    len(order.items),
                 )
-            """
             )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS order_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    order_id TEXT NOT NULL,
-                    product_id TEXT NOT NULL,
-                    quantity INTEGER NOT NULL,
-                    price REAL NOT NULL,
-                    FOREIGN KEY (order_id) REFERENCES orders (id)
-                )
-            """
+            item_rows += [
+                (order_id, _product_str(item.product_id), item.quantity, item.price)
+                for item in order.items
+            ]
+
+        # Only orders saved before have items to replace
+        existing = self._existing_ids(conn, [row[0] for row in order_rows])
+        if existing:
+            conn.executemany(
+                "DELETE FROM order_items WHERE order_id = ?", [(order_id,) for order_id in existing]
             )
-            conn.commit()
-        finally:
-            conn.close()
 
-    def _order_exists(self, conn, order_id: UUID) -> bool:
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM orders WHERE id = ?", (str(order_id),))
-        return cursor.fetchone() is not None
+        # Insert new orders and update existing ones in one statement batch;
+        # customer_id and created_at never change once an order exists
+        conn.executemany(
+            """
+            INSERT INTO orders (id, customer_id, status, created_at, updated_at, total_price, item_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                status = excluded.status,
+                updated_at = excluded.updated_at,
+                total_price = excluded.total_price,
+                item_count = excluded.item_count
+        """,
+            order_rows,
+        )
+        conn.executemany(
+            "INSERT INTO order_items (order_id, product_id, quantity, price) VALUES (?, ?, ?, ?)",
+            item_rows,
+        )
 
     def save(self, order: Order) -> None:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
         try:
-            if self._order_exists(conn, order.id):
-                # Update existing order
-                conn.execute(
-                    "UPDATE orders SET status = ?, updated_at = ?, total_price = ? WHERE id = ?",
-                    (
-                        order.status.value,
-                        order.updated_at.isoformat() if order.updated_at else None,
-                        order.total_price,
-                        str(order.id),
-                    ),
-                )
-
-                # Delete existing items
-                conn.execute("DELETE FROM order_items WHERE order_id = ?", (str(order.id),))
-            else:
-                # Insert new order
-                conn.execute(
-                    "INSERT INTO orders (id, customer_id, status, created_at, updated_at, total_price) VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        str(order.id),
-                        str(order.customer_id),
-                        order.status.value,
-                        order.created_at.isoformat(),
-                        order.updated_at.isoformat() if order.updated_at else None,
-                        order.total_price,
-                    ),
-                )
-
-            # Insert order items
-            for item in order.items:
-                conn.execute(
-                    "INSERT INTO order_items (order_id, product_id, quantity, price) VALUES (?, ?, ?, ?)",
-                    (str(order.id), str(item.product_id), item.quantity, item.price),
-                )
-
-            conn.commit()
+            with self.connections.transaction() as conn:
+                self._write(conn, [order])
         except Exception as e:
-            conn.rollback()
             raise RepositoryError(f"Failed to save order: {str(e)}")
-        finally:
-            conn.close()
-
-    def get_by_id(self, order_id: UUID) -> Optional[Order]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
 
+    def save_many(self, orders: Iterable[Order]) -> None:
+        orders = list(orders)
         try:
-            # Get order
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM orders WHERE id = ?", (str(order_id),))
-            order_data = cursor.fetchone()
-
-            if not order_data:
-                return None
-
-            # Get order items
-            cursor.execute("SELECT * FROM order_items WHERE order_id = ?", (str(order_id),))
-            items_data = cursor.fetchall()
-
-            # Create order
-            order = Order(customer_id=UUID(order_data["customer_id"]), id=UUID(order_data["id"]))
-
-            # Set order status
-            order.status = OrderStatus(order_data["status"])
-
-            # Add items
-            for item_data in items_data:
-                item = OrderItem(
-                    product_id=UUID(item_data["product_id"]),
+            with self.connections.transaction() as conn:
+                self._write(conn, orders)
+        except Exception as e:
+            raise RepositoryError(f"Failed to save orders: {str(e)}")
+
+    def _load_items(self, conn, order_ids: Sequence[str]) -> Dict[str, list]:
+        """Items of several orders, fetched in batches and grouped by order id"""
+        items = defaultdict(list)
+        for start in range(0, len(order_ids), ITEM_BATCH_SIZE):
+            batch = order_ids[start : start + ITEM_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = conn.execute(
+                f"SELECT * FROM order_items WHERE order_id IN ({placeholders}) ORDER BY id",
+                batch,
+            )
+            for item_data in cursor:
+                items[item_data["order_id"]].append(item_data)
+        return items
+
+    def _to_order(self, order_data, items_data) -> Order:
+        updated_at = order_data["updated_at"]
+        return Order(
+            customer_id=_cached_uuid(order_data["customer_id"]),
+            items=[
+                OrderItem(
+                    product_id=_cached_uuid(item_data["product_id"]),
                     quantity=item_data["quantity"],
                     price=item_data["price"],
                 )
-                order.add_item(item)
+                for item_data in items_data
+            ],
+            id=UUID(order_data["id"]),
+            status=OrderStatus(order_data["status"]),
+            created_at=datetime.fromisoformat(order_data["created_at"]),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        )
+
+    def _hydrate(self, conn, orders_data) -> List[Order]:
+        items = self._load_items(conn, [order_data["id"] for order_data in orders_data])
+        return [self._to_order(order_data, items[order_data["id"]]) for order_data in orders_data]
+
+    def get_by_id(self, order_id: UUID) -> Optional[Order]:
+        try:
+            with self.connections.connection() as conn:
+                # Get order
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM orders WHERE id = ?", (str(order_id),))
+                order_data = cursor.fetchone()
+
+                if not order_data:
+                    return None
+
+                # Get order items
+                cursor.execute(
+                    "SELECT * FROM order_items WHERE order_id = ? ORDER BY id", (str(order_id),)
+                )
+                items_data = cursor.fetchall()
 
-            return order
+            return self._to_order(order_data, items_data)
         except Exception as e:
             raise RepositoryError(f"Failed to get order: {str(e)}")
-        finally:
-            conn.close()
-
-    def get_by_customer(self, customer_id: UUID) -> List[Order]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
 
+    def get_by_customer(
+        self, customer_id: UUID, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Order]:
         try:
-            # Get orders for customer
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM orders WHERE customer_id = ?", (str(customer_id),))
-            order_ids = cursor.fetchall()
-
-            orders = []
-            for order_id in order_ids:
-                order = self.get_by_id(UUID(order_id["id"]))
-                if order:
-                    orders.append(order)
-
-            return orders
+            with self.connections.connection() as conn:
+                # One query for the orders and one per ITEM_BATCH_SIZE orders for their items
+                cursor = conn.execute(
+                    "SELECT * FROM orders WHERE customer_id = ? "
+                    "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                    (str(customer_id), -1 if limit is None else limit, offset),
+                )
+                return self._hydrate(conn, cursor.fetchall())
         except Exception as e:
             raise RepositoryError(f"Failed to get orders for customer: {str(e)}")
-        finally:
-            conn.close()
+
+    def iter_by_customer(self, customer_id: UUID, batch_size: int = 500) -> Iterator[Order]:
+        # Keyset pagination: each batch continues after the last order of the
+        # previous one, so later batches cost the same as the first
+        after = None
+        while True:
+            try:
+                with self.connections.connection() as conn:
+                    if after is None:
+                        cursor = conn.execute(
+                            "SELECT * FROM orders WHERE customer_id = ? "
+                            "ORDER BY created_at DESC, id DESC LIMIT ?",
+                            (str(customer_id), batch_size),
+                        )
+                    else:
+                        cursor = conn.execute(
+                            "SELECT * FROM orders WHERE customer_id = ? AND (created_at, id) < (?, ?) "
+                            "ORDER BY created_at DESC, id DESC LIMIT ?",
+                            (str(customer_id), *after, batch_size),
+                        )
+                    orders_data = cursor.fetchall()
+                    orders = self._hydrate(conn, orders_data)
+            except Exception as e:
+                raise RepositoryError(f"Failed to get orders for customer: {str(e)}")
+
+            # The connection goes back to the pool between batches
+            yield from orders
+            if len(orders_data) < batch_size:
+                return
+            after = (orders_data[-1]["created_at"], orders_data[-1]["id"])
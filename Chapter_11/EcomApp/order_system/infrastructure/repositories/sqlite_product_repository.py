@@ -1,110 +1,130 @@
 # order_system/infrastructure/repositories/sqlite_product_repository.py
-import sqlite3
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from ...domain.entities.product import Product
 from ...domain.repositories.product_repository import ProductRepository
+from ..database import SQLiteConnectionProvider
 
+# Products per IN (...) query, well under SQLite's limit on bound parameters
+LOOKUP_BATCH_SIZE = 500
 
-class SQLiteProductRepository(ProductRepository):
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-        self._ensure_tables()
 
-    def _ensure_tables(self) -> None:
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS products (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    price REAL NOT NULL,
-                    stock INTEGER NOT NULL
-                )
-            """
-            )
-            conn.commit()
-
-            # Add some sample products if table is empty
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM products")
-            count = cursor.fetchone()[0]
-
-            if count == 0:
-                sample_products = [
-                    (str(UUID("eeb9e5e6-7585-4809-abb5-548f46ca93ea")), "Laptop", 999.99, 10),
-                    (str(UUID("1c9e3f9a-9cf8-4df0-8426-7bd241592cef")), "Smartphone", 499.99, 20),
-                    (str(UUID("d8cf7035-7cb1-4dd5-8a9b-3d9a618dbf10")), "Headphones", 99.99, 30),
-                    (str(UUID("f6c843d5-907b-462c-8513-82e19638a735")), "Tablet", 349.99, 15),
-                ]
-                conn.executemany(
-                    "INSERT INTO products (id, name, price, stock) VALUES (?, ?, ?, ?)",
-                    sample_products,
-                )
-                conn.commit()
-        finally:
-            conn.close()
+class SQLiteProductRepository(ProductRepository):
+    def __init__(self, connections: SQLiteConnectionProvider):
+        self.connections = connections
 
     def get_by_id(self, product_id: UUID) -> Optional[Product]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        try:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM products WHERE id = ?", (str(product_id),))
             data = cursor.fetchone()
 
-            if not data:
-                return None
-
-            return Product(
-                id=UUID(data["id"]), name=data["name"], price=data["price"], stock=data["stock"]
-            )
-        finally:
-            conn.close()
+        if not data:
+            return None
+
+        return Product(
+            id=UUID(data["id"]), name=data["name"], price=data["price"], stock=data["stock"]
+        )
+
+    def get_many(self, product_ids: Iterable[UUID]) -> Dict[UUID, Product]:
+        ids = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+        products = {}
+        with self.connections.connection() as conn:
+            for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+                batch = ids[start : start + LOOKUP_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(f"SELECT * FROM products WHERE id IN ({placeholders})", batch)
+                for data in cursor:
+                    product = Product(
+                        id=UUID(data["id"]), name=data["name"], price=data["price"], stock=data["stock"]
+                    )
+                    products[product.id] = product
+        return products
 
     def save(self, product: Product) -> None:
-        conn = sqlite3.connect(self.db_path)
-
-        try:
+        with self.connections.transaction() as conn:
             conn.execute(
                 "INSERT INTO products (id, name, price, stock) VALUES (?, ?, ?, ?)",
                 (str(product.id), product.name, product.price, product.stock),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     def update(self, product: Product) -> None:
-        conn = sqlite3.connect(self.db_path)
-
-        try:
+        with self.connections.transaction() as conn:
             conn.execute(
                 "UPDATE products SET name = ?, price = ?, stock = ? WHERE id = ?",
                 (product.name, product.price, product.stock, str(product.id)),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
-    def get_all(self) -> List[Product]:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def reserve_stock(self, product_id: UUID, quantity: int) -> bool:
+        # Check and decrement in one statement, so concurrent orders cannot
+        # both pass the check and oversell
+        with self.connections.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE products SET stock = stock - ? WHERE id = ? AND stock >= ?",
+                (quantity, str(product_id), quantity),
+            )
+            return cursor.rowcount == 1
+
+    def reserve_stock_many(self, quantities: Dict[UUID, int]) -> bool:
+        with self.connections.transaction() as conn:
+            # A savepoint lets a shortfall undo this call's updates on its own,
+            # whether or not it runs inside a caller's transaction
+            conn.execute("SAVEPOINT reserve_stock_many")
+            cursor = conn.executemany(
+                "UPDATE products SET stock = stock - ? WHERE id = ? AND stock >= ?",
+                [
+                    (quantity, str(product_id), quantity)
+                    for product_id, quantity in quantities.items()
+                ],
+            )
+            # rowcount sums over every row; a product without enough stock
+            # matches no row
+            reserved = cursor.rowcount == len(quantities)
+            if not reserved:
+                conn.execute("ROLLBACK TO reserve_stock_many")
+            conn.execute("RELEASE reserve_stock_many")
+            return reserved
+
+    def release_stock_many(self, quantities: Dict[UUID, int]) -> None:
+        with self.connections.transaction() as conn:
+            conn.executemany(
+                "UPDATE products SET stock = stock + ? WHERE id = ?",
+                [(quantity, str(product_id)) for product_id, quantity in quantities.items()],
+            )
+
+    def get_stock(self, product_ids: Optional[Iterable[UUID]] = None) -> Dict[UUID, int]:
+        """Current stock by product ID, of the given products or of all of them"""
+        with self.connections.connection() as conn:
+            if product_ids is None:
+                rows = conn.execute("SELECT id, stock FROM products").fetchall()
+            else:
+                ids = list(dict.fromkeys(str(product_id) for product_id in product_ids))
+                rows = []
+                for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+                    batch = ids[start : start + LOOKUP_BATCH_SIZE]
+                    placeholders = ", ".join("?" * len(batch))
+                    rows += conn.execute(
+                        f"SELECT id, stock FROM products WHERE id IN ({placeholders})", batch
+                    ).fetchall()
+        return {UUID(row["id"]): row["stock"] for row in rows}
+
+    def catalog_version(self) -> int:
+        """Counter bumped by triggers whenever a product is added, removed or repriced"""
+        with self.connections.connection() as conn:
+            return conn.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()[0]
 
-        try:
+    def get_all(self) -> List[Product]:
+        with self.connections.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM products")
             products_data = cursor.fetchall()
 
-            products = []
-            for data in products_data:
-                product = Product(
-                    id=UUID(data["id"]), name=data["name"], price=data["price"], stock=data["stock"]
-                )
-                products.append(product)
+        products = []
+        for data in products_data:
+            product = Product(
+                id=UUID(data["id"]), name=data["name"], price=data["price"], stock=data["stock"]
+            )
+            products.append(product)
 
-            return products
-        finally:
-            conn.close()
+        return products
@@ -0,0 +1,28 @@
+# order_system/infrastructure/repositories/sqlite_unit_of_work.py
+from contextlib import contextmanager
+from typing import Iterator
+
+from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.unit_of_work import UnitOfWork
+from ..database import SQLiteConnectionProvider
+from .sqlite_order_repository import SQLiteOrderRepository
+
+
+class SQLiteUnitOfWork(UnitOfWork):
+    def __init__(
+        self,
+        connections: SQLiteConnectionProvider,
+        orders: SQLiteOrderRepository,
+        products: ProductRepository,
+    ):
+        self.connections = connections
+        self.orders = orders
+        self.products = products
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        # The repositories draw on the same provider (or wrap one that does), so
+        # their calls inside the block run on this thread's connection and join
+        # the transaction
+        with self.connections.transaction():
+            yield
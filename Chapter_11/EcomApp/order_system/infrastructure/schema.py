@@ -0,0 +1,90 @@
+# order_system/infrastructure/schema.py
+"""
+Versioned schema migrations.
+
+Migrations are the NNN_description.sql files in the migrations directory,
+applied in version order. The schema_version table records which have run,
+so each is applied once per database. Run migrate() once at startup.
+"""
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from .database import SQLiteConnectionProvider
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+_MIGRATION_NAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+class MigrationError(Exception):
+    pass
+
+
+def discover_migrations(migrations_dir: Path = MIGRATIONS_DIR) -> List[Tuple[int, str, Path]]:
+    """(version, name, path) of every migration script, in version order"""
+    migrations = {}
+    for path in migrations_dir.glob("*.sql"):
+        match = _MIGRATION_NAME.match(path.name)
+        if not match:
+            raise MigrationError(f"Migration file name must be NNN_name.sql: {path.name}")
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(
+                f"Duplicate migration version {version}: {migrations[version][2].name}, {path.name}"
+            )
+        migrations[version] = (version, match.group(2), path)
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def _statements(script: str) -> Iterator[str]:
+    # executescript() would commit the open transaction, so statements are run
+    # one by one; complete_statement() knows about semicolons inside triggers
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+    leftover = "".join(
+        line for line in statement.splitlines(keepends=True) if not line.strip().startswith("--")
+    )
+    if leftover.strip():
+        raise MigrationError(f"Incomplete SQL statement: {leftover.strip()}")
+
+
+def migrate(connections: SQLiteConnectionProvider, migrations_dir: Path = MIGRATIONS_DIR) -> int:
+    """Apply every pending migration, returning the resulting schema version"""
+    migrations = discover_migrations(migrations_dir)
+
+    # One write transaction: processes starting together apply each migration
+    # once, and a failing migration leaves the schema as it was
+    with connections.transaction() as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+        """
+        )
+        applied = {row[0] for row in conn.execute("SELECT version FROM schema_version")}
+
+        for version, name, path in migrations:
+            if version in applied:
+                continue
+            try:
+                for statement in _statements(path.read_text()):
+                    conn.execute(statement)
+            except sqlite3.Error as e:
+                raise MigrationError(f"Migration {path.name} failed: {str(e)}")
+            conn.execute(
+                "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                (version, name, datetime.now().isoformat()),
+            )
+            applied.add(version)
+
+        return max(applied, default=0)
@@ -0,0 +1,193 @@
+# order_system/infrastructure/services/sqlite_idempotency_store.py
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ...application.services.idempotency_store import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+    IdempotencyStore,
+)
+from ..database import SQLiteConnectionProvider
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency keys in SQLite, with recent responses cached in memory.
+
+    The first request with a key inserts a claim row, so duplicates in any
+    process see that it is running and wait for it. The operation then runs
+    outside any transaction of the store's, so its own transactions stay
+    short (an order's payment call is made between them), and its response
+    is stored once it returns. If it raises, the claim is released; if the
+    process dies before the response is stored, the claim goes stale and a
+    retry runs the operation again.
+
+    Claiming, storing and releasing are single statements in autocommit mode,
+    each holding the write lock only while it runs. Expired responses are
+    purged when a key is claimed, at most once per retention period.
+
+    Args:
+        max_cached: Responses kept in the in-memory LRU
+        wait_timeout: Seconds a duplicate waits for the first request
+        stale_after: Seconds after which an unfinished claim is taken over,
+            e.g. after the process that made it crashed
+        retention: Seconds stored responses are kept before purge() drops them;
+            also how often claiming a key purges them
+    """
+
+    def __init__(
+        self,
+        connections: SQLiteConnectionProvider,
+        max_cached: int = 1024,
+        wait_timeout: float = 30.0,
+        stale_after: float = 120.0,
+        retention: float = 24 * 3600,
+        poll_interval: float = 0.05,
+    ):
+        self.connections = connections
+        self.max_cached = max_cached
+        self.wait_timeout = wait_timeout
+        self.stale_after = stale_after
+        self.retention = retention
+        self.poll_interval = poll_interval
+
+        self._cache: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._purged_at: Optional[float] = None
+
+    def run(
+        self, key: str, fingerprint: str, operation: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            response = self._completed(key, fingerprint)
+            if response is not None:
+                return response
+
+            with self._lock:
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = self._in_flight[key] = threading.Event()
+                    owner = True
+                else:
+                    owner = False
+
+            if owner:
+                try:
+                    if self._claim(key, fingerprint):
+                        return self._execute(key, fingerprint, operation)
+                finally:
+                    with self._lock:
+                        del self._in_flight[key]
+                    in_flight.set()
+
+            # Another request holds the key: in this process we are woken as
+            # soon as it finishes, otherwise the table is polled
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IdempotencyKeyInProgress(
+                    f"A request with idempotency key {key} is still in progress"
+                )
+            if owner:
+                time.sleep(min(self.poll_interval, remaining))
+            else:
+                in_flight.wait(min(self.poll_interval, remaining))
+
+    def _completed(self, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """The stored response for the key, if its first request has finished"""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is None:
+            with self.connections.connection() as conn:
+                row = conn.execute(
+                    "SELECT fingerprint, response FROM idempotency_keys WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            if row["response"] is None:
+                if row["fingerprint"] != fingerprint:
+                    raise IdempotencyKeyReused(f"Idempotency key {key} was used for another request")
+                return None
+            cached = (row["fingerprint"], json.loads(row["response"]))
+            self._remember(key, *cached)
+
+        stored_fingerprint, response = cached
+        if stored_fingerprint != fingerprint:
+            raise IdempotencyKeyReused(f"Idempotency key {key} was used for another request")
+        return response
+
+    def _claim(self, key: str, fingerprint: str) -> bool:
+        self._purge_if_due()
+        now = time.time()
+        # One statement, so no explicit transaction: it inserts the claim, or
+        # takes over one left unfinished for too long (e.g. by a crash)
+        with self.connections.connection() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO idempotency_keys (key, fingerprint, claimed_at) VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    claimed_at = excluded.claimed_at
+                WHERE idempotency_keys.response IS NULL AND idempotency_keys.claimed_at < ?
+            """,
+                (key, fingerprint, now, now - self.stale_after),
+            )
+            return cursor.rowcount == 1
+
+    def _execute(
+        self, key: str, fingerprint: str, operation: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        try:
+            response = operation()
+        except BaseException:
+            # The operation undid its own work, so a retry may run it again
+            with self.connections.connection() as conn:
+                conn.execute(
+                    "DELETE FROM idempotency_keys WHERE key = ? AND response IS NULL", (key,)
+                )
+            raise
+
+        with self.connections.connection() as conn:
+            conn.execute(
+                "UPDATE idempotency_keys SET response = ?, completed_at = ? WHERE key = ?",
+                (json.dumps(response), time.time(), key),
+            )
+        self._remember(key, fingerprint, response)
+        return response
+
+    def _remember(self, key: str, fingerprint: str, response: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[key] = (fingerprint, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+    def _purge_if_due(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._purged_at is not None and now - self._purged_at < self.retention:
+                return
+            # Set before purging, so concurrent claims do not purge as well
+            self._purged_at = now
+        self.purge()
+
+    def purge(self) -> int:
+        """Drop responses older than the retention period, returning how many"""
+        with self._lock:
+            self._purged_at = time.monotonic()
+        with self.connections.connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM idempotency_keys WHERE completed_at < ?",
+                (time.time() - self.retention,),
+            )
+            purged = cursor.rowcount
+        if purged:
+            with self._lock:
+                self._cache.clear()
+        return purged
@@ -1,16 +1,34 @@
 # order_system/interfaces/controllers/order_controller.py
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
+from ...application.services.idempotency_store import IdempotencyStore
 from ...application.use_cases.create_order import CreateOrderRequest, CreateOrderUseCase
 
 
 @dataclass
 class OrderController:
     create_use_case: CreateOrderUseCase
+    idempotency_store: Optional[IdempotencyStore] = None
 
-    def handle_create_order(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_create_order(
+        self, request_data: Dict[str, Any], idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if idempotency_key is None or self.idempotency_store is None:
+            return self._create_order(request_data)
+
+        # A retry must carry the same body; reusing a key for another order is an error
+        fingerprint = hashlib.sha256(
+            json.dumps(request_data, sort_keys=True).encode()
+        ).hexdigest()
+        return self.idempotency_store.run(
+            idempotency_key, fingerprint, lambda: self._create_order(request_data)
+        )
+
+    def _create_order(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         try:
             # Transform web request to domain request format
             customer_id = UUID(request_data["customer_id"])
@@ -10,11 +10,11 @@ from uuid import UUID, uuid4
 from ..config import Config
 
 # Clean Architecture imports
-from ..application.use_cases.create_order import CreateOrderRequest, CreateOrderUseCase
-from ..infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
-from ..infrastructure.repositories.sqlite_product_repository import SQLiteProductRepository
-from ..infrastructure.services.dummy_payment_service import DummyPaymentService
-from ..interfaces.controllers.order_controller import OrderController
+from ..application.services.idempotency_store import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+)
+from ..infrastructure.container import create_container
 
 
 def create_app():
@@ -37,29 +37,17 @@ def create_app():
         conn.row_factory = sqlite3.Row
         return conn
 
-    def get_order_controller():
-        """Factory to create clean architecture components"""
-        db_path = app.config["DB_PATH"]
-
-        # Create repositories
-        order_repository = SQLiteOrderRepository(db_path)
-        product_repository = SQLiteProductRepository(db_path)
-
-        # Create payment service
-        payment_service = DummyPaymentService()
-
-        # Create use case
-        create_use_case = CreateOrderUseCase(
-            order_repository=order_repository,
-            product_repository=product_repository,
-            payment_service=payment_service,
-        )
-
-        # Create controller
-        return OrderController(create_use_case=create_use_case)
+    # Clean architecture components, built once and shared by every request.
+    # This also brings the schema up to date, before any request touches it.
+    container = create_container(
+        app.config["DB_PATH"],
+        pool_size=app.config["DB_POOL_SIZE"],
+        synchronous=app.config["DB_SYNCHRONOUS"],
+        catalog_cache_seconds=app.config["CATALOG_CACHE_SECONDS"],
+    )
+    print(f"🗂️ Schema version: {container.schema_version}")
 
-    # Initialize controller for clean architecture path
-    order_controller = get_order_controller()
+    order_controller = container.order_controller
 
     class ValidationError(Exception):
         pass
@@ -67,9 +55,7 @@ def create_app():
     @app.route("/")
     def index():
         """Home page showing current feature flag status and order form"""
-        db_path = app.config["DB_PATH"]
-        product_repository = SQLiteProductRepository(db_path)
-        products = product_repository.get_all()
+        products = container.product_repository.get_all()
 
         # Get recent orders for display
         orders = get_recent_orders()
@@ -103,9 +89,12 @@ def create_app():
         try:
             # Feature flag to control which implementation handles the request
             if app.config.get("USE_CLEAN_ARCHITECTURE", False):
-                # Use the clean implementation
-                result = order_controller.handle_create_order(data)
-                result["implementation"] = "Clean Architecture"
+                # Use the clean implementation; retries carrying the same
+                # Idempotency-Key get the first response instead of a new order
+                result = order_controller.handle_create_order(
+                    data, idempotency_key=request.headers.get("Idempotency-Key")
+                )
+                result = {**result, "implementation": "Clean Architecture"}
                 return jsonify(result), 201
             else:
                 # Original legacy implementation remains here
@@ -117,40 +106,16 @@ def create_app():
                 return result
         except ValidationError as e:
             return jsonify({"error": str(e)}), 400
+        except IdempotencyKeyReused as e:
+            return jsonify({"error": str(e)}), 422
+        except IdempotencyKeyInProgress as e:
+            return jsonify({"error": str(e)}), 409
         except Exception as e:
             return jsonify({"error": "Internal server error"}), 500
 
     def get_recent_orders():
         """Get the 10 most recent orders for display"""
-        conn = get_db_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT o.id, o.customer_id, o.status, o.created_at, o.total_price,
-                       COUNT(oi.id) as item_count
-                FROM orders o 
-                LEFT JOIN order_items oi ON o.id = oi.order_id
-                GROUP BY o.id, o.customer_id, o.status, o.created_at, o.total_price
-                ORDER BY o.created_at DESC 
-                LIMIT 10
-            """
-            )
-            orders = []
-            for row in cursor.fetchall():
-                orders.append(
-                    {
-                        "id": row["id"],
-                        "customer_id": row["customer_id"],
-                        "status": row["status"],
-                        "created_at": row["created_at"],
-                        "total_price": row["total_price"],
-                        "item_count": row["item_count"],
-                    }
-                )
-            return orders
-        finally:
-            conn.close()
+        return container.recent_orders_query.execute(limit=10)
 
     def create_order_legacy(data):
         """
@@ -185,8 +150,8 @@ def create_app():
             # Order creation directly in route handler
             order_id = str(uuid4())
             conn.execute(
-                "INSERT INTO orders (id, customer_id, status, created_at, total_price) VALUES (?, ?, ?, datetime(), ?)",
-                (order_id, data["customer_id"], "PAID", total_price),
+                "INSERT INTO orders (id, customer_id, status, created_at, total_price, item_count) VALUES (?, ?, ?, datetime(), ?, ?)",
+                (order_id, data["customer_id"], "PAID", total_price, len(data["items"])),
             )
 
             # Order items creation and inventory update
@@ -0,0 +1,151 @@
+import threading
+from uuid import uuid4
+
+import pytest
+
+from order_system.application.use_cases.create_order import CreateOrderRequest, CreateOrderUseCase
+from order_system.domain.entities.order import Order, OrderStatus
+from order_system.domain.entities.product import Product
+from order_system.domain.services.payment_service import PaymentResult, PaymentService
+from order_system.infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+from order_system.infrastructure.repositories.sqlite_product_repository import (
+    SQLiteProductRepository,
+)
+from order_system.infrastructure.repositories.sqlite_unit_of_work import SQLiteUnitOfWork
+from order_system.infrastructure.schema import migrate
+from order_system.infrastructure.services.dummy_payment_service import DummyPaymentService
+
+
+class DecliningPaymentService(PaymentService):
+    def process_payment(self, order: Order) -> PaymentResult:
+        return PaymentResult(success=False, error_message="Card declined")
+
+
+class BlockingPaymentService(PaymentService):
+    """Holds each payment until released, like a slow payment gateway"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def process_payment(self, order: Order) -> PaymentResult:
+        self.started.set()
+        self.release.wait(timeout=10)
+        return PaymentResult(success=True)
+
+
+@pytest.fixture
+def unit_of_work(connections):
+    migrate(connections)
+    return SQLiteUnitOfWork(
+        connections, SQLiteOrderRepository(connections), SQLiteProductRepository(connections)
+    )
+
+
+@pytest.fixture
+def product(unit_of_work):
+    product = Product(name="Limited edition", price=25.0, stock=3)
+    unit_of_work.products.save(product)
+    return product
+
+
+def _order_count(unit_of_work) -> int:
+    with unit_of_work.connections.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+
+
+def _statuses(unit_of_work) -> list:
+    with unit_of_work.connections.connection() as conn:
+        return [row[0] for row in conn.execute("SELECT status FROM orders")]
+
+
+def test_concurrent_orders_never_oversell(unit_of_work, product):
+    """Test that more concurrent orders than stock leave exactly the stock's worth placed."""
+    # Arrange
+    use_case = CreateOrderUseCase(unit_of_work, DummyPaymentService())
+    request = CreateOrderRequest(
+        customer_id=uuid4(), items=[{"product_id": str(product.id), "quantity": 1}]
+    )
+    start = threading.Barrier(10)
+    placed, rejected = [], []
+
+    def place_order():
+        start.wait()
+        try:
+            placed.append(use_case.execute(request))
+        except ValueError as e:
+            rejected.append(e)
+
+    workers = [threading.Thread(target=place_order) for _ in range(10)]
+
+    # Act
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # Assert
+    assert len(placed) == 3
+    assert len(rejected) == 7
+    assert unit_of_work.products.get_by_id(product.id).stock == 0
+    assert _order_count(unit_of_work) == 3
+
+
+def test_failed_payment_releases_the_reservation(unit_of_work, product):
+    """Test that a declined payment gives the stock back and keeps the order as canceled."""
+    # Arrange
+    use_case = CreateOrderUseCase(unit_of_work, DecliningPaymentService())
+    request = CreateOrderRequest(
+        customer_id=uuid4(), items=[{"product_id": str(product.id), "quantity": 2}]
+    )
+
+    # Act
+    with pytest.raises(ValueError, match="Payment failed"):
+        use_case.execute(request)
+
+    # Assert
+    assert unit_of_work.products.get_by_id(product.id).stock == 3
+    assert _statuses(unit_of_work) == [OrderStatus.CANCELED.value]
+
+
+def test_slow_payment_does_not_block_other_orders(unit_of_work, product):
+    """Test that an order completes while another one is waiting on its payment."""
+    # Arrange
+    slow_payments = BlockingPaymentService()
+    slow = CreateOrderUseCase(unit_of_work, slow_payments)
+    fast = CreateOrderUseCase(unit_of_work, DummyPaymentService())
+    request = CreateOrderRequest(
+        customer_id=uuid4(), items=[{"product_id": str(product.id), "quantity": 1}]
+    )
+    waiting = threading.Thread(target=slow.execute, args=(request,))
+    waiting.start()
+    assert slow_payments.started.wait(timeout=5)
+
+    # Act
+    try:
+        placed = fast.execute(request)
+        statuses_during_payment = sorted(_statuses(unit_of_work))
+    finally:
+        slow_payments.release.set()
+        waiting.join()
+
+    # Assert
+    assert placed.status == OrderStatus.PAID
+    assert statuses_during_payment == [OrderStatus.CREATED.value, OrderStatus.PAID.value]
+    assert _statuses(unit_of_work) == [OrderStatus.PAID.value] * 2
+    assert unit_of_work.products.get_by_id(product.id).stock == 1
+
+
+def test_lines_for_the_same_product_draw_on_the_same_stock(unit_of_work, product):
+    """Test that two lines which each fit the stock are rejected when together they do not."""
+    # Arrange
+    use_case = CreateOrderUseCase(unit_of_work, DummyPaymentService())
+    line = {"product_id": str(product.id), "quantity": 2}
+    request = CreateOrderRequest(customer_id=uuid4(), items=[line, line])
+
+    # Act
+    with pytest.raises(ValueError, match="Insufficient stock"):
+        use_case.execute(request)
+
+    # Assert
+    assert unit_of_work.products.get_by_id(product.id).stock == 3
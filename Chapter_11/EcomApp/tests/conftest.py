@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+# Get the root directory of the project (where the order_system package is)
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+sys.path.insert(0, root_dir)
+
+# Now order_system can be imported as a package
+from order_system.infrastructure.database import SQLiteConnectionProvider  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a fresh SQLite database file."""
+    return str(tmp_path / "orders.db")
+
+
+@pytest.fixture
+def connections(db_path):
+    """Connection pool on a fresh database, closed after the test."""
+    provider = SQLiteConnectionProvider(db_path, pool_size=4)
+    yield provider
+    provider.close()
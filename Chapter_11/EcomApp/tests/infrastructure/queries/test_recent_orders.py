@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from order_system.domain.entities.order import Order, OrderItem, OrderStatus
+from order_system.infrastructure.queries.recent_orders import RecentOrdersQuery
+from order_system.infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+from order_system.infrastructure.schema import migrate
+
+
+def test_recent_orders_list_item_counts_newest_first(connections):
+    """Test that summaries come from the orders table, newest first, with their item counts."""
+    # Arrange
+    migrate(connections)
+    repository = SQLiteOrderRepository(connections)
+    start = datetime(2024, 1, 1)
+    orders = []
+    for n in range(4):
+        order = Order(customer_id=uuid4(), status=OrderStatus.PAID, created_at=start + timedelta(n))
+        order.items = [OrderItem(product_id=uuid4(), quantity=1, price=2.5) for _ in range(n)]
+        repository.save(order)
+        orders.append(order)
+
+    # Act
+    recent = RecentOrdersQuery(connections).execute(limit=3)
+
+    # Assert
+    assert [row["id"] for row in recent] == [str(order.id) for order in orders[:0:-1]]
+    assert [row["item_count"] for row in recent] == [3, 2, 1]
+    assert recent[0] == {
+        "id": str(orders[3].id),
+        "customer_id": str(orders[3].customer_id),
+        "status": "PAID",
+        "created_at": orders[3].created_at.isoformat(),
+        "total_price": 7.5,
+        "item_count": 3,
+    }
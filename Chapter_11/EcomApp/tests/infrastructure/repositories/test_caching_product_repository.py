@@ -0,0 +1,90 @@
+from dataclasses import replace
+
+import pytest
+
+from order_system.infrastructure.database import SQLiteConnectionProvider
+from order_system.infrastructure.repositories.caching_product_repository import (
+    CachingProductRepository,
+)
+from order_system.infrastructure.repositories.sqlite_product_repository import (
+    SQLiteProductRepository,
+)
+from order_system.infrastructure.schema import migrate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def repository(connections, clock):
+    migrate(connections)
+    return CachingProductRepository(
+        SQLiteProductRepository(connections), max_staleness=5.0, clock=clock
+    )
+
+
+@pytest.fixture
+def other_process(db_path):
+    """A repository on its own pool, standing in for another process."""
+    connections = SQLiteConnectionProvider(db_path, pool_size=1)
+    yield SQLiteProductRepository(connections)
+    connections.close()
+
+
+def test_catalog_changes_elsewhere_show_up_within_the_staleness_bound(
+    repository, other_process, clock
+):
+    """Test that a reprice is picked up through the catalog version once the bound passes."""
+    # Arrange
+    product = repository.get_all()[0]
+    version = other_process.catalog_version()
+
+    # Act
+    other_process.update(replace(product, price=product.price + 100))
+    clock.now = 4.0
+    within_bound = repository.get_by_id(product.id)
+    clock.now = 6.0
+    after_bound = repository.get_by_id(product.id)
+
+    # Assert
+    assert other_process.catalog_version() == version + 1
+    assert within_bound.price == product.price
+    assert after_bound.price == product.price + 100
+
+
+def test_stock_is_never_served_from_the_cache(repository, other_process):
+    """Test that stock is read fresh and stock changes do not bump the catalog version."""
+    # Arrange
+    product = repository.get_all()[0]
+    version = other_process.catalog_version()
+
+    # Act
+    assert other_process.reserve_stock(product.id, 2)
+    loaded = repository.get_many([product.id])[product.id]
+    loaded.stock = 0
+
+    # Assert
+    assert repository.get_by_id(product.id).stock == product.stock - 2
+    assert other_process.catalog_version() == version
+
+
+def test_update_through_the_cache_reloads_the_catalog(repository):
+    """Test that a reprice made through the repository is visible without waiting."""
+    # Arrange
+    product = repository.get_all()[0]
+
+    # Act
+    repository.update(replace(product, name="Renamed", price=1.0))
+
+    # Assert
+    assert repository.get_by_id(product.id) == replace(product, name="Renamed", price=1.0)
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from order_system.domain.entities.order import Order, OrderItem, OrderStatus
+from order_system.infrastructure.repositories import sqlite_order_repository
+from order_system.infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+from order_system.infrastructure.schema import migrate
+
+
+@pytest.fixture
+def repository(connections):
+    migrate(connections)
+    return SQLiteOrderRepository(connections)
+
+
+def _order(customer_id, created_at, quantities=(1,)) -> Order:
+    order = Order(customer_id=customer_id, status=OrderStatus.PAID, created_at=created_at)
+    for quantity in quantities:
+        order.items.append(OrderItem(product_id=uuid4(), quantity=quantity, price=10.0))
+    return order
+
+
+@pytest.fixture
+def history(repository):
+    """Five orders of one customer, oldest first, and one of another customer."""
+    customer_id = uuid4()
+    start = datetime(2024, 1, 1)
+    orders = [_order(customer_id, start + timedelta(days=n), range(1, n + 2)) for n in range(5)]
+    for order in orders:
+        repository.save(order)
+    repository.save(_order(uuid4(), start))
+    return customer_id, orders
+
+
+def test_get_by_customer_loads_items_in_batches(repository, history, monkeypatch):
+    """Test that orders come newest first with their items when items span several batches."""
+    # Arrange
+    monkeypatch.setattr(sqlite_order_repository, "ITEM_BATCH_SIZE", 2)
+    customer_id, orders = history
+
+    # Act
+    loaded = repository.get_by_customer(customer_id)
+
+    # Assert
+    assert [order.id for order in loaded] == [order.id for order in reversed(orders)]
+    assert [len(order.items) for order in loaded] == [5, 4, 3, 2, 1]
+    assert loaded[-1].created_at == orders[0].created_at
+    assert loaded[-1].items == orders[0].items
+
+
+def test_get_by_customer_pages_and_iter_by_customer_streams(repository, history):
+    """Test limit/offset paging and keyset iteration over the same ordering."""
+    # Arrange
+    customer_id, orders = history
+    newest_first = [order.id for order in reversed(orders)]
+
+    # Act
+    page = repository.get_by_customer(customer_id, limit=2, offset=2)
+    streamed = repository.iter_by_customer(customer_id, batch_size=2)
+
+    # Assert
+    assert [order.id for order in page] == newest_first[2:4]
+    assert [order.id for order in streamed] == newest_first
+
+
+def test_saving_again_replaces_items_and_keeps_identity(repository):
+    """Test that a re-save upserts the order row and replaces its items."""
+    # Arrange
+    order = _order(uuid4(), datetime(2024, 1, 1), quantities=(1, 2, 3))
+    repository.save(order)
+
+    # Act
+    order.items = [OrderItem(product_id=uuid4(), quantity=9, price=1.5)]
+    order.status = OrderStatus.SHIPPED
+    order.updated_at = datetime(2024, 1, 2)
+    repository.save(order)
+
+    # Assert
+    assert repository.get_by_id(order.id) == order
+    with repository.connections.connection() as conn:
+        rows = conn.execute("SELECT item_count FROM orders").fetchall()
+        items = conn.execute("SELECT COUNT(*) FROM order_items").fetchone()[0]
+    assert [row["item_count"] for row in rows] == [1]
+    assert items == 1
+
+
+def test_save_many_writes_new_and_existing_orders_in_one_transaction(repository):
+    """Test a mixed batch, and that a failing order rolls back the whole batch."""
+    # Arrange
+    customer_id = uuid4()
+    existing = _order(customer_id, datetime(2024, 1, 1), quantities=(1, 1))
+    repository.save(existing)
+    existing.items = existing.items[:1]
+    new = [_order(customer_id, datetime(2024, 1, 2 + n)) for n in range(3)]
+    broken = _order(customer_id, datetime(2024, 2, 1))
+    broken.items[0].quantity = None
+
+    # Act
+    repository.save_many([existing, *new])
+    with pytest.raises(sqlite_order_repository.RepositoryError):
+        repository.save_many([_order(customer_id, datetime(2024, 3, 1)), broken])
+
+    # Assert
+    saved = repository.get_by_customer(customer_id)
+    assert [order.id for order in saved] == [order.id for order in reversed([existing, *new])]
+    assert [len(order.items) for order in saved] == [1, 1, 1, 1]
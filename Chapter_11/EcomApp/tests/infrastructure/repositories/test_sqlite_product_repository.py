@@ -0,0 +1,77 @@
+from uuid import uuid4
+
+import pytest
+
+from order_system.domain.entities.product import Product
+from order_system.infrastructure.repositories import sqlite_product_repository
+from order_system.infrastructure.repositories.sqlite_product_repository import (
+    SQLiteProductRepository,
+)
+from order_system.infrastructure.schema import migrate
+
+
+class Rollback(Exception):
+    pass
+
+
+@pytest.fixture
+def repository(connections):
+    migrate(connections)
+    return SQLiteProductRepository(connections)
+
+
+@pytest.fixture
+def products(repository):
+    products = [Product(name=f"Product {n}", price=1.0 + n, stock=5) for n in range(5)]
+    for product in products:
+        repository.save(product)
+    return products
+
+
+def test_get_many_returns_known_products_once(repository, products, monkeypatch):
+    """Test lookups across several IN (...) batches, with duplicate and unknown ids."""
+    # Arrange
+    monkeypatch.setattr(sqlite_product_repository, "LOOKUP_BATCH_SIZE", 2)
+    ids = [product.id for product in products]
+
+    # Act
+    found = repository.get_many([*ids, ids[0], uuid4()])
+
+    # Assert
+    assert found == {product.id: product for product in products}
+
+
+def test_reserve_stock_many_is_all_or_nothing_on_its_own(repository, products):
+    """Test that one short product leaves every stock unchanged without a caller's transaction."""
+    # Arrange
+    first, second = products[0], products[1]
+
+    # Act
+    short = repository.reserve_stock_many({first.id: 2, second.id: 6})
+
+    # Assert
+    assert short is False
+    assert repository.get_stock([first.id, second.id]) == {first.id: 5, second.id: 5}
+
+
+def test_reserve_stock_many_is_all_or_nothing_within_a_transaction(repository, products):
+    """Test that a shortfall inside a caller's transaction undoes only this reservation."""
+    # Arrange
+    first, second, third = products[0], products[1], products[2]
+
+    # Act
+    with repository.connections.transaction():
+        repository.reserve_stock_many({third.id: 1})
+        short = repository.reserve_stock_many({first.id: 2, second.id: 6})
+        stock_after_shortfall = repository.get_stock([first.id, second.id, third.id])
+    with pytest.raises(Rollback):
+        with repository.connections.transaction():
+            repository.reserve_stock_many({first.id: 1})
+            raise Rollback()
+    reserved = repository.reserve_stock_many({first.id: 2, second.id: 5})
+
+    # Assert
+    assert short is False
+    assert stock_after_shortfall == {first.id: 5, second.id: 5, third.id: 4}
+    assert reserved is True
+    assert repository.get_stock([first.id, second.id]) == {first.id: 3, second.id: 0}
@@ -0,0 +1,185 @@
+import threading
+import time
+
+import pytest
+
+from order_system.application.services.idempotency_store import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+)
+from order_system.infrastructure.schema import migrate
+from order_system.infrastructure.services.sqlite_idempotency_store import SQLiteIdempotencyStore
+
+
+class Operation:
+    """Counts its calls; optionally blocks until released."""
+
+    def __init__(self, response=None, blocking=False):
+        self.response = response or {"order_id": "order-1"}
+        self.calls = 0
+        self.started = threading.Event()
+        self.released = threading.Event()
+        if not blocking:
+            self.released.set()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.released.wait(5)
+        return self.response
+
+
+@pytest.fixture
+def store(connections):
+    migrate(connections)
+    return SQLiteIdempotencyStore(connections, wait_timeout=5.0, poll_interval=0.01)
+
+
+def _claim(connections, key, fingerprint, claimed_at):
+    """A claim row as left by a request that is still running, or that crashed."""
+    with connections.transaction() as conn:
+        conn.execute(
+            "INSERT INTO idempotency_keys (key, fingerprint, claimed_at) VALUES (?, ?, ?)",
+            (key, fingerprint, claimed_at),
+        )
+
+
+def test_replay_returns_the_stored_response_without_running_again(store, connections):
+    """Test replays from the in-memory cache and, in a fresh store, from the table."""
+    # Arrange
+    operation = Operation()
+    in_transaction = []
+
+    def first_request():
+        # The operation keeps its transactions short; the store opens none around it
+        with connections.connection() as conn:
+            in_transaction.append(conn.in_transaction)
+        return operation()
+
+    store.run("key-1", "body-a", first_request)
+
+    # Act
+    cached = store.run("key-1", "body-a", operation)
+    from_table = SQLiteIdempotencyStore(connections).run("key-1", "body-a", operation)
+
+    # Assert
+    assert in_transaction == [False]
+    assert cached == from_table == operation.response
+    assert operation.calls == 1
+
+
+@pytest.mark.parametrize("same_process", [True, False])
+def test_concurrent_duplicate_waits_for_the_first_request(store, connections, same_process):
+    """Test that a duplicate arriving mid-flight waits and gets the first response."""
+    # Arrange
+    operation = Operation(blocking=True)
+    if same_process:
+        duplicate_store = store
+    else:
+        # Another process only sees the claim row, and polls it
+        duplicate_store = SQLiteIdempotencyStore(connections, poll_interval=0.01)
+    results = {}
+    first = threading.Thread(target=lambda: results.update(first=store.run("key-1", "a", operation)))
+    duplicate = threading.Thread(
+        target=lambda: results.update(duplicate=duplicate_store.run("key-1", "a", operation))
+    )
+
+    # Act
+    first.start()
+    assert operation.started.wait(5)
+    duplicate.start()
+    time.sleep(0.1)
+    waiting = duplicate.is_alive()
+    operation.released.set()
+    first.join()
+    duplicate.join()
+
+    # Assert
+    assert waiting
+    assert results == {"first": operation.response, "duplicate": operation.response}
+    assert operation.calls == 1
+
+
+def test_key_reused_for_another_body_is_rejected(store, connections):
+    """Test the fingerprint check against a finished and a running request."""
+    # Arrange
+    store.run("finished", "body-a", Operation())
+    _claim(connections, "running", "body-a", time.time())
+
+    # Act / Assert
+    with pytest.raises(IdempotencyKeyReused):
+        store.run("finished", "body-b", Operation())
+    with pytest.raises(IdempotencyKeyReused):
+        store.run("running", "body-b", Operation())
+
+
+def test_claim_is_released_when_the_operation_raises(store):
+    """Test that a failed request stores nothing, so a retry runs the operation again."""
+    # Arrange
+    def fail():
+        raise ValueError("Payment failed")
+
+    retry = Operation()
+
+    # Act
+    with pytest.raises(ValueError):
+        store.run("key-1", "body-a", fail)
+    response = store.run("key-1", "body-a", retry)
+
+    # Assert
+    assert response == retry.response
+    assert retry.calls == 1
+
+
+def test_stale_claim_is_taken_over_and_a_fresh_one_is_waited_for(connections):
+    """Test takeover of a claim left by a crashed request, and timing out on a live one."""
+    # Arrange
+    migrate(connections)
+    store = SQLiteIdempotencyStore(
+        connections, wait_timeout=0.2, stale_after=60.0, poll_interval=0.01
+    )
+    _claim(connections, "crashed", "body-a", time.time() - 120)
+    _claim(connections, "running", "body-a", time.time())
+    operation = Operation()
+
+    # Act
+    taken_over = store.run("crashed", "body-a", operation)
+    with pytest.raises(IdempotencyKeyInProgress):
+        store.run("running", "body-a", operation)
+
+    # Assert
+    assert taken_over == operation.response
+    assert operation.calls == 1
+
+
+def _complete(connections, key, completed_at):
+    """A stored response that finished at the given time."""
+    with connections.transaction() as conn:
+        conn.execute(
+            "INSERT INTO idempotency_keys VALUES (?, 'body-a', '{}', ?, ?)",
+            (key, completed_at, completed_at),
+        )
+
+
+def _keys(connections):
+    with connections.connection() as conn:
+        return {row["key"] for row in conn.execute("SELECT key FROM idempotency_keys")}
+
+
+def test_expired_responses_are_purged_when_claiming_at_most_once_per_retention(connections):
+    """Test that claiming a key purges expired keys, then not again until the period passes."""
+    # Arrange
+    migrate(connections)
+    store = SQLiteIdempotencyStore(connections, retention=60.0)
+    _complete(connections, "expired", time.time() - 120)
+    _complete(connections, "recent", time.time())
+
+    # Act
+    store.run("first", "body-a", Operation())
+    purged_by_first_claim = _keys(connections)
+    _complete(connections, "expired-later", time.time() - 120)
+    store.run("second", "body-a", Operation())
+
+    # Assert
+    assert purged_by_first_claim == {"recent", "first"}
+    assert _keys(connections) == {"recent", "first", "expired-later", "second"}
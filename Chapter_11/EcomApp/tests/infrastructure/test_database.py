@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from order_system.infrastructure.database import ConnectionPoolTimeout, SQLiteConnectionProvider
+
+
+def _create_table(connections: SQLiteConnectionProvider) -> None:
+    with connections.transaction() as conn:
+        conn.execute("CREATE TABLE items (name TEXT NOT NULL)")
+
+
+def _count(connections: SQLiteConnectionProvider) -> int:
+    with connections.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+def test_connections_are_reused_and_nested_calls_share_one(connections):
+    """Test that a released connection is lent again and nested calls get the held one."""
+    # Act
+    with connections.connection() as first:
+        with connections.connection() as nested:
+            pass
+    with connections.connection() as second:
+        pass
+
+    # Assert
+    assert nested is first
+    assert second is first
+    assert connections._opened == [first]
+
+
+def test_nested_transaction_joins_the_outer_one(connections):
+    """Test that an inner transaction() commits or rolls back with the outer one."""
+    # Arrange
+    _create_table(connections)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with connections.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('outer')")
+            with connections.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES ('inner')")
+            raise RuntimeError("fails after the inner block completed")
+
+    # Assert
+    assert _count(connections) == 0
+
+
+def test_pool_is_bounded(db_path):
+    """Test that a thread waiting for a connection times out once every one is lent."""
+    # Arrange
+    connections = SQLiteConnectionProvider(db_path, pool_size=1, timeout=0.1)
+    errors = []
+
+    def borrow():
+        try:
+            with connections.connection():
+                pass
+        except ConnectionPoolTimeout as e:
+            errors.append(e)
+
+    # Act
+    with connections.connection():
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        worker.join()
+    connections.close()
+
+    # Assert
+    assert len(errors) == 1
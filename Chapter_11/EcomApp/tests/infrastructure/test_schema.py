@@ -0,0 +1,85 @@
+import shutil
+import sqlite3
+
+import pytest
+
+from order_system.infrastructure.schema import (
+    MIGRATIONS_DIR,
+    MigrationError,
+    discover_migrations,
+    migrate,
+)
+
+LATEST_VERSION = discover_migrations()[-1][0]
+
+# Tables as the repositories' _ensure_tables() created them before migrations existed
+PRE_MIGRATION_SCHEMA = """
+CREATE TABLE products (id TEXT PRIMARY KEY, name TEXT NOT NULL, price REAL NOT NULL, stock INTEGER NOT NULL);
+CREATE TABLE orders (
+    id TEXT PRIMARY KEY, customer_id TEXT NOT NULL, status TEXT NOT NULL,
+    created_at TEXT NOT NULL, updated_at TEXT, total_price REAL NOT NULL
+);
+CREATE TABLE order_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, order_id TEXT NOT NULL, product_id TEXT NOT NULL,
+    quantity INTEGER NOT NULL, price REAL NOT NULL, FOREIGN KEY (order_id) REFERENCES orders (id)
+);
+INSERT INTO products VALUES ('p-1', 'Existing product', 5.0, 7);
+INSERT INTO orders VALUES ('o-1', 'c-1', 'PAID', '2024-01-01T00:00:00', NULL, 15.0);
+INSERT INTO order_items (order_id, product_id, quantity, price) VALUES ('o-1', 'p-1', 1, 5.0);
+INSERT INTO order_items (order_id, product_id, quantity, price) VALUES ('o-1', 'p-1', 2, 5.0);
+"""
+
+
+def _query(connections, sql):
+    with connections.connection() as conn:
+        return [tuple(row) for row in conn.execute(sql)]
+
+
+def test_migrate_builds_a_fresh_database_once(connections):
+    """Test that every migration is applied once and re-running migrate changes nothing."""
+    # Act
+    version = migrate(connections)
+    applied = _query(connections, "SELECT * FROM schema_version ORDER BY version")
+    products = _query(connections, "SELECT * FROM products ORDER BY id")
+    again = migrate(connections)
+
+    # Assert
+    assert version == again == LATEST_VERSION
+    assert [row[0] for row in applied] == [v for v, _, _ in discover_migrations()]
+    assert len(products) == 4
+    assert _query(connections, "SELECT * FROM schema_version ORDER BY version") == applied
+    assert _query(connections, "SELECT * FROM products ORDER BY id") == products
+
+
+def test_migrate_adopts_a_database_created_before_migrations(connections, db_path):
+    """Test that existing tables and data are kept and later columns are backfilled."""
+    # Arrange
+    conn = sqlite3.connect(db_path)
+    conn.executescript(PRE_MIGRATION_SCHEMA)
+    conn.close()
+
+    # Act
+    version = migrate(connections)
+
+    # Assert
+    assert version == LATEST_VERSION
+    assert _query(connections, "SELECT id, stock FROM products") == [("p-1", 7)]
+    assert _query(connections, "SELECT id, item_count FROM orders") == [("o-1", 2)]
+
+
+def test_failing_migration_rolls_back_every_pending_one(connections, tmp_path):
+    """Test that an error in any script leaves the database as it was."""
+    # Arrange
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    shutil.copy(MIGRATIONS_DIR / "001_initial_schema.sql", migrations_dir)
+    (migrations_dir / "002_broken.sql").write_text(
+        "CREATE TABLE audit (id INTEGER PRIMARY KEY);\nINSERT INTO missing_table VALUES (1);\n"
+    )
+
+    # Act
+    with pytest.raises(MigrationError, match="002_broken.sql"):
+        migrate(connections, migrations_dir)
+
+    # Assert
+    assert _query(connections, "SELECT name FROM sqlite_master WHERE type = 'table'") == []
@@ -0,0 +1,82 @@
+from uuid import uuid4
+
+import pytest
+
+from order_system.config import Config
+from order_system.infrastructure.container import create_container
+from order_system.web import app as web_app
+
+LAPTOP_ID = "eeb9e5e6-7585-4809-abb5-548f46ca93ea"
+
+
+@pytest.fixture
+def containers(db_path, monkeypatch):
+    """Every container create_app builds, for the test client below."""
+    monkeypatch.setattr(Config, "DB_PATH", db_path)
+    monkeypatch.setenv("USE_CLEAN_ARCHITECTURE", "true")
+    built = []
+
+    def record(*args, **kwargs):
+        built.append(create_container(*args, **kwargs))
+        return built[-1]
+
+    monkeypatch.setattr(web_app, "create_container", record)
+    yield built
+    for container in built:
+        container.close()
+
+
+@pytest.fixture
+def client(containers):
+    return web_app.create_app().test_client()
+
+
+def _order(quantity=1):
+    return {"customer_id": str(uuid4()), "items": [{"product_id": LAPTOP_ID, "quantity": quantity}]}
+
+
+def test_requests_share_the_components_built_at_startup(client, containers):
+    """Test that one container, and one pooled connection, serve every request."""
+    # Act
+    index = client.get("/")
+    created = client.post("/orders", json=_order())
+    listed = client.get("/orders")
+
+    # Assert
+    assert index.status_code == 200
+    assert created.status_code == 201
+    assert [order["id"] for order in listed.get_json()] == [created.get_json()["order_id"]]
+    assert len(containers) == 1
+    assert len(containers[0].connections._opened) == 1
+
+
+def test_retry_with_idempotency_key_replays_the_first_order(client):
+    """Test that a retried POST gets the first response and places no second order."""
+    # Arrange
+    order = _order()
+    headers = {"Idempotency-Key": "checkout-42"}
+
+    # Act
+    first = client.post("/orders", json=order, headers=headers)
+    retry = client.post("/orders", json=order, headers=headers)
+    listed = client.get("/orders").get_json()
+
+    # Assert
+    assert first.status_code == retry.status_code == 201
+    assert retry.get_json() == first.get_json()
+    assert [row["id"] for row in listed] == [first.get_json()["order_id"]]
+
+
+def test_idempotency_key_reused_for_another_order_is_422(client):
+    """Test that a key sent again with a different body is rejected."""
+    # Arrange
+    headers = {"Idempotency-Key": "checkout-42"}
+    client.post("/orders", json=_order(), headers=headers)
+
+    # Act
+    response = client.post("/orders", json=_order(quantity=2), headers=headers)
+
+    # Assert
+    assert response.status_code == 422
+    assert "checkout-42" in response.get_json()["error"]
+    assert len(client.get("/orders").get_json()) == 1